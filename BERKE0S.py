@@ -9,9 +9,117 @@ License: MIT
 Complete desktop environment with advanced display management and Tiny Core Linux optimizations
 """
 
-import os
 import sys
 import time
+import builtins
+import importlib
+import importlib.util
+
+# Startup import profiling (--startup-profile)
+STARTUP_PROFILE = "--startup-profile" in sys.argv
+STARTUP_TIME = time.perf_counter()
+BOOT_TRACE = "--boot-trace" in sys.argv
+
+class ImportProfiler:
+    """Record how long each module import takes during startup
+    
+    Nested imports are charged to their own record, so "self" times add up
+    to the time spent importing while "total" includes the children.
+    """
+    
+    def __init__(self):
+        self.records = []
+        self.stack = []
+        self.installed = False
+        self.original_import = builtins.__import__
+        
+    def install(self):
+        """Wrap the builtin import so every new module import is timed"""
+        builtins.__import__ = self.timed_import
+        self.installed = True
+        
+    def uninstall(self):
+        """Restore the builtin import"""
+        if builtins.__import__ == self.timed_import:
+            builtins.__import__ = self.original_import
+        self.installed = False
+        
+    def measure(self, name, load, lazy=False):
+        """Run load() and record its total and self time"""
+        self.stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return load()
+        finally:
+            elapsed = time.perf_counter() - start
+            children = self.stack.pop()
+            if self.stack:
+                self.stack[-1] += elapsed
+            self.records.append({
+                "module": name,
+                "total": elapsed,
+                "self": elapsed - children,
+                "lazy": lazy,
+                "nested": bool(self.stack)
+            })
+        
+    def timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        """Time imports of modules that are not loaded yet"""
+        if level or name in sys.modules:
+            return self.original_import(name, globals, locals, fromlist, level)
+        
+        return self.measure(name, lambda: self.original_import(name, globals, locals, fromlist, level))
+    
+    def import_module(self, name):
+        """Import a module for LazyModule, timing it while the profiler is installed"""
+        if not self.installed:
+            return importlib.import_module(name)
+        return self.measure(name, lambda: importlib.import_module(name), lazy=True)
+
+import_profiler = ImportProfiler()
+if STARTUP_PROFILE:
+    import_profiler.install()
+
+class LazyModule:
+    """Module proxy that imports the real module on first attribute access"""
+    
+    def __init__(self, name):
+        self.__dict__["_name"] = name
+        self.__dict__["_module"] = None
+        
+    def _load(self):
+        module = self.__dict__["_module"]
+        if module is None:
+            module = import_profiler.import_module(self._name)
+            self.__dict__["_module"] = module
+        return module
+        
+    def __getattr__(self, attr):
+        module = self._load()
+        try:
+            return getattr(module, attr)
+        except AttributeError:
+            # Submodules such as urllib.request are not imported by their package
+            try:
+                return import_profiler.import_module(f"{self._name}.{attr}")
+            except ImportError:
+                raise AttributeError(f"module '{self._name}' has no attribute '{attr}'")
+    
+    def __setattr__(self, attr, value):
+        setattr(self._load(), attr, value)
+        
+    def __repr__(self):
+        state = "loaded" if self.__dict__["_module"] is not None else "not loaded"
+        return f"<lazy module '{self._name}' ({state})>"
+
+def module_available(name):
+    """Check whether a module can be imported without importing it"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+import os
 import json
 import subprocess
 import threading
@@ -25,30 +133,16 @@ import getpass
 import datetime
 import logging
 import queue
+import collections
 import math
 import uuid
-import base64
-import zipfile
-import tarfile
 import glob
 import stat
-import calendar
-import random
-import string
-import tempfile
-import webbrowser
-import urllib.request
-import urllib.parse
-import http.server
-import socketserver
 import sqlite3
-import configparser
 import platform
-import ctypes
-import mimetypes
-import fcntl
 import struct
-import termios
+import select
+import array
 from io import BytesIO, StringIO
 from urllib.parse import quote, unquote
 import tkinter as tk
@@ -56,33 +150,65 @@ from tkinter import ttk, messagebox, filedialog, simpledialog, colorchooser
 from tkinter import font as tkFont
 from tkinter import scrolledtext
 
-# Try to import optional dependencies
-try:
-    from PIL import Image, ImageTk, ImageGrab, ImageDraw, ImageFont, ImageFilter, ImageEnhance
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
+# Modules only needed by individual apps or rarely used actions
+base64 = LazyModule("base64")
+zipfile = LazyModule("zipfile")
+tarfile = LazyModule("tarfile")
+calendar = LazyModule("calendar")
+random = LazyModule("random")
+string = LazyModule("string")
+tempfile = LazyModule("tempfile")
+webbrowser = LazyModule("webbrowser")
+urllib = LazyModule("urllib")
+http = LazyModule("http")
+socketserver = LazyModule("socketserver")
+configparser = LazyModule("configparser")
+ctypes = LazyModule("ctypes")
+mimetypes = LazyModule("mimetypes")
+fcntl = LazyModule("fcntl")
+termios = LazyModule("termios")
+asyncio = LazyModule("asyncio")
+
+# Optional dependencies, imported on first use
+PIL_AVAILABLE = module_available("PIL")
+if PIL_AVAILABLE:
+    Image = LazyModule("PIL.Image")
+    ImageTk = LazyModule("PIL.ImageTk")
+    ImageGrab = LazyModule("PIL.ImageGrab")
+    ImageDraw = LazyModule("PIL.ImageDraw")
+    ImageFont = LazyModule("PIL.ImageFont")
+    ImageFilter = LazyModule("PIL.ImageFilter")
+    ImageEnhance = LazyModule("PIL.ImageEnhance")
+else:
     print("PIL not available - some features will be limited")
 
-try:
-    import requests
-    REQUESTS_AVAILABLE = True
-except ImportError:
-    REQUESTS_AVAILABLE = False
+def pil_available():
+    """Check that PIL really imports, falling back to the non-PIL paths if not"""
+    global PIL_AVAILABLE
+    if PIL_AVAILABLE and Image.__dict__["_module"] is None:
+        try:
+            Image._load()
+            ImageTk._load()
+        except ImportError as e:
+            PIL_AVAILABLE = False
+            print(f"PIL failed to load ({e}) - some features will be limited")
+    return PIL_AVAILABLE
+
+REQUESTS_AVAILABLE = module_available("requests")
+if REQUESTS_AVAILABLE:
+    requests = LazyModule("requests")
+else:
     print("Requests not available - network features limited")
 
-try:
-    import pygame
-    PYGAME_AVAILABLE = True
-except ImportError:
-    PYGAME_AVAILABLE = False
+PYGAME_AVAILABLE = module_available("pygame")
+if PYGAME_AVAILABLE:
+    pygame = LazyModule("pygame")
+else:
     print("Pygame not available - audio/game features limited")
 
-try:
-    import numpy as np
-    NUMPY_AVAILABLE = True
-except ImportError:
-    NUMPY_AVAILABLE = False
+NUMPY_AVAILABLE = module_available("numpy")
+if NUMPY_AVAILABLE:
+    np = LazyModule("numpy")
 
 # Enhanced Configuration
 CONFIG_DIR = os.path.expanduser("~/.berke0s")
@@ -93,13 +219,16 @@ INSTALL_FLAG = f"{CONFIG_DIR}/.installed"
 THEMES_DIR = f"{CONFIG_DIR}/themes"
 PLUGINS_DIR = f"{CONFIG_DIR}/plugins"
 WALLPAPERS_DIR = f"{CONFIG_DIR}/wallpapers"
+WALLPAPER_CACHE_DIR = f"{CONFIG_DIR}/cache/wallpapers"
 APPS_DIR = f"{CONFIG_DIR}/applications"
 DATABASE_FILE = f"{CONFIG_DIR}/berke0s.db"
 DISPLAY_LOG = f"{CONFIG_DIR}/display.log"
 X_LOG = f"{CONFIG_DIR}/x_server.log"
+ENVIRONMENT_CACHE_FILE = f"{CONFIG_DIR}/environment.json"
+BOOT_TRACE_FILE = f"{CONFIG_DIR}/boot_trace.json"
 
 # Ensure directories exist
-for directory in [CONFIG_DIR, THEMES_DIR, PLUGINS_DIR, WALLPAPERS_DIR, APPS_DIR]:
+for directory in [CONFIG_DIR, THEMES_DIR, PLUGINS_DIR, WALLPAPERS_DIR, WALLPAPER_CACHE_DIR, APPS_DIR]:
     os.makedirs(directory, exist_ok=True)
 
 # Enhanced logging setup with display-specific logging
@@ -120,6 +249,307 @@ display_handler.setFormatter(logging.Formatter('%(asctime)s - DISPLAY - %(leveln
 display_logger.addHandler(display_handler)
 display_logger.setLevel(logging.DEBUG)
 
+# Boot timeline tracing (--boot-trace)
+class BootTracer:
+    """Record nested boot phase spans as Chrome trace events"""
+    
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.events = []
+        self.open_spans = {}
+        self.lock = threading.Lock()
+        self.pid = os.getpid()
+        
+    def timestamp(self, moment=None):
+        """Convert a perf_counter value to microseconds since launch"""
+        return ((moment if moment is not None else time.perf_counter()) - STARTUP_TIME) * 1000000
+    
+    def complete(self, name, start, end=None, category="boot", args=None):
+        """Add a finished span given perf_counter start and end times"""
+        if not self.enabled:
+            return
+        
+        end = end if end is not None else time.perf_counter()
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": self.timestamp(start),
+            "dur": (end - start) * 1000000,
+            "pid": self.pid,
+            "tid": threading.get_ident()
+        }
+        if args:
+            event["args"] = args
+            
+        with self.lock:
+            self.events.append(event)
+    
+    def span(self, name, category="boot", **args):
+        """Context manager timing a boot phase"""
+        return BootSpan(self, name, category, args)
+    
+    def traced(self, name=None, category="boot"):
+        """Decorator timing every call of a function as a span"""
+        def decorator(func):
+            span_name = name or func.__qualname__
+            
+            def wrapper(*a, **kw):
+                if not self.enabled:
+                    return func(*a, **kw)
+                with self.span(span_name, category):
+                    return func(*a, **kw)
+            
+            wrapper.__name__ = func.__name__
+            wrapper.__qualname__ = func.__qualname__
+            wrapper.__doc__ = func.__doc__
+            return wrapper
+        return decorator
+    
+    def begin(self, name):
+        """Open a span that is closed later with end()"""
+        if self.enabled:
+            self.open_spans[name] = time.perf_counter()
+    
+    def end(self, name, **args):
+        """Close a span opened with begin()"""
+        start = self.open_spans.pop(name, None)
+        if start is not None:
+            self.complete(name, start, args=args)
+    
+    def instant(self, name, category="boot", **args):
+        """Mark a single point in time"""
+        if not self.enabled:
+            return
+        
+        with self.lock:
+            self.events.append({
+                "name": name,
+                "cat": category,
+                "ph": "i",
+                "s": "p",
+                "ts": self.timestamp(),
+                "pid": self.pid,
+                "tid": threading.get_ident(),
+                "args": args
+            })
+    
+    def write(self, path=None):
+        """Write collected events as Chrome trace-event JSON"""
+        if not self.enabled:
+            return
+        
+        try:
+            path = path or BOOT_TRACE_FILE
+            with self.lock:
+                events = list(self.events)
+            
+            metadata = [{
+                "name": "process_name", "ph": "M", "pid": self.pid,
+                "args": {"name": "Berke0S"}
+            }]
+            for thread in threading.enumerate():
+                metadata.append({
+                    "name": "thread_name", "ph": "M", "pid": self.pid,
+                    "tid": thread.ident, "args": {"name": thread.name}
+                })
+            
+            temp_file = f"{path}.tmp"
+            with open(temp_file, 'w') as f:
+                json.dump({
+                    "traceEvents": metadata + sorted(events, key=lambda e: e["ts"]),
+                    "displayTimeUnit": "ms",
+                    "otherData": {
+                        "version": DEFAULT_CONFIG["version"],
+                        "hostname": platform.node(),
+                        "kernel": platform.release(),
+                        "machine": platform.machine(),
+                        "cpu_count": os.cpu_count()
+                    }
+                }, f)
+            os.replace(temp_file, path)
+            
+            logger.info(f"Boot trace written to {path} ({len(events)} events)")
+            
+        except Exception as e:
+            logger.error(f"Boot trace write error: {e}")
+
+class BootSpan:
+    """Single timed span used by BootTracer.span()"""
+    
+    def __init__(self, tracer, name, category, args):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+        self.start = None
+        
+    def __enter__(self):
+        if self.tracer.enabled:
+            self.start = time.perf_counter()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        if self.start is not None:
+            if exc_type is not None:
+                self.args["error"] = str(exc)
+            self.tracer.complete(self.name, self.start, category=self.category, args=self.args)
+        return False
+
+boot_tracer = BootTracer(BOOT_TRACE)
+
+# Shared SQLite access layer
+class Database:
+    """Process-wide SQLite access with long-lived per-thread connections
+    
+    Each thread gets one connection in WAL mode with a busy timeout and
+    sqlite3's prepared statement cache, instead of connecting per call.
+    Query timings are collected per statement.
+    """
+    
+    def __init__(self, path, busy_timeout=5.0, cached_statements=256):
+        self.path = path
+        self.busy_timeout = busy_timeout
+        self.cached_statements = cached_statements
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.connections = []
+        self.query_stats = {}
+        self.max_tracked_queries = 200
+    
+    def open(self):
+        """Open a new tuned connection that is not tied to a thread"""
+        conn = sqlite3.connect(
+            self.path,
+            timeout=self.busy_timeout,
+            cached_statements=self.cached_statements,
+            check_same_thread=False
+        )
+        conn.execute(f"PRAGMA busy_timeout = {int(self.busy_timeout * 1000)}")
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        return conn
+    
+    def connect(self):
+        """Return this thread's connection, opening it on first use"""
+        conn = getattr(self.local, 'conn', None)
+        if conn is None:
+            conn = self.open()
+            self.local.conn = conn
+            with self.lock:
+                self.connections.append(conn)
+        return conn
+    
+    def record(self, sql, elapsed):
+        """Add a statement's duration to the query stats"""
+        key = " ".join(sql.split())[:200]
+        with self.lock:
+            stats = self.query_stats.get(key)
+            if stats is None:
+                if len(self.query_stats) >= self.max_tracked_queries:
+                    return
+                stats = self.query_stats[key] = {"count": 0, "total": 0.0, "max": 0.0}
+            stats["count"] += 1
+            stats["total"] += elapsed
+            stats["max"] = max(stats["max"], elapsed)
+    
+    def execute(self, sql, params=(), commit=False):
+        """Run a statement and return its cursor"""
+        conn = self.connect()
+        start = time.perf_counter()
+        try:
+            cursor = conn.execute(sql, params)
+            if commit:
+                conn.commit()
+            return cursor
+        except Exception:
+            if commit:
+                conn.rollback()
+            raise
+        finally:
+            self.record(sql, time.perf_counter() - start)
+    
+    def executemany(self, sql, rows, commit=True):
+        """Run a statement for many parameter rows"""
+        conn = self.connect()
+        start = time.perf_counter()
+        try:
+            cursor = conn.executemany(sql, rows)
+            if commit:
+                conn.commit()
+            return cursor
+        except Exception:
+            if commit:
+                conn.rollback()
+            raise
+        finally:
+            self.record(sql, time.perf_counter() - start)
+    
+    def executescript(self, script):
+        """Run a multi-statement script"""
+        conn = self.connect()
+        start = time.perf_counter()
+        try:
+            conn.executescript(script)
+        finally:
+            self.record(script, time.perf_counter() - start)
+    
+    def query(self, sql, params=()):
+        """Fetch all rows of a query"""
+        return self.execute(sql, params).fetchall()
+    
+    def query_one(self, sql, params=()):
+        """Fetch the first row of a query"""
+        return self.execute(sql, params).fetchone()
+    
+    def commit(self):
+        """Commit this thread's pending transaction"""
+        self.connect().commit()
+    
+    def rollback(self):
+        """Roll back this thread's pending transaction"""
+        try:
+            self.connect().rollback()
+        except Exception as e:
+            logger.warning(f"Database rollback error: {e}")
+    
+    def checkpoint(self):
+        """Copy WAL contents back into the database file"""
+        return self.query_one("PRAGMA wal_checkpoint(TRUNCATE)")
+    
+    def get_stats(self, limit=10):
+        """Return connection count and the slowest statements by total time"""
+        with self.lock:
+            queries = sorted(self.query_stats.items(), key=lambda item: item[1]["total"], reverse=True)[:limit]
+            return {
+                "connections": len(self.connections),
+                "queries": [
+                    {
+                        "sql": sql,
+                        "count": stats["count"],
+                        "total_ms": stats["total"] * 1000,
+                        "avg_ms": stats["total"] * 1000 / stats["count"],
+                        "max_ms": stats["max"] * 1000
+                    }
+                    for sql, stats in queries
+                ]
+            }
+    
+    def close(self):
+        """Close every connection opened through this layer"""
+        with self.lock:
+            connections, self.connections = self.connections, []
+        for conn in connections:
+            try:
+                conn.close()
+            except Exception as e:
+                logger.warning(f"Database close error: {e}")
+        self.local = threading.local()
+
+database = Database(DATABASE_FILE)
+boot_tracer.complete("imports", STARTUP_TIME)
+
 # Enhanced default configuration
 DEFAULT_CONFIG = {
     "version": "3.0-v2",
@@ -142,7 +572,9 @@ DEFAULT_CONFIG = {
         "x_arguments": ["-nolisten", "tcp", "-nocursor"],
         "fallback_resolution": "1024x768",
         "virtual_display": False,
-        "headless_mode": False
+        "headless_mode": False,
+        "parallel_startup": False,
+        "startup_race_timeout": 30
     },
     "desktop": {
         "wallpaper": "",
@@ -154,6 +586,12 @@ DEFAULT_CONFIG = {
         "blur_radius": 5,
         "shadow_offset": 3,
         "animation_speed": 300,
+        "animation_fps": 60,
+        "wallpaper_cache_entries": 5,
+        "wallpaper_cache_max_mb": 64,
+        "ui_dispatch_interval": 50,
+        "ui_dispatch_batch": 20,
+        "ui_dispatch_idle_interval": 250,
         "auto_arrange": False,
         "show_desktop_icons": True,
         "desktop_icons": [],
@@ -168,14 +606,25 @@ DEFAULT_CONFIG = {
         "show_clock": True,
         "show_system_tray": True,
         "show_quick_launch": True,
-        "transparency": 0.9
+        "transparency": 0.9,
+        "battery_update_interval": 60
+    },
+    "start_menu": {
+        "search_debounce": 120,
+        "max_results": 50,
+        "visible_rows": 5
     },
     "notifications": {
         "enabled": True,
         "timeout": 5000,
         "position": "top-right",
         "sound_enabled": True,
-        "show_previews": True
+        "show_previews": True,
+        "max_visible": 4,
+        "pool_size": 4,
+        "max_queued": 50,
+        "history_max_rows": 50000,
+        "history_page_size": 30
     },
     "power": {
         "sleep_timeout": 1800,
@@ -201,7 +650,12 @@ DEFAULT_CONFIG = {
         "proxy_enabled": False,
         "proxy_host": "",
         "proxy_port": 8080,
-        "firewall_enabled": True
+        "firewall_enabled": True,
+        "connectivity_host": "8.8.8.8",
+        "connectivity_port": 53,
+        "connectivity_recheck": 300,
+        "connectivity_retry": 15,
+        "connectivity_retry_max": 30
     },
     "audio": {
         "master_volume": 75,
@@ -216,15 +670,342 @@ DEFAULT_CONFIG = {
         "performance_mode": "balanced",
         "auto_backup": False,
         "backup_interval": 24,
-        "24_hour_format": True
+        "24_hour_format": True,
+        "show_seconds": False
+    },
+    "alerts": {
+        "enabled": True,
+        "rules": [
+            {
+                "id": "cpu_high", "metric": "cpu_percent",
+                "threshold": 90, "clear": 75, "duration": 30, "cooldown": 600,
+                "title": "System Warning", "message": "High CPU usage: {peak:.1f}% peak",
+                "type": "warning", "actions": ["open_monitor", "dismiss"]
+            },
+            {
+                "id": "memory_high", "metric": "memory_percent",
+                "threshold": 85, "clear": 75, "duration": 30, "cooldown": 600,
+                "title": "System Warning", "message": "High memory usage: {peak:.1f}% peak",
+                "type": "warning", "actions": ["free_memory", "open_monitor"]
+            },
+            {
+                "id": "disk_low", "metric": "disk_percent",
+                "threshold": 90, "clear": 88, "duration": 0, "cooldown": 3600,
+                "title": "System Warning", "message": "Low disk space: {peak:.1f}% used",
+                "type": "error", "actions": ["clean_temp", "open_files"]
+            },
+            {
+                "id": "temperature_high", "metric": "temperature", "key": "temperature:{instance}",
+                "threshold": 80, "clear": 70, "duration": 60, "cooldown": 1800,
+                "title": "Temperature Warning", "message": "{instance}: {peak:.1f}°C peak",
+                "type": "warning"
+            }
+        ]
+    },
+    "log_retention": {
+        "enabled": True,
+        "interval": 600,
+        "chunk_rows": 2000,
+        "time_budget_ms": 50,
+        "vacuum_pages": 256,
+        "tables": {
+            "system_logs": {"max_age_days": 30, "max_rows": 200000},
+            "display_logs": {"max_age_days": 14, "max_rows": 100000},
+            "logs": {"max_age_days": 90, "max_rows": 200000}
+        }
     }
 }
 
+# X11 socket helpers used for readiness checks without spawning xdpyinfo
+X11_SOCKET_DIR = "/tmp/.X11-unix"
+
+class XSocketWatcher:
+    """Wait for files to appear in the X11 socket directory (inotify with poll fallback)
+    
+    The directory belongs to root with mode 1777 and is created by the X
+    server or the init scripts, never by us. While it is missing the parent
+    directory is watched until it appears.
+    """
+    
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    
+    def __init__(self, directory=X11_SOCKET_DIR, process=None):
+        self.directory = directory
+        self.process = process
+        self.inotify_fd = None
+        self.pid_fd = None
+        self.libc = None
+        self.watching_parent = False
+        self.poll_interval = 0.05
+        
+        try:
+            self.libc = ctypes.CDLL(None, use_errno=True)
+            fd = self.libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+            if fd >= 0:
+                self.watching_parent = not os.path.isdir(directory)
+                path = os.path.dirname(directory) if self.watching_parent else directory
+                wd = self.libc.inotify_add_watch(fd, path.encode(), self.IN_CREATE | self.IN_MOVED_TO)
+                if wd >= 0:
+                    self.inotify_fd = fd
+                else:
+                    os.close(fd)
+        except Exception as e:
+            display_logger.debug(f"inotify unavailable, polling {directory}: {e}")
+        
+        # Wake up as soon as the watched X process exits
+        if process is not None and hasattr(os, 'pidfd_open'):
+            try:
+                self.pid_fd = os.pidfd_open(process.pid)
+            except OSError:
+                self.pid_fd = None
+    
+    def wait(self, timeout):
+        """Block until a socket appears, the process exits or the timeout elapses"""
+        try:
+            fds = [fd for fd in (self.inotify_fd, self.pid_fd) if fd is not None]
+            
+            if self.inotify_fd is None or (self.process is not None and self.pid_fd is None):
+                # Poll fallback
+                timeout = min(timeout, self.poll_interval)
+            
+            if not fds:
+                time.sleep(max(timeout, 0))
+                return
+            
+            readable, _, _ = select.select(fds, [], [], max(timeout, 0))
+            
+            if self.inotify_fd in readable:
+                try:
+                    os.read(self.inotify_fd, 4096)  # Drain events
+                except BlockingIOError:
+                    pass
+                
+                # The socket directory was created, watch it for the socket itself
+                if self.watching_parent and os.path.isdir(self.directory):
+                    self.libc.inotify_add_watch(self.inotify_fd, self.directory.encode(),
+                                                self.IN_CREATE | self.IN_MOVED_TO)
+                    self.watching_parent = False
+                    
+        except Exception:
+            time.sleep(self.poll_interval)
+    
+    def close(self):
+        """Release inotify and pidfd descriptors"""
+        for fd in (self.inotify_fd, self.pid_fd):
+            if fd is not None:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+        self.inotify_fd = None
+        self.pid_fd = None
+
+class X11Probe:
+    """Minimal X11 client that performs the connection setup handshake over the Unix socket"""
+    
+    SETUP_FAILED = 0
+    SETUP_SUCCESS = 1
+    SETUP_AUTHENTICATE = 2
+    
+    FAMILY_LOCAL = 256
+    FAMILY_WILD = 65535
+    
+    def __init__(self, display):
+        self.display = display
+        self.display_number = display.split(':')[-1].split('.')[0] or "0"
+        self.socket_path = f"{X11_SOCKET_DIR}/X{self.display_number}"
+        self.is_local = display.split(':')[0] in ("", "unix")
+    
+    def socket_exists(self):
+        """Check whether the X server has created its socket"""
+        return self.is_local and os.path.exists(self.socket_path)
+    
+    def get_auth_cookie(self):
+        """Read the MIT-MAGIC-COOKIE-1 for this display from the Xauthority file"""
+        try:
+            auth_file = os.environ.get('XAUTHORITY', os.path.expanduser('~/.Xauthority'))
+            if not os.path.exists(auth_file):
+                return b"", b""
+            
+            with open(auth_file, 'rb') as f:
+                data = f.read()
+            
+            hostname = socket.gethostname().encode()
+            offset = 0
+            
+            def read_field(pos):
+                length = struct.unpack('>H', data[pos:pos + 2])[0]
+                return data[pos + 2:pos + 2 + length], pos + 2 + length
+            
+            while offset + 2 <= len(data):
+                family = struct.unpack('>H', data[offset:offset + 2])[0]
+                address, offset = read_field(offset + 2)
+                number, offset = read_field(offset)
+                name, offset = read_field(offset)
+                cookie, offset = read_field(offset)
+                
+                if number and number.decode(errors='ignore') != self.display_number:
+                    continue
+                if family == self.FAMILY_WILD or (family == self.FAMILY_LOCAL and address == hostname):
+                    return name, cookie
+            
+            return b"", b""
+            
+        except Exception as e:
+            display_logger.debug(f"Xauthority read error: {e}")
+            return b"", b""
+    
+    def connection_setup(self, timeout=1.0):
+        """Send the connection setup request and return (status, reply bytes)"""
+        conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            conn.settimeout(timeout)
+            conn.connect(self.socket_path)
+            
+            auth_name, auth_data = self.get_auth_cookie()
+            
+            def pad(value):
+                return value + b"\0" * (-len(value) % 4)
+            
+            request = struct.pack('<BxHHHH2x', 0x6c, 11, 0, len(auth_name), len(auth_data))
+            conn.sendall(request + pad(auth_name) + pad(auth_data))
+            
+            header = self._recv_exact(conn, 8)
+            extra_length = struct.unpack('<H', header[6:8])[0] * 4
+            reply = header + self._recv_exact(conn, extra_length)
+            
+            return header[0], reply
+            
+        finally:
+            conn.close()
+    
+    def _recv_exact(self, conn, size):
+        """Read exactly size bytes from the socket"""
+        chunks = []
+        while size > 0:
+            chunk = conn.recv(size)
+            if not chunk:
+                raise ConnectionError("X server closed the connection")
+            chunks.append(chunk)
+            size -= len(chunk)
+        return b"".join(chunks)
+    
+    def is_ready(self, timeout=1.0):
+        """Check whether the X server accepts and authorizes a connection"""
+        try:
+            if not self.socket_exists():
+                return False
+            status, _ = self.connection_setup(timeout)
+            return status == self.SETUP_SUCCESS
+        except (OSError, ConnectionError, struct.error):
+            return False
+    
+    def get_display_info(self, timeout=1.0):
+        """Query screen count, root geometry, depth and vendor from the setup reply"""
+        try:
+            if not self.socket_exists():
+                return None
+            
+            status, reply = self.connection_setup(timeout)
+            if status != self.SETUP_SUCCESS:
+                return None
+            
+            return self.parse_setup_reply(reply)
+            
+        except (OSError, ConnectionError, struct.error) as e:
+            display_logger.debug(f"X11 setup query error on {self.display}: {e}")
+            return None
+    
+    def parse_setup_reply(self, reply):
+        """Decode a successful connection setup reply"""
+        protocol_major, protocol_minor = struct.unpack('<HH', reply[2:6])
+        (release, _, _, _, vendor_length, max_request_length,
+         screen_count, format_count) = struct.unpack('<IIIIHHBB', reply[8:30])
+        
+        offset = 40
+        vendor = reply[offset:offset + vendor_length].decode('latin-1', errors='replace')
+        offset += vendor_length + (-vendor_length % 4)
+        offset += format_count * 8
+        
+        screens = []
+        for _ in range(screen_count):
+            (root, _, _, _, _, width, height, width_mm, height_mm,
+             _, _, _, _, _, root_depth, depth_count) = struct.unpack('<IIIIIHHHHHHIBBBB', reply[offset:offset + 40])
+            offset += 40
+            
+            # Skip allowed depths and their visuals
+            for _ in range(depth_count):
+                visual_count = struct.unpack('<H', reply[offset + 2:offset + 4])[0]
+                offset += 8 + visual_count * 24
+            
+            screens.append({
+                "root": root,
+                "width": width,
+                "height": height,
+                "width_mm": width_mm,
+                "height_mm": height_mm,
+                "depth": root_depth
+            })
+        
+        info = {
+            "display": self.display,
+            "mode": "x11",
+            "screens": screen_count,
+            "vendor": vendor,
+            "vendor_release": release,
+            "protocol_version": f"{protocol_major}.{protocol_minor}",
+            "max_request_length": max_request_length
+        }
+        
+        if screens:
+            # Report the default screen like xdpyinfo does
+            screen_index = int(self.display.split('.')[1]) if '.' in self.display.split(':')[-1] else 0
+            screen = screens[min(screen_index, len(screens) - 1)]
+            info.update({
+                "width": screen["width"],
+                "height": screen["height"],
+                "width_mm": screen["width_mm"],
+                "height_mm": screen["height_mm"],
+                "depth": screen["depth"]
+            })
+        
+        return info
+
 # Enhanced Display Management System
 class DisplayManager:
     """Advanced display management for Tiny Core Linux"""
     
-    def __init__(self):
+    # Environment snapshot shared by every DisplayManager instance
+    _environment_snapshot = None
+    _environment_lock = threading.Lock()
+    
+    # Files whose modification time invalidates the cached environment probe
+    environment_watch_paths = [
+        "/proc/modules",
+        "/usr/bin",
+        "/usr/local/bin",
+        "/usr/lib/xorg",
+        "/usr/lib/X11",
+        "/usr/X11R6/lib",
+        "/etc/os-release",
+        "/etc/tc-release",
+        "/opt/tce"
+    ]
+    
+    # Fields that are cheap and may change between runs, never cached on disk
+    volatile_environment_keys = [
+        "desktop_session", "display", "wayland_display",
+        "current_user", "is_root", "tty"
+    ]
+    
+    # Fields read from os.environ on every call, a display restart changes them
+    display_environment_keys = ["desktop_session", "display", "wayland_display"]
+    
+    def __init__(self, display_config=None):
+        self.display_config = display_config or {}
         self.display_info = {}
         self.x_process = None
         self.display_ready = False
@@ -232,7 +1013,123 @@ class DisplayManager:
         self.backup_displays = [":1", ":2", ":10"]
         self.x_server_attempts = 0
         self.max_attempts = 5
+        self.parallel_startup = self.display_config.get("parallel_startup", False)
+        self.race_timeout = self.display_config.get("startup_race_timeout", 30)
         
+    def get_environment(self, refresh=False):
+        """Get environment info, reusing the cached probe when still valid"""
+        with DisplayManager._environment_lock:
+            try:
+                if not refresh and DisplayManager._environment_snapshot is not None:
+                    env_info = dict(DisplayManager._environment_snapshot)
+                    env_info.update(self.detect_display_environment())
+                    return env_info
+                
+                cache_key = self.get_environment_cache_key()
+                env_info = None
+                
+                if not refresh:
+                    env_info = self.load_environment_cache(cache_key)
+                    if env_info is not None:
+                        display_logger.info("Environment loaded from cache")
+                        env_info.update(self.detect_volatile_environment())
+                
+                if env_info is None:
+                    env_info = self.detect_environment()
+                    if "error" not in env_info:
+                        self.save_environment_cache(cache_key, env_info)
+                
+                DisplayManager._environment_snapshot = {
+                    key: value for key, value in env_info.items()
+                    if key not in self.display_environment_keys
+                }
+                return dict(env_info)
+                
+            except Exception as e:
+                display_logger.error(f"Get environment error: {e}")
+                return self.detect_environment()
+    
+    def get_environment_cache_key(self):
+        """Build cache key from boot id, kernel release and watched file mtimes"""
+        try:
+            boot_id = ""
+            try:
+                with open('/proc/sys/kernel/random/boot_id', 'r') as f:
+                    boot_id = f.read().strip()
+            except:
+                pass
+            
+            mtimes = {}
+            for path in self.environment_watch_paths:
+                try:
+                    mtimes[path] = os.stat(path).st_mtime
+                except OSError:
+                    mtimes[path] = None
+            
+            return {
+                "boot_id": boot_id,
+                "kernel": platform.release(),
+                "mtimes": mtimes
+            }
+            
+        except Exception as e:
+            display_logger.error(f"Environment cache key error: {e}")
+            return {}
+    
+    def load_environment_cache(self, cache_key):
+        """Load cached environment if its key matches the current system"""
+        try:
+            if not cache_key or not os.path.exists(ENVIRONMENT_CACHE_FILE):
+                return None
+            
+            with open(ENVIRONMENT_CACHE_FILE, 'r') as f:
+                cache = json.load(f)
+            
+            if cache.get("key") != cache_key:
+                display_logger.info("Environment cache is stale")
+                return None
+            
+            return cache.get("environment")
+            
+        except Exception as e:
+            display_logger.warning(f"Environment cache load error: {e}")
+            return None
+    
+    def save_environment_cache(self, cache_key, env_info):
+        """Persist environment probe results for later boots"""
+        try:
+            if not cache_key:
+                return
+            
+            cached_env = {key: value for key, value in env_info.items()
+                          if key not in self.volatile_environment_keys}
+            
+            tmp_file = f"{ENVIRONMENT_CACHE_FILE}.tmp"
+            with open(tmp_file, 'w') as f:
+                json.dump({"key": cache_key, "environment": cached_env}, f, indent=4)
+            os.replace(tmp_file, ENVIRONMENT_CACHE_FILE)
+            
+        except Exception as e:
+            display_logger.warning(f"Environment cache save error: {e}")
+    
+    def detect_display_environment(self):
+        """Read the display variables from the current process environment"""
+        return {
+            "desktop_session": os.environ.get("DESKTOP_SESSION", ""),
+            "display": os.environ.get("DISPLAY", ""),
+            "wayland_display": os.environ.get("WAYLAND_DISPLAY", "")
+        }
+    
+    def detect_volatile_environment(self):
+        """Detect environment fields that are not cached on disk"""
+        env_info = self.detect_display_environment()
+        env_info.update({
+            "current_user": getpass.getuser(),
+            "is_root": os.getuid() == 0 if hasattr(os, 'getuid') else False,
+            "tty": self.get_current_tty()
+        })
+        return env_info
+    
     def detect_environment(self):
         """Detect current environment and capabilities"""
         try:
@@ -427,13 +1324,14 @@ class DisplayManager:
         except:
             return "unknown"
     
+    @boot_tracer.traced()
     def setup_display_environment(self):
         """Setup comprehensive display environment"""
         try:
             display_logger.info("Starting comprehensive display setup...")
             
             # Detect current environment
-            env_info = self.detect_environment()
+            env_info = self.get_environment()
             
             # Check if we already have a working display
             if self.test_existing_display():
@@ -469,6 +1367,7 @@ class DisplayManager:
             display_logger.error(f"Display setup error: {e}")
             return self.setup_headless_mode()
     
+    @boot_tracer.traced()
     def test_existing_display(self):
         """Test if there's already a working display"""
         try:
@@ -476,6 +1375,17 @@ class DisplayManager:
             if current_display:
                 display_logger.info(f"Testing existing display: {current_display}")
                 
+                # Test with a raw X11 handshake first
+                probe = X11Probe(current_display)
+                if probe.is_ready():
+                    display_logger.info("Existing display is working")
+                    self.current_display = current_display
+                    return True
+                
+                # Socket missing means there is no local server to fall back on
+                if probe.is_local and not probe.socket_exists():
+                    return False
+                
                 # Test with xdpyinfo
                 try:
                     result = subprocess.run(['xdpyinfo'], capture_output=True, timeout=5)
@@ -502,6 +1412,7 @@ class DisplayManager:
             display_logger.error(f"Existing display test error: {e}")
             return False
     
+    @boot_tracer.traced()
     def prepare_display_environment(self):
         """Prepare environment variables and settings"""
         try:
@@ -512,7 +1423,7 @@ class DisplayManager:
             os.environ['XAUTHORITY'] = os.path.expanduser('~/.Xauthority')
             
             # Tiny Core specific environment
-            if self.detect_environment().get("is_tinycore", False):
+            if self.get_environment().get("is_tinycore", False):
                 # Set TC-specific paths
                 x_paths = [
                     '/usr/local/bin',
@@ -561,11 +1472,15 @@ class DisplayManager:
         except Exception as e:
             display_logger.error(f"Environment preparation error: {e}")
     
+    @boot_tracer.traced()
     def setup_tinycore_display(self):
         """Setup display specifically for Tiny Core Linux"""
         try:
             display_logger.info("Setting up display for Tiny Core Linux...")
             
+            if self.parallel_startup:
+                return self.race_x_strategies(self.get_tinycore_race_strategies())
+            
             # TC-specific X server start methods
             tc_methods = [
                 self.start_tc_x_with_startx,
@@ -577,7 +1492,9 @@ class DisplayManager:
             for method in tc_methods:
                 try:
                     display_logger.info(f"Trying method: {method.__name__}")
-                    if method():
+                    with boot_tracer.span(f"strategy:{method.__name__}", "display"):
+                        success = method()
+                    if success:
                         display_logger.info(f"Success with method: {method.__name__}")
                         return True
                     time.sleep(2)  # Wait between attempts
@@ -605,15 +1522,7 @@ class DisplayManager:
             self.cleanup_x_processes()
             
             # Create minimal xinitrc if it doesn't exist
-            xinitrc_path = os.path.expanduser('~/.xinitrc')
-            if not os.path.exists(xinitrc_path):
-                with open(xinitrc_path, 'w') as f:
-                    f.write('#!/bin/sh\n')
-                    f.write('xset -dpms\n')
-                    f.write('xset s off\n')
-                    f.write('exec flwm &\n')
-                    f.write('wait\n')
-                os.chmod(xinitrc_path, 0o755)
+            self.ensure_xinitrc()
             
             # Start X server with startx
             cmd = ['startx', '--', self.current_display, '-nolisten', 'tcp']
@@ -635,6 +1544,18 @@ class DisplayManager:
             display_logger.error(f"startx method error: {e}")
             return False
     
+    def ensure_xinitrc(self):
+        """Create a minimal ~/.xinitrc if it doesn't exist"""
+        xinitrc_path = os.path.expanduser('~/.xinitrc')
+        if not os.path.exists(xinitrc_path):
+            with open(xinitrc_path, 'w') as f:
+                f.write('#!/bin/sh\n')
+                f.write('xset -dpms\n')
+                f.write('xset s off\n')
+                f.write('exec flwm &\n')
+                f.write('wait\n')
+            os.chmod(xinitrc_path, 0o755)
+    
     def start_tc_x_with_xinit(self):
         """Start X using xinit"""
         try:
@@ -792,11 +1713,15 @@ wait
             display_logger.error(f"X+WM start error: {e}")
             return False
     
+    @boot_tracer.traced()
     def setup_generic_display(self):
         """Setup display for generic Linux distributions"""
         try:
             display_logger.info("Setting up display for generic Linux...")
             
+            if self.parallel_startup:
+                return self.race_x_strategies(self.get_generic_race_strategies())
+            
             generic_methods = [
                 self.start_x_with_gdm,
                 self.start_x_with_lightdm,
@@ -806,7 +1731,9 @@ wait
             
             for method in generic_methods:
                 try:
-                    if method():
+                    with boot_tracer.span(f"strategy:{method.__name__}", "display"):
+                        success = method()
+                    if success:
                         return True
                     time.sleep(2)
                 except Exception as e:
@@ -876,11 +1803,15 @@ wait
         except:
             return False
     
+    @boot_tracer.traced()
     def try_fallback_display_methods(self):
         """Try various fallback display methods"""
         try:
             display_logger.info("Trying fallback display methods...")
             
+            if self.parallel_startup:
+                return self.race_x_strategies(self.get_fallback_race_strategies())
+            
             fallback_methods = [
                 self.try_virtual_display,
                 self.try_nested_x,
@@ -891,7 +1822,9 @@ wait
             for method in fallback_methods:
                 try:
                     display_logger.info(f"Trying fallback: {method.__name__}")
-                    if method():
+                    with boot_tracer.span(f"strategy:{method.__name__}", "display"):
+                        success = method()
+                    if success:
                         return True
                 except Exception as e:
                     display_logger.warning(f"Fallback method failed: {e}")
@@ -1030,46 +1963,311 @@ wait
             display_logger.error(f"Different displays error: {e}")
             return False
     
-    def wait_for_x_server(self, timeout=30):
-        """Wait for X server to become ready"""
+    def get_tinycore_race_strategies(self):
+        """Build X startup commands for racing the Tiny Core methods"""
+        strategies = []
+        x_binary = shutil.which('Xorg') or shutil.which('X')
+        
+        if shutil.which('startx'):
+            self.ensure_xinitrc()
+            strategies.append((
+                "start_tc_x_with_startx",
+                lambda display: ['startx', '--', display, '-nolisten', 'tcp'],
+                False
+            ))
+        
+        if shutil.which('xinit') and os.path.exists('/usr/bin/X'):
+            strategies.append((
+                "start_tc_x_with_xinit",
+                lambda display: ['xinit', '--', '/usr/bin/X', display, '-nolisten', 'tcp'],
+                False
+            ))
+        
+        if x_binary:
+            strategies.append((
+                "start_tc_x_direct",
+                lambda display: [
+                    x_binary, display,
+                    '-nolisten', 'tcp',
+                    '-nolisten', 'local',
+                    '-noreset',
+                    '-auth', os.path.expanduser('~/.Xauthority'),
+                    '-sharevts', '-novtswitch', '-quiet'
+                ],
+                True
+            ))
+        
+        available_wm = next((wm for wm in ['flwm', 'jwm', 'openbox', 'icewm', 'twm'] if shutil.which(wm)), None)
+        if shutil.which('xinit') and available_wm:
+            def with_wm_command(display):
+                script_path = f"/tmp/berke0s_startup_{display.lstrip(':')}.sh"
+                with open(script_path, 'w') as f:
+                    f.write(f"#!/bin/sh\nexport DISPLAY={display}\nxset -dpms &\nxset s off &\n{available_wm} &\nwait\n")
+                os.chmod(script_path, 0o755)
+                return ['xinit', script_path, '--', display, '-nolisten', 'tcp']
+            
+            strategies.append(("start_tc_x_with_wm", with_wm_command, False))
+        
+        return strategies
+    
+    def get_generic_race_strategies(self):
+        """Build X startup commands for racing the generic methods"""
+        strategies = []
+        x_binary = shutil.which('Xorg') or shutil.which('X')
+        
+        if shutil.which('startx'):
+            strategies.append((
+                "start_x_standard",
+                lambda display: ['startx', '--', display, '-nolisten', 'tcp'],
+                False
+            ))
+        
+        if x_binary:
+            strategies.append((
+                "start_x_fallback",
+                lambda display: [x_binary, display, '-nolisten', 'tcp'],
+                True
+            ))
+        
+        return strategies
+    
+    def get_fallback_race_strategies(self):
+        """Build X startup commands for racing the fallback methods"""
+        strategies = []
+        x_binary = shutil.which('Xorg') or shutil.which('X')
+        
+        if x_binary:
+            strategies.append((
+                "try_different_displays",
+                lambda display: [x_binary, display, '-nolisten', 'tcp'],
+                True
+            ))
+        
+        if shutil.which('Xnest'):
+            strategies.append((
+                "try_nested_x",
+                lambda display: ['Xnest', display, '-geometry', '1024x768', '-name', 'Berke0S'],
+                False
+            ))
+        
+        if shutil.which('Xvfb'):
+            strategies.append((
+                "try_virtual_display",
+                lambda display: [
+                    'Xvfb', display,
+                    '-screen', '0', '1024x768x24',
+                    '-nolisten', 'tcp',
+                    '-auth', os.path.expanduser('~/.Xauthority')
+                ],
+                True
+            ))
+        
+        return strategies
+    
+    @boot_tracer.traced()
+    def race_x_strategies(self, strategies, timeout=None):
+        """Start X strategies in parallel on separate displays and keep the first ready one"""
+        timeout = timeout or self.race_timeout
+        candidates = []
+        
         try:
-            display_logger.info(f"Waiting for X server on {self.current_display} (timeout: {timeout}s)...")
+            displays = [self.current_display] + [d for d in self.backup_displays if d != self.current_display]
             
-            start_time = time.time()
+            if len(strategies) > len(displays):
+                display_logger.warning(f"Only {len(displays)} displays available, racing first {len(displays)} strategies")
             
-            while time.time() - start_time < timeout:
-                # Test with xdpyinfo
-                try:
-                    result = subprocess.run(
-                        ['xdpyinfo', '-display', self.current_display],
-                        capture_output=True,
-                        timeout=3
-                    )
-                    if result.returncode == 0:
-                        display_logger.info("X server is ready (xdpyinfo test passed)")
-                        return True
-                except:
-                    pass
-                
-                # Test with xset
+            if not strategies:
+                display_logger.warning("No X strategies available to race")
+                return False
+            
+            self.cleanup_x_processes()
+            
+            # Launch every strategy on its own display
+            for (name, build_command, needs_wm), display in zip(strategies, displays):
                 try:
-                    result = subprocess.run(
-                        ['xset', '-display', self.current_display, 'q'],
-                        capture_output=True,
-                        timeout=3
-                    )
-                    if result.returncode == 0:
-                        display_logger.info("X server is ready (xset test passed)")
+                    cmd = build_command(display)
+                    display_logger.info(f"Racing {name} on {display}: {' '.join(cmd)}")
+                    
+                    with open(X_LOG, 'a') as x_log:
+                        process = subprocess.Popen(
+                            cmd,
+                            stdout=x_log,
+                            stderr=x_log,
+                            preexec_fn=os.setsid
+                        )
+                    
+                    candidates.append({
+                        "name": name,
+                        "display": display,
+                        "process": process,
+                        "needs_wm": needs_wm,
+                        "started": time.time(),
+                        "trace_start": time.perf_counter(),
+                        "status": "running",
+                        "latency": None
+                    })
+                except Exception as e:
+                    display_logger.warning(f"Failed to launch {name} on {display}: {e}")
+            
+            # Wait for the first server to accept connections
+            winner = None
+            start_time = time.time()
+            
+            while not winner and time.time() - start_time < timeout:
+                running = [c for c in candidates if c["status"] == "running"]
+                if not running:
+                    break
+                
+                for candidate in running:
+                    if candidate["process"].poll() is not None:
+                        candidate["status"] = "exited"
+                        candidate["latency"] = time.time() - candidate["started"]
+                        display_logger.warning(f"{candidate['name']} on {candidate['display']} exited")
+                    elif self.check_x_display(candidate["display"]):
+                        candidate["status"] = "ready"
+                        candidate["latency"] = time.time() - candidate["started"]
+                        winner = candidate
+                        break
+                
+                if not winner:
+                    time.sleep(0.25)
+            
+            # Stop every strategy that did not win
+            for candidate in candidates:
+                if candidate is winner:
+                    continue
+                if candidate["status"] == "running":
+                    candidate["status"] = "cancelled" if winner else "timeout"
+                    candidate["latency"] = time.time() - candidate["started"]
+                self.terminate_x_process(candidate["process"])
+            
+            self.log_race_results(candidates)
+            
+            for candidate in candidates:
+                boot_tracer.complete(
+                    f"race:{candidate['name']}",
+                    candidate["trace_start"],
+                    candidate["trace_start"] + (candidate["latency"] or 0),
+                    category="display",
+                    args={"display": candidate["display"], "status": candidate["status"]}
+                )
+            
+            if not winner:
+                display_logger.warning("No X strategy won the race")
+                return False
+            
+            display_logger.info(f"{winner['name']} won on {winner['display']} after {winner['latency']:.2f}s")
+            
+            self.current_display = winner["display"]
+            self.x_process = winner["process"]
+            os.environ['DISPLAY'] = winner["display"]
+            
+            if winner["needs_wm"]:
+                self.start_window_manager()
+            
+            return True
+            
+        except Exception as e:
+            display_logger.error(f"X strategy race error: {e}")
+            for candidate in candidates:
+                self.terminate_x_process(candidate["process"])
+            return False
+    
+    def check_x_display(self, display):
+        """Check whether an X server accepts connections on a display"""
+        try:
+            probe = X11Probe(display)
+            if not probe.socket_exists():
+                return False
+            
+            if probe.is_ready():
+                return True
+            
+            # Fall back to xdpyinfo in case our Xauthority lookup missed
+            result = subprocess.run(
+                ['xdpyinfo', '-display', display],
+                capture_output=True,
+                timeout=3
+            )
+            return result.returncode == 0
+        except:
+            return False
+    
+    def terminate_x_process(self, process):
+        """Terminate an X process group, escalating to SIGKILL"""
+        try:
+            if process.poll() is None:
+                os.killpg(os.getpgid(process.pid), signal.SIGTERM)
+                try:
+                    process.wait(timeout=2)
+                except subprocess.TimeoutExpired:
+                    os.killpg(os.getpgid(process.pid), signal.SIGKILL)
+                    process.wait(timeout=2)
+        except Exception as e:
+            display_logger.warning(f"X process termination error: {e}")
+    
+    def log_race_results(self, candidates):
+        """Log per-strategy startup latency to the display_logs table"""
+        try:
+            rows = []
+            for candidate in candidates:
+                latency = candidate["latency"] or 0
+                rows.append((
+                    "startup_race",
+                    candidate["display"],
+                    f"{candidate['name']} {candidate['status']} after {latency:.3f}s",
+                    1 if candidate["status"] == "ready" else 0
+                ))
+            
+            database.executemany(
+                "INSERT INTO display_logs (event_type, display_id, message, success) VALUES (?, ?, ?, ?)",
+                rows
+            )
+            
+        except Exception as e:
+            display_logger.error(f"Race result logging error: {e}")
+    
+    def wait_for_x_server(self, timeout=30):
+        """Wait for X server to become ready"""
+        watcher = None
+        try:
+            display_logger.info(f"Waiting for X server on {self.current_display} (timeout: {timeout}s)...")
+            
+            start_time = time.time()
+            probe = X11Probe(self.current_display)
+            watcher = XSocketWatcher(X11_SOCKET_DIR, self.x_process)
+            last_fallback = 0
+            
+            while time.time() - start_time < timeout:
+                if probe.socket_exists():
+                    # Raw connection setup handshake
+                    if probe.is_ready():
+                        display_logger.info(f"X server is ready (handshake after {time.time() - start_time:.3f}s)")
                         return True
-                except:
-                    pass
+                    
+                    # Fall back to xdpyinfo at most once a second in case our Xauthority lookup missed
+                    if time.time() - last_fallback >= 1:
+                        last_fallback = time.time()
+                        try:
+                            result = subprocess.run(
+                                ['xdpyinfo', '-display', self.current_display],
+                                capture_output=True,
+                                timeout=3
+                            )
+                            if result.returncode == 0:
+                                display_logger.info("X server is ready (xdpyinfo test passed)")
+                                return True
+                        except:
+                            pass
                 
                 # Check if X process is still running
                 if self.x_process and self.x_process.poll() is not None:
                     display_logger.warning("X server process died")
                     return False
                 
-                time.sleep(1)
+                remaining = timeout - (time.time() - start_time)
+                # Socket exists but server is not answering yet: retry quickly
+                watcher.wait(min(remaining, 0.05 if probe.socket_exists() else 1.0))
             
             display_logger.warning(f"X server timeout after {timeout} seconds")
             return False
@@ -1077,6 +2275,9 @@ wait
         except Exception as e:
             display_logger.error(f"Wait for X server error: {e}")
             return False
+        finally:
+            if watcher:
+                watcher.close()
     
     def start_window_manager(self):
         """Start a window manager"""
@@ -1148,6 +2349,7 @@ wait
         except Exception as e:
             display_logger.error(f"X processes cleanup error: {e}")
     
+    @boot_tracer.traced()
     def verify_display_setup(self):
         """Verify that display setup is working correctly"""
         try:
@@ -1179,6 +2381,9 @@ wait
     def test_x_connection(self):
         """Test basic X connection"""
         try:
+            if X11Probe(self.current_display).is_ready():
+                return True
+            
             result = subprocess.run(
                 ['xdpyinfo', '-display', self.current_display],
                 capture_output=True,
@@ -1240,7 +2445,13 @@ wait
         """Get current display information"""
         try:
             if self.display_ready:
-                # Get display info from X server
+                # Get display info straight from the connection setup reply
+                info = X11Probe(self.current_display).get_display_info()
+                if info:
+                    self.display_info = info
+                    return info
+                
+                # Fall back to xdpyinfo
                 try:
                     result = subprocess.run(
                         ['xdpyinfo', '-display', self.current_display],
@@ -1365,92 +2576,532 @@ def setup_display():
         # Even if display setup fails completely, continue
         return True
 
+# Unified database schema shared by every Berke0S component
+SCHEMA_VERSION = 3
+
+SCHEMA_TABLES = {
+    "users": '''
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        username TEXT UNIQUE NOT NULL,
+        fullname TEXT,
+        email TEXT,
+        password_hash TEXT,
+        salt TEXT,
+        is_admin INTEGER DEFAULT 0,
+        is_active INTEGER DEFAULT 1,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        last_login TIMESTAMP,
+        login_count INTEGER DEFAULT 0,
+        failed_login_attempts INTEGER DEFAULT 0,
+        locked_until TIMESTAMP,
+        preferences TEXT,
+        avatar_path TEXT,
+        theme TEXT DEFAULT 'berke_dark',
+        language TEXT DEFAULT 'tr_TR'
+    ''',
+    "sessions": '''
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id INTEGER,
+        session_token TEXT UNIQUE,
+        session_data TEXT,
+        ip_address TEXT,
+        user_agent TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        expires_at TIMESTAMP,
+        is_active INTEGER DEFAULT 1,
+        FOREIGN KEY (user_id) REFERENCES users (id)
+    ''',
+    "applications": '''
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        command TEXT,
+        icon TEXT,
+        icon_path TEXT,
+        executable_path TEXT,
+        category TEXT,
+        description TEXT,
+        version TEXT,
+        author TEXT,
+        website TEXT,
+        installed INTEGER DEFAULT 1,
+        installed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        is_system_app INTEGER DEFAULT 0,
+        is_active INTEGER DEFAULT 1,
+        auto_start INTEGER DEFAULT 0,
+        last_used TIMESTAMP,
+        usage_count INTEGER DEFAULT 0,
+        file_associations TEXT,
+        permissions TEXT
+    ''',
+    "file_metadata": '''
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        file_path TEXT UNIQUE,
+        file_name TEXT,
+        file_type TEXT,
+        mime_type TEXT,
+        size INTEGER,
+        created_at TIMESTAMP,
+        modified_at TIMESTAMP,
+        accessed_at TIMESTAMP,
+        tags TEXT,
+        rating INTEGER DEFAULT 0,
+        description TEXT,
+        thumbnail_path TEXT,
+        checksum TEXT
+    ''',
+    "files": '''
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        filename TEXT NOT NULL,
+        filepath TEXT UNIQUE NOT NULL,
+        file_size INTEGER,
+        file_type TEXT,
+        mime_type TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        modified_at TIMESTAMP,
+        accessed_at TIMESTAMP,
+        owner_id INTEGER,
+        permissions TEXT,
+        is_hidden INTEGER DEFAULT 0,
+        is_system_file INTEGER DEFAULT 0,
+        FOREIGN KEY (owner_id) REFERENCES users (id)
+    ''',
+    "settings": '''
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id INTEGER,
+        category TEXT,
+        key TEXT,
+        value TEXT,
+        data_type TEXT DEFAULT 'string',
+        setting_key TEXT,
+        setting_value TEXT,
+        setting_type TEXT DEFAULT 'string',
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (user_id) REFERENCES users (id)
+    ''',
+    "system_logs": '''
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        level TEXT,
+        message TEXT,
+        component TEXT,
+        user_id INTEGER,
+        ip_address TEXT,
+        timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        details TEXT,
+        FOREIGN KEY (user_id) REFERENCES users (id)
+    ''',
+    "display_logs": '''
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        event_type TEXT,
+        display_id TEXT,
+        message TEXT,
+        success INTEGER,
+        timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    ''',
+    "logs": '''
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id INTEGER,
+        action TEXT NOT NULL,
+        details TEXT,
+        ip_address TEXT,
+        timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        log_level TEXT DEFAULT 'INFO',
+        FOREIGN KEY (user_id) REFERENCES users (id)
+    ''',
+    "bookmarks": '''
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id INTEGER,
+        name TEXT NOT NULL,
+        path TEXT NOT NULL,
+        icon TEXT,
+        category TEXT DEFAULT 'general',
+        order_index INTEGER DEFAULT 0,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (user_id) REFERENCES users (id)
+    ''',
+    "recent_files": '''
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id INTEGER,
+        file_path TEXT NOT NULL,
+        file_name TEXT,
+        application TEXT,
+        opened_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (user_id) REFERENCES users (id)
+    ''',
+    "themes": '''
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT UNIQUE NOT NULL,
+        display_name TEXT,
+        author TEXT,
+        version TEXT,
+        description TEXT,
+        theme_data TEXT,
+        preview_image TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        is_system INTEGER DEFAULT 0
+    ''',
+    "plugins": '''
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT UNIQUE NOT NULL,
+        display_name TEXT,
+        version TEXT,
+        author TEXT,
+        description TEXT,
+        file_path TEXT,
+        enabled INTEGER DEFAULT 0,
+        auto_load INTEGER DEFAULT 0,
+        dependencies TEXT,
+        permissions TEXT,
+        installed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    ''',
+    "network_connections": '''
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        type TEXT NOT NULL,
+        ssid TEXT,
+        password TEXT,
+        security_type TEXT,
+        auto_connect INTEGER DEFAULT 0,
+        priority INTEGER DEFAULT 0,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        last_connected TIMESTAMP
+    ''',
+    "system_performance": '''
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        cpu_percent REAL,
+        memory_percent REAL,
+        disk_percent REAL,
+        network_bytes_sent INTEGER,
+        network_bytes_recv INTEGER,
+        temperature REAL,
+        battery_percent REAL
+    ''',
+    "system_logs_hourly": '''
+        hour TIMESTAMP NOT NULL,
+        level TEXT NOT NULL,
+        component TEXT NOT NULL,
+        entries INTEGER DEFAULT 0,
+        PRIMARY KEY (hour, level, component)
+    ''',
+    "display_logs_hourly": '''
+        hour TIMESTAMP NOT NULL,
+        event_type TEXT NOT NULL,
+        display_id TEXT NOT NULL,
+        entries INTEGER DEFAULT 0,
+        failures INTEGER DEFAULT 0,
+        PRIMARY KEY (hour, event_type, display_id)
+    ''',
+    "logs_hourly": '''
+        hour TIMESTAMP NOT NULL,
+        action TEXT NOT NULL,
+        log_level TEXT NOT NULL,
+        entries INTEGER DEFAULT 0,
+        PRIMARY KEY (hour, action, log_level)
+    '''
+}
+
+# Legacy column names that map onto a unified column: (table, old name) -> new name
+SCHEMA_RENAMED_COLUMNS = {
+    ("users", "full_name"): "fullname"
+}
+
+# Usernames, session tokens and file paths are indexed by their UNIQUE constraints
+SCHEMA_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS idx_sessions_user_id ON sessions (user_id, is_active)",
+    "CREATE INDEX IF NOT EXISTS idx_sessions_expires_at ON sessions (expires_at)",
+    "CREATE INDEX IF NOT EXISTS idx_applications_category ON applications (category, name)",
+    "CREATE INDEX IF NOT EXISTS idx_applications_name ON applications (name)",
+    "CREATE UNIQUE INDEX IF NOT EXISTS idx_settings_category_key ON settings (user_id, category, key)",
+    "CREATE UNIQUE INDEX IF NOT EXISTS idx_settings_setting_key ON settings (user_id, setting_key)",
+    "CREATE INDEX IF NOT EXISTS idx_system_logs_timestamp ON system_logs (timestamp)",
+    "CREATE INDEX IF NOT EXISTS idx_system_logs_component ON system_logs (component, timestamp)",
+    "CREATE INDEX IF NOT EXISTS idx_display_logs_timestamp ON display_logs (timestamp)",
+    "CREATE INDEX IF NOT EXISTS idx_logs_timestamp ON logs (timestamp)",
+    "CREATE INDEX IF NOT EXISTS idx_logs_user_id ON logs (user_id, timestamp)",
+    "CREATE INDEX IF NOT EXISTS idx_bookmarks_category ON bookmarks (user_id, category, order_index)",
+    "CREATE INDEX IF NOT EXISTS idx_recent_files_opened_at ON recent_files (user_id, opened_at)",
+    "CREATE INDEX IF NOT EXISTS idx_system_performance_timestamp ON system_performance (timestamp)"
+]
+
+class SchemaMigrator:
+    """Versioned migrations that bring berke0s.db to the unified schema
+    
+    The version is stored in PRAGMA user_version. Pending migrations run in
+    one immediate transaction, so concurrent processes migrate only once.
+    """
+    
+    def __init__(self, db):
+        self.db = db
+        self.migrations = [
+            (1, "unify component tables", self.unify_tables),
+            (2, "add secondary indexes", self.create_indexes),
+            (3, "add hourly log summaries", self.unify_tables)
+        ]
+    
+    def get_version(self):
+        """Return the schema version stored in the database"""
+        return self.db.query_one("PRAGMA user_version")[0]
+    
+    def migrate(self, target=SCHEMA_VERSION):
+        """Run pending migrations up to target and return the schema version"""
+        version = self.get_version()
+        if version < target:
+            version = self.run_migrations(target)
+        return version
+    
+    def run_migrations(self, target):
+        """Apply pending migrations in one immediate transaction"""
+        self.db.execute("BEGIN IMMEDIATE")
+        try:
+            version = self.get_version()
+            for number, description, migration in self.migrations:
+                if version < number <= target:
+                    start = time.perf_counter()
+                    migration()
+                    self.db.execute(f"PRAGMA user_version = {number}")
+                    version = number
+                    logger.info(f"Schema migration {number} ({description}) took "
+                             f"{(time.perf_counter() - start) * 1000:.1f} ms")
+            self.db.commit()
+            return version
+        except Exception:
+            self.db.rollback()
+            raise
+    
+    def enable_incremental_vacuum(self):
+        """Switch the database to auto_vacuum=INCREMENTAL, rebuilding it once
+        
+        Returns True when the database uses incremental auto-vacuum. The
+        rebuild copies the whole file, so it is skipped while free space is
+        below twice the database size.
+        """
+        if self.db.query_one("PRAGMA auto_vacuum")[0] == 2:
+            return True
+        
+        page_count = self.db.query_one("PRAGMA page_count")[0]
+        page_size = self.db.query_one("PRAGMA page_size")[0]
+        size = page_count * page_size
+        free = shutil.disk_usage(os.path.dirname(os.path.abspath(self.db.path))).free
+        if free < size * 2:
+            logger.warning(f"Not enabling incremental auto-vacuum: {free // (1024 * 1024)} MB free, "
+                           f"{size * 2 // (1024 * 1024)} MB needed")
+            return False
+        
+        start = time.perf_counter()
+        self.db.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        self.db.execute("VACUUM")
+        logger.info(f"Enabled incremental auto-vacuum on {size // (1024 * 1024)} MB database in "
+                    f"{(time.perf_counter() - start) * 1000:.1f} ms")
+        return True
+    
+    def unify_tables(self):
+        """Create missing tables and rebuild tables whose columns differ"""
+        reference = sqlite3.connect(":memory:")
+        try:
+            for table, columns in SCHEMA_TABLES.items():
+                reference.execute(f"CREATE TABLE {table} ({columns})")
+                expected = reference.execute(f"PRAGMA table_info({table})").fetchall()
+                current = self.db.query(f"PRAGMA table_info({table})")
+                if not current:
+                    self.db.execute(f"CREATE TABLE {table} ({columns})")
+                elif sorted(c[1:] for c in current) != sorted(c[1:] for c in expected):
+                    self.rebuild_table(table, columns, [c[1] for c in current], [c[1] for c in expected])
+        finally:
+            reference.close()
+    
+    def rebuild_table(self, table, columns, current, expected):
+        """Copy a table into the unified layout, keeping every shared column"""
+        sources = []
+        targets = []
+        for name in current:
+            target = SCHEMA_RENAMED_COLUMNS.get((table, name), name)
+            if target in expected and target not in targets:
+                sources.append(name)
+                targets.append(target)
+        
+        temp = f"{table}_migrating"
+        self.db.execute(f"DROP TABLE IF EXISTS {temp}")
+        self.db.execute(f"CREATE TABLE {temp} ({columns})")
+        self.db.execute(f"INSERT INTO {temp} ({', '.join(targets)}) SELECT {', '.join(sources)} FROM {table}")
+        self.db.execute(f"DROP TABLE {table}")
+        self.db.execute(f"ALTER TABLE {temp} RENAME TO {table}")
+        
+        dropped = [name for name in current if name not in sources]
+        if dropped:
+            logger.warning(f"Schema migration dropped {table} columns: {', '.join(dropped)}")
+    
+    def create_indexes(self):
+        """Create the secondary indexes of the unified schema"""
+        for sql in SCHEMA_INDEXES:
+            self.db.execute(sql)
+
+@boot_tracer.traced()
 def init_database():
     """Initialize SQLite database for system data"""
     try:
-        conn = sqlite3.connect(DATABASE_FILE)
-        cursor = conn.cursor()
+        version = SchemaMigrator(database).migrate()
+        logger.info(f"Database initialized successfully (schema v{version})")
         
-        # Users table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS users (
-                id INTEGER PRIMARY KEY,
-                username TEXT UNIQUE,
-                fullname TEXT,
-                password_hash TEXT,
-                is_admin INTEGER,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                last_login TIMESTAMP,
-                preferences TEXT
-            )
-        ''')
+    except Exception as e:
+        logger.error(f"Database initialization failed: {e}")
+
+# Hourly summaries that expired log rows are folded into before deletion;
+# rows whose timestamp does not parse are counted in the epoch bucket
+LOG_ROLLUPS = {
+    "system_logs": '''
+        INSERT INTO system_logs_hourly (hour, level, component, entries)
+        SELECT COALESCE(strftime('%Y-%m-%d %H:00:00', timestamp), '1970-01-01 00:00:00'), COALESCE(level, ''), COALESCE(component, ''), COUNT(*)
+        FROM system_logs WHERE id <= ?
+        GROUP BY 1, 2, 3
+        ON CONFLICT (hour, level, component) DO UPDATE SET entries = entries + excluded.entries
+    ''',
+    "display_logs": '''
+        INSERT INTO display_logs_hourly (hour, event_type, display_id, entries, failures)
+        SELECT COALESCE(strftime('%Y-%m-%d %H:00:00', timestamp), '1970-01-01 00:00:00'), COALESCE(event_type, ''), COALESCE(display_id, ''),
+               COUNT(*), SUM(success = 0)
+        FROM display_logs WHERE id <= ?
+        GROUP BY 1, 2, 3
+        ON CONFLICT (hour, event_type, display_id) DO UPDATE SET
+            entries = entries + excluded.entries,
+            failures = failures + excluded.failures
+    ''',
+    "logs": '''
+        INSERT INTO logs_hourly (hour, action, log_level, entries)
+        SELECT COALESCE(strftime('%Y-%m-%d %H:00:00', timestamp), '1970-01-01 00:00:00'), COALESCE(action, ''), COALESCE(log_level, ''), COUNT(*)
+        FROM logs WHERE id <= ?
+        GROUP BY 1, 2, 3
+        ON CONFLICT (hour, action, log_level) DO UPDATE SET entries = entries + excluded.entries
+    '''
+}
+
+class LogRetention:
+    """Apply per-table age and row limits to the log tables in small chunks
+    
+    Expired rows are taken oldest first, folded into the hourly summary
+    tables and deleted. Each step stops when its time budget is spent and
+    then hands free pages back with incremental_vacuum.
+    """
+    
+    def __init__(self, db, config=None):
+        self.db = db
+        self.stats = {
+            "runs": 0,
+            "chunks": 0,
+            "deleted": 0,
+            "vacuumed_pages": 0,
+            "last_run_ms": 0.0,
+            "max_run_ms": 0.0,
+            "pending": False
+        }
+        self.failed = {}
+        self.vacuum_checked = False
+        self.configure(config or {})
+    
+    def configure(self, config):
+        """Apply the log_retention config section"""
+        self.enabled = config.get("enabled", True)
+        self.interval = config.get("interval", 600)
+        self.chunk_rows = config.get("chunk_rows", 2000)
+        self.time_budget = config.get("time_budget_ms", 50) / 1000
+        self.vacuum_pages = config.get("vacuum_pages", 256)
+        tables = config.get("tables", {})
+        self.policies = {table: tables[table] for table in LOG_ROLLUPS if table in tables}
+        self.failed = {}
+    
+    def find_expired(self, table, policy):
+        """Return the last id of the oldest run of rows past the table's limits"""
+        rows = self.db.query(f"SELECT id, timestamp FROM {table} ORDER BY id LIMIT ?", (self.chunk_rows,))
+        if not rows:
+            return None
         
-        # Sessions table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS sessions (
-                id INTEGER PRIMARY KEY,
-                user_id INTEGER,
-                session_data TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (user_id) REFERENCES users (id)
-            )
-        ''')
+        cutoff = None
+        if policy.get("max_age_days"):
+            cutoff = (datetime.datetime.utcnow() - datetime.timedelta(days=policy["max_age_days"])).strftime("%Y-%m-%d %H:%M:%S")
         
-        # Files metadata table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS file_metadata (
-                id INTEGER PRIMARY KEY,
-                file_path TEXT UNIQUE,
-                file_type TEXT,
-                size INTEGER,
-                modified_at TIMESTAMP,
-                tags TEXT,
-                rating INTEGER DEFAULT 0
-            )
-        ''')
+        # Ids only grow, so the newest max_rows ids stand in for a COUNT(*) scan
+        limit_id = None
+        if policy.get("max_rows"):
+            limit_id = self.db.query_one(f"SELECT MAX(id) FROM {table}")[0] - policy["max_rows"]
         
-        # System logs table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS system_logs (
-                id INTEGER PRIMARY KEY,
-                level TEXT,
-                message TEXT,
-                component TEXT,
-                timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
+        end_id = None
+        for row_id, timestamp in rows:
+            if (limit_id is not None and row_id <= limit_id) or (cutoff and timestamp and str(timestamp) < cutoff):
+                end_id = row_id
+            else:
+                break
+        return end_id
+    
+    def prune_chunk(self, table, end_id):
+        """Fold rows up to end_id into the hourly summary and delete them"""
+        try:
+            self.db.execute(LOG_ROLLUPS[table], (end_id,))
+            deleted = self.db.execute(f"DELETE FROM {table} WHERE id <= ?", (end_id,)).rowcount
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
         
-        # Applications table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS applications (
-                id INTEGER PRIMARY KEY,
-                name TEXT,
-                command TEXT,
-                icon TEXT,
-                category TEXT,
-                description TEXT,
-                installed INTEGER DEFAULT 1
-            )
-        ''')
+        self.stats["chunks"] += 1
+        self.stats["deleted"] += deleted
+    
+    def step(self):
+        """Run one time-boxed retention pass and return seconds until the next one"""
+        if not self.enabled:
+            return self.interval
         
-        # Display logs table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS display_logs (
-                id INTEGER PRIMARY KEY,
-                event_type TEXT,
-                display_id TEXT,
-                message TEXT,
-                success INTEGER,
-                timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
+        start = time.perf_counter()
+        deadline = start + self.time_budget
+        pending = False
+        
+        for table, policy in self.policies.items():
+            if table in self.failed:
+                continue
+            try:
+                while not pending:
+                    end_id = self.find_expired(table, policy)
+                    if end_id is None:
+                        break
+                    self.prune_chunk(table, end_id)
+                    pending = time.perf_counter() >= deadline
+            except Exception as e:
+                # The same chunk would fail again on every pass, so the table
+                # is skipped until the policy is reconfigured or the WM restarts
+                self.failed[table] = str(e)
+                logger.error(f"Log retention for {table} disabled: {e}")
         
-        conn.commit()
-        conn.close()
-        logger.info("Database initialized successfully")
+        try:
+            # Converting to incremental auto-vacuum rebuilds the file, so it runs
+            # once here, after pruning, instead of at startup
+            if not pending and not self.vacuum_checked:
+                self.vacuum_checked = True
+                SchemaMigrator(self.db).enable_incremental_vacuum()
+            
+            free_pages = self.db.query_one("PRAGMA freelist_count")[0]
+            if free_pages and not pending:
+                # sqlite3's execute() steps the pragma once, freeing a single page
+                self.db.executescript(f"PRAGMA incremental_vacuum({self.vacuum_pages});")
+                remaining = self.db.query_one("PRAGMA freelist_count")[0]
+                self.stats["vacuumed_pages"] += free_pages - remaining
+                pending = 0 < remaining < free_pages
         
-    except Exception as e:
-        logger.error(f"Database initialization failed: {e}")
+        except Exception as e:
+            logger.error(f"Log retention vacuum error: {e}")
+        
+        elapsed = (time.perf_counter() - start) * 1000
+        self.stats["runs"] += 1
+        self.stats["last_run_ms"] = elapsed
+        self.stats["max_run_ms"] = max(self.stats["max_run_ms"], elapsed)
+        self.stats["pending"] = pending
+        
+        # Come back quickly while there is a backlog, yielding the database in between
+        return 1 if pending else self.interval
+    
+    def get_stats(self):
+        """Return retention counters"""
+        stats = dict(self.stats)
+        stats["failed_tables"] = dict(self.failed)
+        return stats
 
 # Enhanced Installation System
 class InstallationWizard:
@@ -1475,8 +3126,9 @@ class InstallationWizard:
         self.config = DEFAULT_CONFIG.copy()
         self.selected_disk = None
         self.partition_scheme = "auto"
-        self.display_manager = DisplayManager()
+        self.display_manager = DisplayManager(self.config.get("display", {}))
         
+    @boot_tracer.traced()
     def start_installation(self):
         """Start the installation process with enhanced display management"""
         logger.info("Starting Berke0S installation wizard...")
@@ -1560,7 +3212,7 @@ class InstallationWizard:
         
     def create_gradient_bg(self):
         """Create gradient background for installation"""
-        if PIL_AVAILABLE:
+        if pil_available():
             try:
                 width, height = 900, 700
                 image = Image.new('RGB', (width, height))
@@ -1764,7 +3416,7 @@ Click Next to begin the installation process.
         try:
             os_name = platform.system()
             distribution = self.display_manager.get_distribution()
-            is_tinycore = self.display_manager.is_tiny_core_linux()
+            is_tinycore = self.display_manager.get_environment().get("is_tinycore", False)
             
             if os_name == "Linux":
                 if is_tinycore:
@@ -1794,7 +3446,7 @@ Click Next to begin the installation process.
     def check_display_system(self):
         """Check display system"""
         try:
-            env_info = self.display_manager.detect_environment()
+            env_info = self.display_manager.get_environment()
             x11_available = env_info.get("x11_available", {}).get("available", False)
             wayland_available = env_info.get("wayland_available", {}).get("available", False)
             
@@ -1812,7 +3464,7 @@ Click Next to begin the installation process.
     def check_graphics_hardware(self):
         """Check graphics hardware"""
         try:
-            drivers = self.display_manager.detect_graphics_driver()
+            drivers = self.display_manager.get_environment().get("graphics_driver", ['unknown'])
             if drivers and drivers != ['unknown']:
                 return {"status": "pass", "details": f"Graphics drivers: {', '.join(drivers)}"}
             else:
@@ -1960,7 +3612,7 @@ Click Next to begin the installation process.
             
             # Get current display info
             display_info = self.display_manager.get_display_info()
-            env_info = self.display_manager.detect_environment()
+            env_info = self.display_manager.get_environment()
             
             info_content = f"""Current Display Configuration:
 Display: {display_info.get('display', 'Unknown')}
@@ -2653,19 +4305,14 @@ Current available space will be checked during installation.
         """Create user account in database"""
         if self.config.get("users"):
             try:
-                conn = sqlite3.connect(DATABASE_FILE)
-                cursor = conn.cursor()
-                
                 user = self.config["users"][0]
-                cursor.execute(
+                database.execute(
                     "INSERT OR REPLACE INTO users (username, fullname, password_hash, is_admin, preferences) VALUES (?, ?, ?, ?, ?)",
                     (user["username"], user["fullname"], user["password"], 
-                     int(user["admin"]), json.dumps({"auto_login": user["auto_login"]}))
+                     int(user["admin"]), json.dumps({"auto_login": user["auto_login"]})),
+                    commit=True
                 )
                 
-                conn.commit()
-                conn.close()
-                
             except Exception as e:
                 logger.error(f"User creation error: {e}")
     
@@ -2795,9 +4442,6 @@ StartupNotify=true
     def create_default_applications(self):
         """Create default applications database"""
         try:
-            conn = sqlite3.connect(DATABASE_FILE)
-            cursor = conn.cursor()
-            
             apps = [
                 ("File Manager", "berke0s_filemanager", "📁", "System", "Advanced file management"),
                 ("Text Editor", "berke0s_texteditor", "📝", "Office", "Code and text editing"),
@@ -2822,14 +4466,10 @@ StartupNotify=true
                 ("Display Settings", "berke0s_display", "🖥️", "System", "Display configuration")
             ]
             
-            for app in apps:
-                cursor.execute(
-                    "INSERT OR REPLACE INTO applications (name, command, icon, category, description) VALUES (?, ?, ?, ?, ?)",
-                    app
-                )
-            
-            conn.commit()
-            conn.close()
+            database.executemany(
+                "INSERT OR REPLACE INTO applications (name, command, icon, category, description) VALUES (?, ?, ?, ?, ?)",
+                apps
+            )
             
         except Exception as e:
             logger.error(f"Default applications creation failed: {e}")
@@ -3270,6 +4910,326 @@ Thank you for choosing Berke0S Ultimate Desktop Environment!
         except Exception as e:
             logger.error(f"Config save error: {e}")
 
+# Pooled notification windows
+class NotificationToast:
+    """Reusable notification window filled with new content for each toast"""
+    
+    MAX_ACTIONS = 3
+    
+    def __init__(self, system):
+        self.system = system
+        self.notification = None
+        
+        self.window = tk.Toplevel(system.wm.root)
+        self.window.withdraw()
+        self.window.overrideredirect(True)
+        self.window.attributes('-topmost', True)
+        self.window.configure(bg='#1a1a1a')
+        
+        # Main container
+        main_frame = tk.Frame(self.window, bg='#2a2a2a', relief=tk.RAISED, bd=2)
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=3, pady=3)
+        
+        # Header with colored stripe
+        self.header_frame = tk.Frame(main_frame, height=30)
+        self.header_frame.pack(fill=tk.X)
+        self.header_frame.pack_propagate(False)
+        
+        self.title_frame = tk.Frame(self.header_frame)
+        self.title_frame.pack(fill=tk.X, padx=10, pady=5)
+        
+        self.icon_label = tk.Label(self.title_frame, font=('Arial', 12))
+        self.icon_label.pack(side=tk.LEFT)
+        
+        self.title_label = tk.Label(self.title_frame, font=('Arial', 10, 'bold'))
+        self.title_label.pack(side=tk.LEFT, padx=(10, 0))
+        
+        self.close_btn = tk.Label(self.title_frame, text="✕", font=('Arial', 8), cursor='hand2')
+        self.close_btn.pack(side=tk.RIGHT)
+        self.close_btn.bind('<Button-1>', lambda e: self.system.close_notification_by_window(self.window))
+        
+        # Message content
+        self.content_frame = tk.Frame(main_frame, bg='#3a3a3a')
+        self.content_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        self.msg_label = tk.Label(self.content_frame, bg='#3a3a3a', fg='white',
+                                  font=('Arial', 9), wraplength=360, justify=tk.LEFT, anchor='nw')
+        self.msg_label.pack(fill=tk.X, pady=(0, 5))
+        
+        # Action buttons, shown as needed
+        self.action_frame = tk.Frame(self.content_frame, bg='#3a3a3a')
+        self.action_buttons = []
+        for _ in range(self.MAX_ACTIONS):
+            btn = tk.Button(self.action_frame, font=('Arial', 8), relief=tk.FLAT, padx=10, pady=2)
+            self.action_buttons.append(btn)
+        
+        # Progress bar for timed notifications
+        self.progress_frame = tk.Frame(self.content_frame, bg='#3a3a3a', height=3)
+        self.progress_bar = tk.Frame(self.progress_frame, height=3)
+        self.progress_bar.pack(side=tk.LEFT, fill=tk.Y)
+    
+    def fill(self, title, message, notif_type, actions, icon):
+        """Re-fill the window for a new notification"""
+        config = self.system.type_styles.get(notif_type, self.system.type_styles["info"])
+        color, text_color = config["color"], config["text_color"]
+        
+        for widget in (self.header_frame, self.title_frame):
+            widget.configure(bg=color)
+        self.icon_label.configure(text=icon if icon else config["icon"], bg=color, fg=text_color)
+        self.title_label.configure(text=title, bg=color, fg=text_color)
+        self.close_btn.configure(bg=color, fg=text_color)
+        self.msg_label.configure(text=message)
+        
+        # Action buttons
+        actions = (actions or [])[:self.MAX_ACTIONS]
+        for btn in self.action_buttons:
+            btn.pack_forget()
+        if actions:
+            self.action_frame.pack(fill=tk.X)
+            for btn, action in zip(self.action_buttons, actions):
+                btn.configure(text=action.get("text", "Action"), bg=color, fg=text_color,
+                              command=lambda a=action: self.system.handle_notification_action(self.window, a))
+                btn.pack(side=tk.LEFT, padx=(0, 5))
+        else:
+            self.action_frame.pack_forget()
+        
+        if notif_type in ["info", "system"]:
+            self.progress_bar.configure(bg=color)
+            self.progress_frame.pack(fill=tk.X, side=tk.BOTTOM)
+        else:
+            self.progress_frame.pack_forget()
+
+# Persistent notification history
+class NotificationStore:
+    """SQLite-backed notification history with paging and full-text search
+    
+    New notifications are queued and inserted by a background writer
+    thread, so send() never waits for a commit on the Tk thread. Reads do
+    not wait for the writer either; rows still queued show up on the next
+    page or reload.
+    """
+    
+    def __init__(self, db=None, max_rows=50000, max_queued=1000):
+        self.db = db or database
+        self.max_rows = max_rows
+        self.max_queued = max_queued
+        self.ready = False
+        self.fts = False
+        self.lock = threading.Lock()
+        self.inserts_since_prune = 0
+        self.queue = collections.deque()
+        self.condition = threading.Condition()
+        self.thread = None
+        self.running = False
+        self.enqueued = 0
+        self.written = 0
+        self.dropped = 0
+    
+    def ensure_schema(self):
+        """Create the history schema on first use"""
+        if self.ready:
+            return
+        
+        self.db.execute('''
+            CREATE TABLE IF NOT EXISTS notification_history (
+                id INTEGER PRIMARY KEY,
+                title TEXT,
+                message TEXT,
+                type TEXT,
+                timestamp REAL
+            )
+        ''')
+        self.db.execute("CREATE INDEX IF NOT EXISTS idx_notification_history_timestamp ON notification_history (timestamp)")
+        self.db.execute("CREATE INDEX IF NOT EXISTS idx_notification_history_type ON notification_history (type, timestamp)")
+        
+        try:
+            self.db.execute('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS notification_fts USING fts5(
+                    title, message, content='notification_history', content_rowid='id'
+                )
+            ''')
+            self.db.executescript('''
+                CREATE TRIGGER IF NOT EXISTS notification_fts_insert AFTER INSERT ON notification_history BEGIN
+                    INSERT INTO notification_fts (rowid, title, message) VALUES (new.id, new.title, new.message);
+                END;
+                CREATE TRIGGER IF NOT EXISTS notification_fts_delete AFTER DELETE ON notification_history BEGIN
+                    INSERT INTO notification_fts (notification_fts, rowid, title, message) VALUES ('delete', old.id, old.title, old.message);
+                END;
+            ''')
+            self.fts = True
+        except sqlite3.OperationalError as e:
+            logger.warning(f"Notification search falls back to LIKE, FTS5 unavailable: {e}")
+        
+        self.db.commit()
+        self.ready = True
+    
+    def add(self, notification):
+        """Queue a notification for the background writer"""
+        timestamp = notification["timestamp"]
+        if isinstance(timestamp, datetime.datetime):
+            timestamp = timestamp.timestamp()
+        row = (str(notification["title"]), str(notification["message"]), notification["type"], timestamp)
+        
+        with self.condition:
+            if len(self.queue) >= self.max_queued:
+                self.dropped += 1
+                return False
+            return self.enqueue(row)
+    
+    def enqueue(self, row):
+        """Hand a row, or None to clear the history, to the writer thread"""
+        with self.condition:
+            self.queue.append(row)
+            self.enqueued += 1
+            if not self.running:
+                self.running = True
+                self.thread = threading.Thread(target=self.run, name="NotificationStore", daemon=True)
+                self.thread.start()
+            self.condition.notify_all()
+        return True
+    
+    def run(self):
+        """Write queued notifications until stopped"""
+        while True:
+            with self.condition:
+                while self.running and not self.queue:
+                    self.condition.wait()
+                if not self.queue:
+                    return
+                rows = list(self.queue)
+                self.queue.clear()
+            
+            self.write_rows(rows)
+    
+    def write_rows(self, rows):
+        """Insert queued rows in one transaction, pruning every 500 inserts"""
+        try:
+            with self.lock:
+                self.ensure_schema()
+                
+                # A clear request drops everything queued before it
+                cleared = None in rows
+                if cleared:
+                    rows = rows[len(rows) - rows[::-1].index(None):]
+                    self.db.execute("DELETE FROM notification_history")
+                
+                self.db.executemany(
+                    "INSERT INTO notification_history (title, message, type, timestamp) VALUES (?, ?, ?, ?)",
+                    rows
+                )
+                
+                self.inserts_since_prune += len(rows)
+                if self.inserts_since_prune >= 500:
+                    self.inserts_since_prune = 0
+                    self.prune()
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Notification history write error: {e}")
+        finally:
+            with self.condition:
+                self.written = self.enqueued - len(self.queue)
+                self.condition.notify_all()
+    
+    def flush(self, timeout=1.0):
+        """Wait until every notification queued so far has been written"""
+        deadline = time.monotonic() + timeout
+        with self.condition:
+            target = self.enqueued
+            while self.running and self.written < target:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self.condition.wait(remaining)
+        return True
+    
+    def stop(self, timeout=5.0):
+        """Write pending notifications and stop the writer thread"""
+        with self.condition:
+            self.running = False
+            self.condition.notify_all()
+        if self.thread:
+            self.thread.join(timeout)
+            self.thread = None
+    
+    def ensure_ready(self):
+        """Create the schema if needed without waiting on the writer once it exists"""
+        if not self.ready:
+            with self.lock:
+                self.ensure_schema()
+    
+    def build_filter(self, search=None, notification_type=None, before_id=None):
+        """Build the WHERE clause shared by query and count"""
+        clauses = []
+        params = []
+        
+        if search:
+            if self.fts:
+                terms = " ".join('"' + term.replace('"', '""') + '"*' for term in search.split())
+                clauses.append("id IN (SELECT rowid FROM notification_fts WHERE notification_fts MATCH ?)")
+                params.append(terms)
+            else:
+                clauses.append("(title LIKE ? OR message LIKE ?)")
+                params.extend([f"%{search}%", f"%{search}%"])
+        
+        if notification_type:
+            clauses.append("type = ?")
+            params.append(notification_type)
+        
+        if before_id is not None:
+            clauses.append("id < ?")
+            params.append(before_id)
+        
+        where = (" WHERE " + " AND ".join(clauses)) if clauses else ""
+        return where, params
+    
+    def query(self, limit=30, before_id=None, search=None, notification_type=None):
+        """Return a page of notifications, newest first
+        
+        Pass the id of the last row of the previous page as before_id to
+        fetch the next one without an OFFSET scan.
+        """
+        try:
+            self.ensure_ready()
+            where, params = self.build_filter(search, notification_type, before_id)
+            rows = self.db.execute(
+                f"SELECT id, title, message, type, timestamp FROM notification_history{where} ORDER BY id DESC LIMIT ?",
+                params + [limit]
+            ).fetchall()
+            
+            return [{
+                "id": row[0],
+                "title": row[1],
+                "message": row[2],
+                "type": row[3],
+                "timestamp": datetime.datetime.fromtimestamp(row[4])
+            } for row in rows]
+        except Exception as e:
+            logger.error(f"Notification history query error: {e}")
+            return []
+    
+    def count(self, search=None, notification_type=None):
+        """Count stored notifications matching the filter"""
+        try:
+            self.ensure_ready()
+            where, params = self.build_filter(search, notification_type)
+            return self.db.execute(f"SELECT COUNT(*) FROM notification_history{where}", params).fetchone()[0]
+        except Exception as e:
+            logger.error(f"Notification history count error: {e}")
+            return 0
+    
+    def prune(self):
+        """Drop the oldest rows beyond max_rows"""
+        self.ensure_schema()
+        self.db.execute(
+            "DELETE FROM notification_history WHERE id <= (SELECT id FROM notification_history ORDER BY id DESC LIMIT 1 OFFSET ?)",
+            (self.max_rows,)
+        )
+        self.db.commit()
+    
+    def clear(self):
+        """Delete all stored notifications, including any still queued"""
+        self.enqueue(None)
+
 # Enhanced Notification System (keeping existing implementation)
 class NotificationSystem:
     """Advanced notification system with rich features"""
@@ -3278,14 +5238,37 @@ class NotificationSystem:
         self.wm = wm
         self.notifications = []
         self.notification_id = 0
-        self.notification_history = []
         self.max_history = 100
+        self.notification_history = collections.deque(maxlen=self.max_history)
+        
+        # Pre-built windows reused between toasts, and toasts waiting for a free slot
+        notification_config = wm.config.get("notifications", {}) if hasattr(wm, 'config') else {}
+        self.store = NotificationStore(max_rows=notification_config.get("history_max_rows", 50000))
+        self.page_size = notification_config.get("history_page_size", 30)
+        self.max_visible = notification_config.get("max_visible", 4)
+        self.pool_size = notification_config.get("pool_size", self.max_visible)
+        self.pool = []
+        self.pending = collections.deque(maxlen=notification_config.get("max_queued", 50))
+        self.dropped = 0
+        self.type_styles = {
+            "info": {"icon": "ℹ️", "color": "#4a9eff", "text_color": "white"},
+            "success": {"icon": "✅", "color": "#00ff88", "text_color": "black"},
+            "warning": {"icon": "⚠️", "color": "#ffb347", "text_color": "black"},
+            "error": {"icon": "❌", "color": "#ff6b6b", "text_color": "white"},
+            "system": {"icon": "🔧", "color": "#6c757d", "text_color": "white"}
+        }
         
     def send(self, title, message, timeout=5000, notification_type="info", actions=None, icon=None):
         """Send a rich notification"""
         try:
             if not hasattr(self.wm, 'root') or not self.wm.root:
                 return
+            
+            # Tk widgets may only be created on the main thread
+            ui_thread_id = getattr(self.wm, 'ui_thread_id', None)
+            if ui_thread_id is not None and threading.get_ident() != ui_thread_id:
+                self.wm.post_to_ui(self.send, title, message, timeout, notification_type, actions, icon)
+                return
                 
             self.notification_id += 1
             
@@ -3299,47 +5282,39 @@ class NotificationSystem:
                 "actions": actions or []
             }
             self.notification_history.append(notification_data)
+            self.store.add(notification_data)
             
-            # Limit history size
-            if len(self.notification_history) > self.max_history:
-                self.notification_history.pop(0)
-            
-            # Create notification window
-            notif = tk.Toplevel(self.wm.root)
-            notif.withdraw()
-            notif.overrideredirect(True)
-            notif.attributes('-topmost', True)
-            notif.configure(bg='#1a1a1a')
+            # Queue when the visible limit is reached
+            if len(self.notifications) >= self.max_visible:
+                if len(self.pending) == self.pending.maxlen:
+                    self.dropped += 1
+                self.pending.append((notification_data, timeout, icon))
+                return
             
-            # Enhanced positioning
-            screen_width = self.wm.root.winfo_screenwidth()
-            screen_height = self.wm.root.winfo_screenheight()
+            self.show_notification(notification_data, timeout, icon)
+                
+        except Exception as e:
+            logger.error(f"Notification error: {e}")
+    
+    def show_notification(self, notification_data, timeout, icon=None):
+        """Display a notification in a pooled window"""
+        try:
+            toast = self.pool.pop() if self.pool else NotificationToast(self)
+            toast.fill(notification_data["title"], notification_data["message"],
+                       notification_data["type"], notification_data["actions"], icon)
+            toast.notification = notification_data
             
+            notif = toast.window
             notif_width = 400
-            notif_height = 100 + (len(actions) * 30 if actions else 0)
-            
-            position = self.wm.config.get("notifications", {}).get("position", "top-right")
-            
-            if position == "top-right":
-                x = screen_width - notif_width - 20
-                y = 20 + len(self.notifications) * (notif_height + 10)
-            elif position == "top-left":
-                x = 20
-                y = 20 + len(self.notifications) * (notif_height + 10)
-            elif position == "bottom-right":
-                x = screen_width - notif_width - 20
-                y = screen_height - notif_height - 20 - len(self.notifications) * (notif_height + 10)
-            else:  # bottom-left
-                x = 20
-                y = screen_height - notif_height - 20 - len(self.notifications) * (notif_height + 10)
+            notif_height = 100 + (len(notification_data["actions"][:toast.MAX_ACTIONS]) * 30)
+            notification_data["window"] = notif
+            notification_data["toast"] = toast
+            notification_data["height"] = notif_height
             
+            x, y = self.get_notification_position(len(self.notifications), notif_width, notif_height)
             notif.geometry(f"{notif_width}x{notif_height}+{x}+{y}")
             
-            # Create notification content
-            self.create_notification_content(notif, title, message, notification_type, actions, icon)
-            
             # Store notification
-            notification_data["window"] = notif
             self.notifications.append(notification_data)
             
             # Show with animation
@@ -3347,84 +5322,41 @@ class NotificationSystem:
             
             # Auto close
             if timeout > 0:
-                self.wm.root.after(timeout, lambda: self.close_notification(notification_data))
+                notification_data["timer"] = self.wm.root.after(
+                    timeout, lambda: self.close_notification(notification_data))
                 
         except Exception as e:
             logger.error(f"Notification error: {e}")
-            
-    def create_notification_content(self, notif, title, message, notif_type, actions, icon):
-        """Create enhanced notification content"""
-        try:
-            # Color scheme based on type
-            colors = {
-                "info": {"icon": "ℹ️", "color": "#4a9eff", "text_color": "white"},
-                "success": {"icon": "✅", "color": "#00ff88", "text_color": "black"},
-                "warning": {"icon": "⚠️", "color": "#ffb347", "text_color": "black"},
-                "error": {"icon": "❌", "color": "#ff6b6b", "text_color": "white"},
-                "system": {"icon": "🔧", "color": "#6c757d", "text_color": "white"}
-            }
-            
-            config = colors.get(notif_type, colors["info"])
-            
-            # Main container
-            main_frame = tk.Frame(notif, bg='#2a2a2a', relief=tk.RAISED, bd=2)
-            main_frame.pack(fill=tk.BOTH, expand=True, padx=3, pady=3)
-            
-            # Header with colored stripe
-            header_frame = tk.Frame(main_frame, bg=config["color"], height=30)
-            header_frame.pack(fill=tk.X)
-            header_frame.pack_propagate(False)
-            
-            # Icon and title
-            title_frame = tk.Frame(header_frame, bg=config["color"])
-            title_frame.pack(fill=tk.X, padx=10, pady=5)
-            
-            # Icon
-            icon_text = icon if icon else config["icon"]
-            tk.Label(title_frame, text=icon_text, bg=config["color"], 
-                    fg=config["text_color"], font=('Arial', 12)).pack(side=tk.LEFT)
-            
-            # Title
-            tk.Label(title_frame, text=title, bg=config["color"], 
-                    fg=config["text_color"], font=('Arial', 10, 'bold')).pack(side=tk.LEFT, padx=(10, 0))
-            
-            # Close button
-            close_btn = tk.Label(title_frame, text="✕", bg=config["color"], 
-                               fg=config["text_color"], font=('Arial', 8), cursor='hand2')
-            close_btn.pack(side=tk.RIGHT)
-            close_btn.bind('<Button-1>', lambda e: self.close_notification_by_window(notif))
-            
-            # Message content
-            content_frame = tk.Frame(main_frame, bg='#3a3a3a')
-            content_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-            
-            # Message text
-            msg_label = tk.Label(content_frame, text=message, bg='#3a3a3a', fg='white', 
-                               font=('Arial', 9), wraplength=360, justify=tk.LEFT, anchor='nw')
-            msg_label.pack(fill=tk.X, pady=(0, 5))
-            
-            # Action buttons
-            if actions:
-                action_frame = tk.Frame(content_frame, bg='#3a3a3a')
-                action_frame.pack(fill=tk.X)
-                
-                for action in actions:
-                    btn = tk.Button(action_frame, text=action.get("text", "Action"),
-                                   command=lambda a=action: self.handle_notification_action(notif, a),
-                                   bg=config["color"], fg=config["text_color"],
-                                   font=('Arial', 8), relief=tk.FLAT, padx=10, pady=2)
-                    btn.pack(side=tk.LEFT, padx=(0, 5))
-            
-            # Progress bar for timed notifications
-            if notif_type in ["info", "system"]:
-                progress_frame = tk.Frame(content_frame, bg='#3a3a3a', height=3)
-                progress_frame.pack(fill=tk.X, side=tk.BOTTOM)
-                
-                progress_bar = tk.Frame(progress_frame, bg=config["color"], height=3)
-                progress_bar.pack(side=tk.LEFT, fill=tk.Y)
-                
+    
+    def get_notification_position(self, index, width, height):
+        """Return the screen position of the index-th visible toast"""
+        position = self.wm.config.get("notifications", {}).get("position", "top-right")
+        screen_width = self.wm.root.winfo_screenwidth()
+        screen_height = self.wm.root.winfo_screenheight()
+        
+        # Stack below (or above) the toasts already shown
+        offset = sum(n.get("height", 100) + 10 for n in self.notifications[:index])
+        
+        if position == "top-right":
+            return screen_width - width - 20, 20 + offset
+        elif position == "top-left":
+            return 20, 20 + offset
+        elif position == "bottom-right":
+            return screen_width - width - 20, screen_height - height - 20 - offset
+        else:  # bottom-left
+            return 20, screen_height - height - 20 - offset
+    
+    def release_toast(self, toast):
+        """Return a hidden toast window to the pool"""
+        try:
+            toast.notification = None
+            toast.window.withdraw()
+            if len(self.pool) < self.pool_size:
+                self.pool.append(toast)
+            else:
+                toast.window.destroy()
         except Exception as e:
-            logger.error(f"Notification content creation error: {e}")
+            logger.error(f"Notification release error: {e}")
     
     def handle_notification_action(self, notif, action):
         """Handle notification action button click"""
@@ -3445,9 +5377,12 @@ class NotificationSystem:
                 self.close_notification(notification)
                 break
     
-    def animate_notification(self, notif, action):
+    def animate_notification(self, notif, action, on_hidden=None):
         """Enhanced notification animation"""
         try:
+            animator = self.wm.animator
+            key = ("notification", str(notif))
+            
             if action == "show":
                 notif.deiconify()
                 notif.attributes('-alpha', 0)
@@ -3456,71 +5391,57 @@ class NotificationSystem:
                 start_x = notif.winfo_x() + 50
                 target_x = notif.winfo_x()
                 
-                def slide_in(step=0):
-                    if step <= 10:
-                        progress = step / 10
-                        current_x = start_x + (target_x - start_x) * progress
-                        alpha = progress * 0.95
-                        
-                        notif.geometry(f"{notif.winfo_width()}x{notif.winfo_height()}+{int(current_x)}+{notif.winfo_y()}")
-                        notif.attributes('-alpha', alpha)
-                        
-                        self.wm.root.after(20, lambda: slide_in(step + 1))
-                        
-                slide_in()
+                def slide_in(progress):
+                    current_x = start_x + (target_x - start_x) * progress
+                    notif.geometry(f"{notif.winfo_width()}x{notif.winfo_height()}+{int(current_x)}+{notif.winfo_y()}")
+                    notif.attributes('-alpha', progress * 0.95)
+                
+                animator.animate(notif, slide_in, animator.get_duration(0.7), key=key, ease=animator.ease_out)
                 
             elif action == "hide":
-                def fade_out(alpha=0.95):
-                    if alpha >= 0:
-                        notif.attributes('-alpha', alpha)
-                        self.wm.root.after(50, lambda: fade_out(alpha - 0.1))
-                    else:
-                        notif.destroy()
-                        
-                fade_out()
+                def fade_out(progress):
+                    notif.attributes('-alpha', 0.95 * (1 - progress))
+                
+                on_done = on_hidden or notif.destroy
+                animator.animate(notif, fade_out, on_done=on_done, on_cancel=on_hidden, key=key)
                 
         except Exception as e:
             logger.error(f"Animation error: {e}")
             if action == "hide":
-                notif.destroy()
+                if on_hidden:
+                    on_hidden()
+                else:
+                    notif.destroy()
     
     def close_notification(self, notification):
         """Close a specific notification"""
         try:
             if notification in self.notifications:
                 self.notifications.remove(notification)
-                if "window" in notification:
-                    self.animate_notification(notification["window"], "hide")
+                if notification.get("timer"):
+                    self.wm.root.after_cancel(notification["timer"])
+                if "toast" in notification:
+                    # History keeps the data only, the window goes back to the pool
+                    toast = notification.pop("toast")
+                    notification.pop("window", None)
+                    notification.pop("timer", None)
+                    self.animate_notification(toast.window, "hide", lambda: self.release_toast(toast))
                 self.reposition_notifications()
+                
+                # Fill the freed slot from the overflow queue
+                while self.pending and len(self.notifications) < self.max_visible:
+                    self.show_notification(*self.pending.popleft())
         except Exception as e:
             logger.error(f"Close notification error: {e}")
     
     def reposition_notifications(self):
         """Reposition remaining notifications"""
         try:
-            position = self.wm.config.get("notifications", {}).get("position", "top-right")
-            screen_width = self.wm.root.winfo_screenwidth()
-            screen_height = self.wm.root.winfo_screenheight()
-            
             for i, notification in enumerate(self.notifications):
                 if "window" in notification:
-                    notif = notification["window"]
-                    width, height = 400, 100
-                    
-                    if position == "top-right":
-                        x = screen_width - width - 20
-                        y = 20 + i * (height + 10)
-                    elif position == "top-left":
-                        x = 20
-                        y = 20 + i * (height + 10)
-                    elif position == "bottom-right":
-                        x = screen_width - width - 20
-                        y = screen_height - height - 20 - i * (height + 10)
-                    else:  # bottom-left
-                        x = 20
-                        y = screen_height - height - 20 - i * (height + 10)
-                    
-                    notif.geometry(f"{width}x{height}+{x}+{y}")
+                    width, height = 400, notification.get("height", 100)
+                    x, y = self.get_notification_position(i, width, height)
+                    notification["window"].geometry(f"{width}x{height}+{x}+{y}")
                     
         except Exception as e:
             logger.error(f"Reposition error: {e}")
@@ -3543,9 +5464,28 @@ class NotificationSystem:
                     font=('Arial', 14, 'bold')).pack(pady=15)
             
             # Clear all button
-            tk.Button(header, text="Clear All", command=self.clear_all_notifications,
+            tk.Button(header, text="Clear All", command=lambda: (self.clear_all_notifications(), reload()),
                      bg=self.wm.get_theme_color("error"), fg="white").pack(side=tk.RIGHT, padx=10, pady=10)
             
+            # Search bar
+            search_frame = tk.Frame(center, bg=self.wm.get_theme_color("window"))
+            search_frame.pack(fill=tk.X, padx=10, pady=(10, 0))
+            
+            search_var = tk.StringVar()
+            search_entry = tk.Entry(search_frame, textvariable=search_var,
+                                   bg=self.wm.get_theme_color("bg"), fg=self.wm.get_theme_color("fg"),
+                                   insertbackground=self.wm.get_theme_color("fg"))
+            search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
+            
+            type_var = tk.StringVar(value="all")
+            tk.OptionMenu(search_frame, type_var, "all", *self.type_styles.keys(),
+                         command=lambda value: reload()).pack(side=tk.RIGHT, padx=(5, 0))
+            
+            status_label = tk.Label(center, text="", anchor='w',
+                                   bg=self.wm.get_theme_color("window"), fg=self.wm.get_theme_color("fg"),
+                                   font=('Arial', 8))
+            status_label.pack(side=tk.BOTTOM, fill=tk.X, padx=10, pady=(0, 5))
+            
             # Notification list
             list_frame = tk.Frame(center, bg=self.wm.get_theme_color("window"))
             list_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
@@ -3561,67 +5501,1148 @@ class NotificationSystem:
             )
             
             canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-            canvas.configure(yscrollcommand=scrollbar.set)
             
-            # Display notification history
-            for notification in reversed(self.notification_history[-20:]):  # Show last 20
-                self.create_history_item(scrollable_frame, notification)
+            # Pages are fetched from the database as the list is scrolled
+            page = {"before_id": None, "loaded": 0, "exhausted": False, "loading": False, "total": 0}
+            
+            def current_filter():
+                notification_type = type_var.get()
+                return search_var.get().strip() or None, None if notification_type == "all" else notification_type
+            
+            def load_page():
+                page["loading"] = False
+                if page["exhausted"] or not center.winfo_exists():
+                    return
+                
+                search, notification_type = current_filter()
+                rows = self.store.query(self.page_size, page["before_id"], search, notification_type)
+                for notification in rows:
+                    self.create_history_item(scrollable_frame, notification)
+                
+                if rows:
+                    page["before_id"] = rows[-1]["id"]
+                page["loaded"] += len(rows)
+                page["exhausted"] = len(rows) < self.page_size
+                status_label.config(text=f"Showing {page['loaded']} of {page['total']}")
+            
+            def on_scroll(first, last):
+                scrollbar.set(first, last)
+                if float(last) >= 0.95 and not page["exhausted"] and not page["loading"]:
+                    page["loading"] = True
+                    center.after_idle(load_page)
+            
+            def reload(event=None):
+                for child in scrollable_frame.winfo_children():
+                    child.destroy()
+                search, notification_type = current_filter()
+                page.update(before_id=None, loaded=0, exhausted=False, loading=False,
+                            total=self.store.count(search, notification_type))
+                canvas.yview_moveto(0)
+                load_page()
+            
+            canvas.configure(yscrollcommand=on_scroll)
+            search_entry.bind("<Return>", reload)
             
             canvas.pack(side="left", fill="both", expand=True)
             scrollbar.pack(side="right", fill="y")
             
+            reload()
+            
         except Exception as e:
             logger.error(f"Notification center error: {e}")
     
-    def create_history_item(self, parent, notification):
-        """Create a notification history item"""
-        try:
-            item_frame = tk.Frame(parent, bg=self.wm.get_theme_color("bg"), relief=tk.RAISED, bd=1)
-            item_frame.pack(fill=tk.X, pady=2, padx=5)
-            
-            # Header with type color
-            colors = {
-                "info": "#4a9eff", "success": "#00ff88", 
-                "warning": "#ffb347", "error": "#ff6b6b"
+    def create_history_item(self, parent, notification):
+        """Create a notification history item"""
+        try:
+            item_frame = tk.Frame(parent, bg=self.wm.get_theme_color("bg"), relief=tk.RAISED, bd=1)
+            item_frame.pack(fill=tk.X, pady=2, padx=5)
+            
+            # Header with type color
+            colors = {
+                "info": "#4a9eff", "success": "#00ff88", 
+                "warning": "#ffb347", "error": "#ff6b6b"
+            }
+            color = colors.get(notification["type"], "#4a9eff")
+            
+            header = tk.Frame(item_frame, bg=color, height=5)
+            header.pack(fill=tk.X)
+            
+            # Content
+            content = tk.Frame(item_frame, bg=self.wm.get_theme_color("bg"))
+            content.pack(fill=tk.X, padx=10, pady=5)
+            
+            # Title and timestamp
+            title_frame = tk.Frame(content, bg=self.wm.get_theme_color("bg"))
+            title_frame.pack(fill=tk.X)
+            
+            tk.Label(title_frame, text=notification["title"], 
+                    bg=self.wm.get_theme_color("bg"), fg=self.wm.get_theme_color("fg"),
+                    font=('Arial', 10, 'bold')).pack(side=tk.LEFT)
+            
+            timestamp = notification["timestamp"].strftime("%H:%M")
+            tk.Label(title_frame, text=timestamp, 
+                    bg=self.wm.get_theme_color("bg"), fg=self.wm.get_theme_color("fg"),
+                    font=('Arial', 8)).pack(side=tk.RIGHT)
+            
+            # Message
+            tk.Label(content, text=notification["message"], 
+                    bg=self.wm.get_theme_color("bg"), fg=self.wm.get_theme_color("fg"),
+                    font=('Arial', 9), wraplength=450, justify=tk.LEFT).pack(anchor='w')
+            
+        except Exception as e:
+            logger.error(f"History item creation error: {e}")
+    
+    def clear_all_notifications(self):
+        """Clear all notifications and history"""
+        self.pending.clear()
+        
+        # Close all active notifications
+        for notification in self.notifications.copy():
+            self.close_notification(notification)
+        
+        # Clear history
+        self.notification_history.clear()
+        self.store.clear()
+
+# Shared System Sampler
+SystemSnapshot = collections.namedtuple("SystemSnapshot", [
+    "timestamp", "interval",
+    "cpu_percent", "per_cpu_percent", "cpu_count",
+    "memory_total", "memory_available", "memory_used", "memory_percent",
+    "swap_total", "swap_used", "swap_percent",
+    "disk_total", "disk_used", "disk_percent",
+    "net_bytes_recv", "net_bytes_sent", "net_recv_rate", "net_sent_rate",
+    "disk_read_bytes", "disk_write_bytes", "disk_read_rate", "disk_write_rate"
+])
+
+class SystemSampler:
+    """Read /proc once per tick and publish immutable SystemSnapshot deltas"""
+    
+    SECTOR_SIZE = 512
+    
+    def __init__(self, disk_path="/"):
+        self.disk_path = disk_path
+        self.latest = None
+        self.previous_raw = None
+        self.subscribers = {}
+        self.next_token = 0
+        self.lock = threading.Lock()
+        self.use_proc = os.path.exists("/proc/stat")
+        self.block_devices = None
+        self.samples = 0
+        
+    def subscribe(self, callback):
+        """Call callback(snapshot) after every tick; returns an unsubscribe token"""
+        with self.lock:
+            self.next_token += 1
+            self.subscribers[self.next_token] = callback
+            return self.next_token
+    
+    def unsubscribe(self, token):
+        """Stop delivering snapshots to a subscriber"""
+        with self.lock:
+            self.subscribers.pop(token, None)
+    
+    def read_cpu_times(self):
+        """Return (busy, total) jiffies for the aggregate and each CPU"""
+        times = []
+        with open("/proc/stat", 'r') as f:
+            for line in f:
+                if not line.startswith("cpu"):
+                    break
+                values = [int(v) for v in line.split()[1:9]]
+                values += [0] * (8 - len(values))
+                total = sum(values)
+                idle = values[3] + values[4]  # idle + iowait
+                times.append((total - idle, total))
+        return times
+    
+    def read_meminfo(self):
+        """Return /proc/meminfo values in bytes"""
+        info = {}
+        with open("/proc/meminfo", 'r') as f:
+            for line in f:
+                key, _, value = line.partition(':')
+                parts = value.split()
+                if parts:
+                    info[key] = int(parts[0]) * 1024
+        
+        if "MemAvailable" not in info:
+            info["MemAvailable"] = info.get("MemFree", 0) + info.get("Buffers", 0) + info.get("Cached", 0)
+        return info
+    
+    def read_net_counters(self):
+        """Return total received and sent bytes over non-loopback interfaces"""
+        recv = sent = 0
+        with open("/proc/net/dev", 'r') as f:
+            for line in f.readlines()[2:]:
+                name, _, data = line.partition(':')
+                if name.strip() == "lo":
+                    continue
+                fields = data.split()
+                if len(fields) >= 9:
+                    recv += int(fields[0])
+                    sent += int(fields[8])
+        return recv, sent
+    
+    def read_disk_counters(self):
+        """Return total read and written bytes over whole block devices"""
+        if self.block_devices is None:
+            try:
+                self.block_devices = {
+                    d for d in os.listdir("/sys/block")
+                    if not d.startswith(("loop", "ram", "zram"))
+                }
+            except OSError:
+                self.block_devices = set()
+        
+        read = written = 0
+        with open("/proc/diskstats", 'r') as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) < 10 or fields[2] not in self.block_devices:
+                    continue
+                read += int(fields[5]) * self.SECTOR_SIZE
+                written += int(fields[9]) * self.SECTOR_SIZE
+        return read, written
+    
+    def read_raw(self):
+        """Read every counter used to build a snapshot"""
+        if self.use_proc:
+            meminfo = self.read_meminfo()
+            raw = {
+                "time": time.monotonic(),
+                "cpu": self.read_cpu_times(),
+                "memory_total": meminfo.get("MemTotal", 0),
+                "memory_available": meminfo.get("MemAvailable", 0),
+                "swap_total": meminfo.get("SwapTotal", 0),
+                "swap_free": meminfo.get("SwapFree", 0),
+                "net": self.read_net_counters(),
+                "disk_io": self.read_disk_counters()
+            }
+        else:
+            # Non-Linux fallback through psutil
+            memory = psutil.virtual_memory()
+            swap = psutil.swap_memory()
+            net = psutil.net_io_counters()
+            disk_io = psutil.disk_io_counters()
+            raw = {
+                "time": time.monotonic(),
+                "cpu": None,
+                "cpu_percent": psutil.cpu_percent(interval=None),
+                "per_cpu_percent": tuple(psutil.cpu_percent(interval=None, percpu=True)),
+                "memory_total": memory.total,
+                "memory_available": memory.available,
+                "swap_total": swap.total,
+                "swap_free": swap.free,
+                "net": (net.bytes_recv, net.bytes_sent) if net else (0, 0),
+                "disk_io": (disk_io.read_bytes, disk_io.write_bytes) if disk_io else (0, 0)
+            }
+        
+        try:
+            usage = os.statvfs(self.disk_path)
+            raw["disk_total"] = usage.f_blocks * usage.f_frsize
+            raw["disk_free"] = usage.f_bavail * usage.f_frsize
+            raw["disk_used"] = (usage.f_blocks - usage.f_bfree) * usage.f_frsize
+        except OSError:
+            raw["disk_total"] = raw["disk_free"] = raw["disk_used"] = 0
+        
+        return raw
+    
+    def build_snapshot(self, raw, previous):
+        """Compute percentages and rates against the previous tick"""
+        interval = raw["time"] - previous["time"] if previous else 0.0
+        
+        if raw["cpu"] is not None:
+            def busy_percent(now, before):
+                total = now[1] - before[1]
+                return max(0.0, min(100.0, (now[0] - before[0]) * 100.0 / total)) if total > 0 else 0.0
+            
+            if previous and len(previous["cpu"]) == len(raw["cpu"]):
+                percents = [busy_percent(n, b) for n, b in zip(raw["cpu"], previous["cpu"])]
+            else:
+                # First tick: average since boot
+                percents = [busy * 100.0 / total if total else 0.0 for busy, total in raw["cpu"]]
+            cpu_percent = percents[0]
+            per_cpu = tuple(percents[1:])
+        else:
+            cpu_percent = raw["cpu_percent"]
+            per_cpu = raw["per_cpu_percent"]
+        
+        def rate(key, index):
+            if not previous or interval <= 0:
+                return 0.0
+            return max(0, raw[key][index] - previous[key][index]) / interval
+        
+        memory_used = raw["memory_total"] - raw["memory_available"]
+        swap_used = raw["swap_total"] - raw["swap_free"]
+        disk_capacity = raw["disk_used"] + raw["disk_free"]
+        
+        return SystemSnapshot(
+            timestamp=time.time(),
+            interval=interval,
+            cpu_percent=cpu_percent,
+            per_cpu_percent=per_cpu,
+            cpu_count=len(per_cpu) or 1,
+            memory_total=raw["memory_total"],
+            memory_available=raw["memory_available"],
+            memory_used=memory_used,
+            memory_percent=memory_used * 100.0 / raw["memory_total"] if raw["memory_total"] else 0.0,
+            swap_total=raw["swap_total"],
+            swap_used=swap_used,
+            swap_percent=swap_used * 100.0 / raw["swap_total"] if raw["swap_total"] else 0.0,
+            disk_total=raw["disk_total"],
+            disk_used=raw["disk_used"],
+            disk_percent=raw["disk_used"] * 100.0 / disk_capacity if disk_capacity else 0.0,
+            net_bytes_recv=raw["net"][0],
+            net_bytes_sent=raw["net"][1],
+            net_recv_rate=rate("net", 0),
+            net_sent_rate=rate("net", 1),
+            disk_read_bytes=raw["disk_io"][0],
+            disk_write_bytes=raw["disk_io"][1],
+            disk_read_rate=rate("disk_io", 0),
+            disk_write_rate=rate("disk_io", 1)
+        )
+    
+    def sample(self):
+        """Take one reading, publish it to subscribers and return it"""
+        raw = self.read_raw()
+        snapshot = self.build_snapshot(raw, self.previous_raw)
+        self.previous_raw = raw
+        self.latest = snapshot
+        self.samples += 1
+        
+        with self.lock:
+            subscribers = list(self.subscribers.values())
+        
+        for callback in subscribers:
+            try:
+                callback(snapshot)
+            except Exception as e:
+                logger.error(f"System sampler subscriber error: {e}")
+        
+        return snapshot
+    
+    def get_snapshot(self):
+        """Return the latest snapshot, sampling once if none exists yet"""
+        return self.latest or self.sample()
+
+system_sampler = SystemSampler()
+
+# Connectivity Monitor
+class ConnectivityMonitor:
+    """Track internet connectivity from link and route changes"""
+    
+    RTMGRP_LINK = 0x1
+    RTMGRP_IPV4_IFADDR = 0x10
+    RTMGRP_IPV4_ROUTE = 0x40
+    RTMGRP_IPV6_IFADDR = 0x100
+    RTMGRP_IPV6_ROUTE = 0x400
+    
+    def __init__(self, host="8.8.8.8", port=53, timeout=3, recheck_interval=300,
+                 retry_interval=15, max_retry_interval=30):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.recheck_interval = recheck_interval
+        self.retry_interval = retry_interval
+        self.max_retry_interval = max_retry_interval
+        self.failures = 0
+        self.status = "unknown"
+        self.connected = False
+        self.has_route = False
+        self.last_check = 0
+        self.last_change = None
+        self.fingerprint = None
+        self.subscribers = {}
+        self.next_token = 0
+        self.lock = threading.Lock()
+        self.netlink = None
+        self.netlink_opened = False
+        self.checks = 0
+        
+    def open_netlink(self):
+        """Subscribe to kernel link, address and route notifications"""
+        try:
+            groups = (self.RTMGRP_LINK | self.RTMGRP_IPV4_IFADDR | self.RTMGRP_IPV4_ROUTE |
+                      self.RTMGRP_IPV6_IFADDR | self.RTMGRP_IPV6_ROUTE)
+            sock = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, 0)  # NETLINK_ROUTE
+            sock.bind((0, groups))
+            sock.setblocking(False)
+            return sock
+        except (AttributeError, OSError) as e:
+            logger.debug(f"Netlink unavailable, polling /proc/net/route: {e}")
+            return None
+    
+    def ensure_netlink(self):
+        """Open the netlink socket on first use rather than at construction"""
+        with self.lock:
+            if not self.netlink_opened:
+                self.netlink_opened = True
+                self.netlink = self.open_netlink()
+    
+    def subscribe(self, callback):
+        """Call callback(status) whenever connectivity changes"""
+        self.ensure_netlink()
+        with self.lock:
+            self.next_token += 1
+            self.subscribers[self.next_token] = callback
+            return self.next_token
+    
+    def unsubscribe(self, token):
+        """Stop delivering connectivity changes to a subscriber"""
+        with self.lock:
+            self.subscribers.pop(token, None)
+    
+    def drain_netlink(self):
+        """Return True if netlink reported any change since the last call"""
+        changed = False
+        while True:
+            try:
+                if not self.netlink.recv(65536):
+                    break
+                changed = True
+            except BlockingIOError:
+                break
+            except OSError:
+                # Receive buffer overrun: events were lost, assume a change
+                changed = True
+                break
+        return changed
+    
+    def read_fingerprint(self):
+        """Return the routing table and interface states, plus whether a default route exists"""
+        parts = []
+        has_route = False
+        
+        try:
+            with open("/proc/net/route", 'r') as f:
+                for line in f.readlines()[1:]:
+                    fields = line.split()
+                    if len(fields) >= 8:
+                        # Iface, Destination, Gateway, Flags and Mask; RefCnt and Use change constantly
+                        parts.append(" ".join(fields[i] for i in (0, 1, 2, 3, 7)))
+                        if fields[1] == "00000000" and int(fields[3], 16) & 0x1:
+                            has_route = True
+        except OSError:
+            has_route = True  # No routing table to inspect, let the probe decide
+        
+        try:
+            with open("/proc/net/ipv6_route", 'r') as f:
+                for line in f:
+                    fields = line.split()
+                    if len(fields) >= 10 and fields[9] != "lo":
+                        # Destination, prefix, next hop, flags and device, without the counters
+                        parts.append(" ".join(fields[i] for i in (0, 1, 4, 8, 9)))
+                        if fields[0] == "0" * 32 and fields[1] == "00":
+                            has_route = True
+        except OSError:
+            pass
+        
+        try:
+            for interface in sorted(os.listdir("/sys/class/net")):
+                try:
+                    with open(f"/sys/class/net/{interface}/operstate", 'r') as f:
+                        parts.append(f"{interface}={f.read().strip()}")
+                except OSError:
+                    continue
+        except OSError:
+            pass
+        
+        return hash(tuple(parts)), has_route
+    
+    def probe(self):
+        """Check that the configured host is reachable"""
+        try:
+            socket.create_connection((self.host, self.port), timeout=self.timeout).close()
+            return True
+        except OSError:
+            return False
+    
+    def poll(self, force=False):
+        """Re-check reachability only when links or routes changed, or a recheck is due
+        
+        Runs off the UI thread; returns the current status. A failed probe
+        with a default route is retried after a short backoff, the long
+        recheck interval only confirms a working connection.
+        """
+        self.ensure_netlink()
+        changed = force or self.fingerprint is None
+        if self.netlink:
+            changed = self.drain_netlink() or changed
+        
+        fingerprint, has_route = self.read_fingerprint()
+        if fingerprint != self.fingerprint:
+            changed = True
+        self.fingerprint = fingerprint
+        self.has_route = has_route
+        
+        interval = self.recheck_interval
+        if self.failures:
+            interval = min(self.retry_interval * 2 ** (self.failures - 1), self.max_retry_interval)
+        
+        if not changed and time.time() - self.last_check < interval:
+            return self.status
+        
+        # Without a default route there is nothing to probe
+        connected = self.probe() if has_route else False
+        self.failures = self.failures + 1 if has_route and not connected else 0
+        self.last_check = time.time()
+        self.checks += 1
+        self.set_status("connected" if connected else "disconnected")
+        return self.status
+    
+    def set_status(self, status):
+        """Store the new state and notify subscribers on transitions"""
+        previous = self.status
+        self.connected = status == "connected"
+        self.status = status
+        
+        if status == previous:
+            return
+        
+        self.last_change = time.time()
+        logger.info(f"Connectivity changed: {previous} -> {status}")
+        
+        with self.lock:
+            subscribers = list(self.subscribers.values())
+        
+        for callback in subscribers:
+            try:
+                callback(status, previous)
+            except Exception as e:
+                logger.error(f"Connectivity subscriber error: {e}")
+    
+    def get_state(self):
+        """Return the cached connectivity state"""
+        return {
+            "status": self.status,
+            "has_route": self.has_route,
+            "last_check": self.last_check,
+            "last_change": self.last_change,
+            "checks": self.checks,
+            "failures": self.failures,
+            "netlink": self.netlink is not None
+        }
+
+# Alert Rules
+class AlertEngine:
+    """Evaluate threshold rules with hysteresis, minimum duration and cooldown"""
+    
+    def __init__(self, rules, callback):
+        self.rules = [dict(rule) for rule in rules if rule.get("enabled", True)]
+        self.callback = callback
+        self.states = {}
+        self.lock = threading.Lock()
+        self.fired = 0
+        self.suppressed = 0
+    
+    def matching_metrics(self, rule, values):
+        """Yield (instance, value) pairs a rule applies to
+        
+        A rule for metric "temperature" also matches per-instance values
+        such as "temperature:coretemp/Core 0".
+        """
+        metric = rule["metric"]
+        for name, value in values.items():
+            if name == metric:
+                yield "", value
+            elif name.startswith(metric + ":"):
+                yield name[len(metric) + 1:], value
+    
+    def evaluate(self, values, now=None):
+        """Advance rule states with new metric values; only rules whose metric is present are touched"""
+        now = now if now is not None else time.time()
+        events = []
+        
+        with self.lock:
+            for rule in self.rules:
+                for instance, value in self.matching_metrics(rule, values):
+                    if value is None:
+                        continue
+                    event = self.update_state(rule, instance, float(value), now)
+                    if event:
+                        events.append(event)
+        
+        for event in events:
+            try:
+                self.callback(event)
+            except Exception as e:
+                logger.error(f"Alert callback error: {e}")
+        
+        return events
+    
+    def update_state(self, rule, instance, value, now):
+        """Apply one value to a rule instance and return an event on transitions"""
+        key = rule.get("key", rule["id"]).format(instance=instance) if instance else rule.get("key", rule["id"])
+        threshold = rule["threshold"]
+        clear = rule.get("clear", threshold)
+        state = self.states.setdefault(key, {
+            "state": "ok", "since": None, "peak": None, "last_fired": None
+        })
+        
+        if state["state"] == "ok":
+            if value <= threshold:
+                return None
+            state.update(state="pending", since=now, peak=value)
+        elif value > (clear if state["state"] == "firing" else threshold):
+            # Still above the threshold, or above the clear level once firing
+            state["peak"] = max(state["peak"], value)
+        else:
+            was_firing = state["state"] == "firing"
+            peak = state["peak"]
+            state.update(state="ok", since=None, peak=None)
+            if was_firing and rule.get("notify_resolved", False):
+                return self.make_event(rule, key, instance, "resolved", value, peak, now)
+            return None
+        
+        if state["state"] == "pending" and now - state["since"] >= rule.get("duration", 0):
+            state["state"] = "firing"
+            cooldown = rule.get("cooldown", 0)
+            if state["last_fired"] is not None and now - state["last_fired"] < cooldown:
+                self.suppressed += 1
+                return None
+            state["last_fired"] = now
+            self.fired += 1
+            return self.make_event(rule, key, instance, "firing", value, state["peak"], now)
+        
+        return None
+    
+    def make_event(self, rule, key, instance, status, value, peak, now):
+        """Build the event passed to the callback"""
+        fields = {"value": value, "peak": peak, "instance": instance, "threshold": rule["threshold"]}
+        return {
+            "rule": rule["id"],
+            "key": key,
+            "status": status,
+            "value": value,
+            "peak": peak,
+            "instance": instance,
+            "timestamp": now,
+            "title": rule.get("title", "System Alert").format(**fields),
+            "message": rule.get("message", "{value:.1f}").format(**fields),
+            "type": rule.get("type", "warning") if status == "firing" else "success",
+            "actions": rule.get("actions", [])
+        }
+    
+    def get_states(self):
+        """Return current rule states keyed by dedup key"""
+        with self.lock:
+            return {key: dict(state) for key, state in self.states.items()}
+
+# Background Service Runtime
+class ServiceRuntime:
+    """Run periodic background services as coroutines on one asyncio thread"""
+    
+    def __init__(self, name="Berke0S Services"):
+        self.name = name
+        self.services = {}
+        self.loop = None
+        self.thread = None
+        self.executors = {}
+        self.ready = threading.Event()
+        self.running = False
+        
+    def add_service(self, name, func, interval, jitter=0.1, initial_delay=0,
+                    max_backoff=3600, blocking=False):
+        """Register a service step called every interval seconds
+        
+        The step may return a number of seconds to override the next
+        interval. Blocking steps run on a helper thread of their own, so
+        they stall neither the other services nor each other.
+        """
+        existing = self.services.get(name)
+        if existing and existing["task"] and self.loop:
+            self.loop.call_soon_threadsafe(existing["task"].cancel)
+        
+        self.services[name] = {
+            "func": func,
+            "interval": interval,
+            "jitter": jitter,
+            "initial_delay": initial_delay,
+            "max_backoff": max_backoff,
+            "blocking": blocking,
+            "task": None,
+            "stats": {
+                "state": "pending",
+                "runs": 0,
+                "errors": 0,
+                "consecutive_errors": 0,
+                "overruns": 0,
+                "last_run_ms": 0.0,
+                "max_run_ms": 0.0,
+                "total_run_ms": 0.0,
+                "last_error": None,
+                "last_run": None,
+                "next_run": None
             }
-            color = colors.get(notification["type"], "#4a9eff")
-            
-            header = tk.Frame(item_frame, bg=color, height=5)
-            header.pack(fill=tk.X)
-            
-            # Content
-            content = tk.Frame(item_frame, bg=self.wm.get_theme_color("bg"))
-            content.pack(fill=tk.X, padx=10, pady=5)
-            
-            # Title and timestamp
-            title_frame = tk.Frame(content, bg=self.wm.get_theme_color("bg"))
-            title_frame.pack(fill=tk.X)
+        }
+        
+        if self.running:
+            self.loop.call_soon_threadsafe(self.schedule, name)
+    
+    def start(self):
+        """Start the service thread and schedule all services"""
+        if self.running:
+            return
+        
+        self.running = True
+        self.thread = threading.Thread(target=self.run_loop, daemon=True, name=self.name)
+        self.thread.start()
+        self.ready.wait(timeout=5)
+    
+    def run_loop(self):
+        """Own the asyncio event loop for the lifetime of the runtime"""
+        try:
+            self.loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self.loop)
             
-            tk.Label(title_frame, text=notification["title"], 
-                    bg=self.wm.get_theme_color("bg"), fg=self.wm.get_theme_color("fg"),
-                    font=('Arial', 10, 'bold')).pack(side=tk.LEFT)
+            for name in self.services:
+                self.schedule(name)
             
-            timestamp = notification["timestamp"].strftime("%H:%M")
-            tk.Label(title_frame, text=timestamp, 
-                    bg=self.wm.get_theme_color("bg"), fg=self.wm.get_theme_color("fg"),
-                    font=('Arial', 8)).pack(side=tk.RIGHT)
+            self.loop.call_soon(self.ready.set)
+            self.loop.run_forever()
             
-            # Message
-            tk.Label(content, text=notification["message"], 
-                    bg=self.wm.get_theme_color("bg"), fg=self.wm.get_theme_color("fg"),
-                    font=('Arial', 9), wraplength=450, justify=tk.LEFT).pack(anchor='w')
+            # Let cancelled services unwind before closing
+            pending = [s["task"] for s in self.services.values() if s["task"] and not s["task"].done()]
+            if pending:
+                self.loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            self.loop.close()
             
         except Exception as e:
-            logger.error(f"History item creation error: {e}")
+            logger.error(f"Service runtime error: {e}")
+        finally:
+            self.running = False
+            self.ready.set()
+    
+    def schedule(self, name):
+        """Create the coroutine task for a registered service"""
+        service = self.services[name]
+        if service["task"] is None or service["task"].done():
+            service["task"] = self.loop.create_task(self.run_service(name, service))
+    
+    async def run_service(self, name, service):
+        """Service coroutine: run the step, then sleep for interval, jitter or backoff"""
+        stats = service["stats"]
+        delay = service["initial_delay"]
+        
+        try:
+            while True:
+                if delay > 0:
+                    stats["state"] = "sleeping"
+                    stats["next_run"] = time.time() + delay
+                    await asyncio.sleep(delay)
+                
+                stats["state"] = "running"
+                start = time.perf_counter()
+                
+                try:
+                    if service["blocking"]:
+                        result = await self.loop.run_in_executor(self.get_executor(name), service["func"])
+                    else:
+                        result = service["func"]()
+                    
+                    interval = result if isinstance(result, (int, float)) else service["interval"]
+                    stats["consecutive_errors"] = 0
+                    delay = interval * (1 + random.uniform(-service["jitter"], service["jitter"]))
+                    
+                except Exception as e:
+                    interval = service["interval"]
+                    stats["errors"] += 1
+                    stats["consecutive_errors"] += 1
+                    stats["last_error"] = str(e)
+                    delay = min(interval * (2 ** stats["consecutive_errors"]), service["max_backoff"])
+                    logger.error(f"Service {name} error: {e} (retrying in {delay:.0f}s)")
+                
+                elapsed = (time.perf_counter() - start) * 1000
+                stats["runs"] += 1
+                stats["last_run"] = time.time()
+                stats["last_run_ms"] = elapsed
+                stats["total_run_ms"] += elapsed
+                stats["max_run_ms"] = max(stats["max_run_ms"], elapsed)
+                if elapsed > interval * 1000:
+                    stats["overruns"] += 1
+                    logger.warning(f"Service {name} overran its {interval}s interval ({elapsed:.0f}ms)")
+                
+        except asyncio.CancelledError:
+            stats["state"] = "cancelled"
+            stats["next_run"] = None
+            raise
+    
+    def get_executor(self, name):
+        """Return the helper thread that runs a blocking service's steps"""
+        executor = self.executors.get(name)
+        if executor is None:
+            import concurrent.futures
+            executor = self.executors[name] = concurrent.futures.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix=f"Berke0S {name}")
+        return executor
+    
+    def stop(self, timeout=5):
+        """Cancel all services and stop the event loop"""
+        if not self.running or not self.loop:
+            return
+        
+        def cancel_all():
+            for service in self.services.values():
+                if service["task"] and not service["task"].done():
+                    service["task"].cancel()
+            self.loop.call_soon(self.loop.stop)
+        
+        try:
+            self.loop.call_soon_threadsafe(cancel_all)
+            self.thread.join(timeout=timeout)
+            for executor in self.executors.values():
+                executor.shutdown(wait=False)
+            logger.info("Service runtime stopped")
+        except Exception as e:
+            logger.error(f"Service runtime stop error: {e}")
+    
+    def get_stats(self):
+        """Return per-service run-time and overrun statistics"""
+        stats = {}
+        for name, service in self.services.items():
+            service_stats = dict(service["stats"])
+            runs = service_stats["runs"]
+            service_stats["avg_run_ms"] = service_stats["total_run_ms"] / runs if runs else 0.0
+            service_stats["interval"] = service["interval"]
+            stats[name] = service_stats
+        return stats
+
+# Central frame-clock animator
+class Animator:
+    """Advance every active tween from a single Tk timer
     
-    def clear_all_notifications(self):
-        """Clear all notifications and history"""
-        # Close all active notifications
-        for notification in self.notifications.copy():
-            self.close_notification(notification)
+    Progress is derived from elapsed time, so when the event loop runs
+    late the next tick simply jumps ahead instead of queueing frames.
+    """
+    
+    def __init__(self, wm, fps=60):
+        self.wm = wm
+        self.fps = max(1, fps)
+        self.frame_interval = 1.0 / self.fps
+        self.tweens = {}
+        self.sequence = 0
+        self.timer = None
+        self.timer_root = None
+        self.last_tick = None
+        self.stats = {"started": 0, "completed": 0, "cancelled": 0, "frames": 0, "dropped_frames": 0, "timers": 0}
+    
+    def enabled(self):
+        """Check whether animations are enabled"""
+        return self.wm.config.get("desktop", {}).get("effects", True)
+    
+    def get_duration(self, scale=1.0):
+        """Get a tween duration in seconds from desktop.animation_speed"""
+        return self.wm.config.get("desktop", {}).get("animation_speed", 300) * scale / 1000.0
+    
+    def animate(self, widget, step, duration=None, on_done=None, on_cancel=None, key=None, ease=None):
+        """Start a tween calling step(progress) every frame until progress reaches 1
         
-        # Clear history
-        self.notification_history.clear()
+        A tween with the same key replaces the running one. When effects are
+        disabled the final frame is applied immediately.
+        """
+        if key is None:
+            self.sequence += 1
+            key = self.sequence
+        self.cancel(key)
+        
+        if duration is None:
+            duration = self.get_duration()
+        
+        if not self.enabled() or duration <= 0 or self.wm.root is None:
+            step(1.0)
+            if on_done:
+                on_done()
+            return None
+        
+        self.tweens[key] = {
+            "widget": widget,
+            "step": step,
+            "ease": ease,
+            "on_done": on_done,
+            "on_cancel": on_cancel,
+            "start": time.monotonic(),
+            "duration": duration
+        }
+        self.stats["started"] += 1
+        self.ensure_timer()
+        return key
+    
+    def cancel(self, key, finish=False):
+        """Cancel a tween, optionally applying its final frame"""
+        tween = self.tweens.pop(key, None)
+        if tween is None:
+            return False
+        
+        if finish:
+            try:
+                tween["step"](1.0)
+                if tween["on_done"]:
+                    tween["on_done"]()
+            except Exception as e:
+                logger.error(f"Animation finish error: {e}")
+        else:
+            self.stats["cancelled"] += 1
+            try:
+                if tween["on_cancel"]:
+                    tween["on_cancel"]()
+            except Exception as e:
+                logger.error(f"Animation cancel error: {e}")
+        return True
+    
+    def cancel_widget(self, widget):
+        """Cancel every tween attached to a widget"""
+        for key in [key for key, tween in self.tweens.items() if tween["widget"] is widget]:
+            self.cancel(key)
+    
+    def ensure_timer(self):
+        """Schedule the frame clock if it is not already running"""
+        if self.timer is not None:
+            return
+        
+        root = self.wm.root
+        self.timer_root = root
+        self.last_tick = time.monotonic()
+        self.timer = root.after(int(self.frame_interval * 1000), self.tick)
+        self.stats["timers"] += 1
+    
+    def tick(self):
+        """Advance all active tweens by one frame"""
+        self.timer = None
+        now = time.monotonic()
+        
+        if self.last_tick is not None:
+            late = int((now - self.last_tick) / self.frame_interval) - 1
+            if late > 0:
+                self.stats["dropped_frames"] += late
+        self.last_tick = now
+        self.stats["frames"] += 1
+        
+        for key, tween in list(self.tweens.items()):
+            if self.tweens.get(key) is not tween:
+                continue
+            
+            try:
+                if not tween["widget"].winfo_exists():
+                    self.tweens.pop(key, None)
+                    self.stats["cancelled"] += 1
+                    if tween["on_cancel"]:
+                        tween["on_cancel"]()
+                    continue
+                
+                progress = min(1.0, (now - tween["start"]) / tween["duration"])
+                tween["step"](tween["ease"](progress) if tween["ease"] else progress)
+                
+                if progress >= 1.0:
+                    self.tweens.pop(key, None)
+                    self.stats["completed"] += 1
+                    if tween["on_done"]:
+                        tween["on_done"]()
+            except Exception as e:
+                logger.error(f"Animation tick error: {e}")
+                # A failed step still cancels the tween so its owner can clean up;
+                # callbacks that raised after the pop are not run twice
+                if self.tweens.get(key) is tween:
+                    self.tweens.pop(key, None)
+                    self.stats["cancelled"] += 1
+                    if tween["on_cancel"]:
+                        try:
+                            tween["on_cancel"]()
+                        except Exception as e:
+                            logger.error(f"Animation cancel error: {e}")
+        
+        if self.tweens:
+            try:
+                elapsed = time.monotonic() - now
+                delay = max(1, int((self.frame_interval - elapsed) * 1000))
+                self.timer = self.timer_root.after(delay, self.tick)
+            except Exception as e:
+                logger.error(f"Animation scheduling error: {e}")
+                self.tweens.clear()
+        else:
+            self.last_tick = None
+    
+    def stop(self):
+        """Cancel all tweens and the frame clock"""
+        self.tweens.clear()
+        if self.timer is not None:
+            try:
+                self.timer_root.after_cancel(self.timer)
+            except Exception:
+                pass
+            self.timer = None
+    
+    def get_stats(self):
+        """Return animator statistics"""
+        stats = dict(self.stats)
+        stats["active"] = len(self.tweens)
+        stats["fps"] = self.fps
+        return stats
+
+    def ease_out(self, progress):
+        """Cubic ease-out curve"""
+        return 1 - (1 - progress) ** 3
+
+# Processed wallpaper cache
+class WallpaperCache:
+    """Content-addressed cache of resized and blurred wallpapers
+    
+    Entries are keyed on the source file hash, mode, blur radius and screen
+    size. Decoded images stay in a small LRU; processed results are also
+    written to disk so they survive restarts, up to max_disk_mb.
+    """
+    
+    def __init__(self, cache_dir=WALLPAPER_CACHE_DIR, max_entries=4, max_disk_mb=64):
+        self.cache_dir = cache_dir
+        self.max_entries = max(1, max_entries)
+        self.max_disk_bytes = max(1, max_disk_mb) * 1024 * 1024
+        self.images = collections.OrderedDict()
+        self.rendering = {}
+        self.digests = {}
+        self.lock = threading.Lock()
+        self.stats = {"hits": 0, "disk_hits": 0, "misses": 0, "errors": 0, "evicted": 0}
+    
+    def source_digest(self, path):
+        """Hash a source file, reusing the result while its size and mtime are unchanged"""
+        stat = os.stat(path)
+        signature = (path, stat.st_size, stat.st_mtime_ns)
+        digest = self.digests.get(signature)
+        if digest is None:
+            sha = hashlib.sha1()
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                    sha.update(chunk)
+            digest = sha.hexdigest()
+            self.digests[signature] = digest
+        return digest
+    
+    def make_key(self, path, mode, blur, size):
+        """Build the cache key for a processed wallpaper"""
+        return f"{self.source_digest(path)}-{mode}-b{blur}-{size[0]}x{size[1]}"
+    
+    def get(self, path, mode, blur, size):
+        """Return (key, image) for a processed wallpaper, rendering it on a miss"""
+        key = self.make_key(path, mode, blur, size)
+        
+        # Rendering happens outside the lock; concurrent requests for the
+        # same key wait for the first one instead of rendering it twice
+        while True:
+            with self.lock:
+                img = self.images.get(key)
+                if img is not None:
+                    self.images.move_to_end(key)
+                    self.stats["hits"] += 1
+                    return key, img
+                
+                pending = self.rendering.get(key)
+                if pending is None:
+                    pending = self.rendering[key] = threading.Event()
+                    break
+            pending.wait()
+        
+        try:
+            img = self.load(key, path, mode, blur, size)
+            with self.lock:
+                self.images[key] = img
+                while len(self.images) > self.max_entries:
+                    self.images.popitem(last=False)
+            return key, img
+        finally:
+            with self.lock:
+                self.rendering.pop(key, None)
+            pending.set()
+    
+    def load(self, key, path, mode, blur, size):
+        """Read a processed wallpaper from disk, or render and store it"""
+        cache_path = os.path.join(self.cache_dir, f"{key}.png")
+        if os.path.exists(cache_path):
+            try:
+                img = Image.open(cache_path)
+                img.load()
+                os.utime(cache_path)
+                with self.lock:
+                    self.stats["disk_hits"] += 1
+                return img
+            except Exception as e:
+                logger.warning(f"Discarding unreadable wallpaper cache {cache_path}: {e}")
+        
+        with self.lock:
+            self.stats["misses"] += 1
+        img = self.process(Image.open(path), mode, blur, size)
+        try:
+            tmp_path = f"{cache_path}.tmp"
+            img.save(tmp_path, "PNG")
+            os.replace(tmp_path, cache_path)
+            self.prune_disk()
+        except Exception as e:
+            with self.lock:
+                self.stats["errors"] += 1
+            logger.warning(f"Wallpaper cache write error: {e}")
+        return img
+    
+    def prune_disk(self):
+        """Delete the least recently used cache files beyond the size limit"""
+        files = []
+        total = 0
+        try:
+            for entry in os.scandir(self.cache_dir):
+                if entry.is_file() and entry.name.endswith(".png"):
+                    stat = entry.stat()
+                    files.append((stat.st_mtime, stat.st_size, entry.path))
+                    total += stat.st_size
+        except OSError as e:
+            logger.warning(f"Wallpaper cache scan error: {e}")
+            return
+        
+        files.sort()
+        # The newest file is always kept, even when it alone exceeds the limit
+        for mtime, file_size, file_path in files[:-1]:
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(file_path)
+                total -= file_size
+                with self.lock:
+                    self.stats["evicted"] += 1
+            except OSError as e:
+                logger.warning(f"Wallpaper cache eviction error: {e}")
+    
+    def process(self, img, mode, blur, size):
+        """Apply the wallpaper mode and blur to a source image"""
+        screen_width, screen_height = size
+        img = img.convert('RGB')
+        
+        if mode == "stretch":
+            img = img.resize((screen_width, screen_height), Image.LANCZOS)
+        elif mode == "fit":
+            img.thumbnail((screen_width, screen_height), Image.LANCZOS)
+        elif mode == "center":
+            # Center the image
+            bg = Image.new('RGB', (screen_width, screen_height), (0, 0, 0))
+            x = (screen_width - img.width) // 2
+            y = (screen_height - img.height) // 2
+            bg.paste(img, (x, y))
+            img = bg
+        elif mode == "tile":
+            # Tile the image
+            bg = Image.new('RGB', (screen_width, screen_height))
+            for x in range(0, screen_width, img.width):
+                for y in range(0, screen_height, img.height):
+                    bg.paste(img, (x, y))
+            img = bg
+        
+        if blur > 0:
+            img = img.filter(ImageFilter.GaussianBlur(radius=blur))
+        
+        return img
+    
+    def get_stats(self):
+        """Return cache statistics"""
+        with self.lock:
+            stats = dict(self.stats)
+            stats["entries"] = len(self.images)
+        return stats
 
 # Enhanced Window Manager with improved display management
 class WindowManager:
@@ -3637,6 +6658,8 @@ class WindowManager:
         self.taskbar = None
         self.start_menu = None
         self.wallpaper_image = None
+        self.wallpaper_item = None
+        self.wallpaper_photos = collections.OrderedDict()
         self.themes = self.load_themes()
         self.shortcuts = {}
         self.running_apps = {}
@@ -3645,18 +6668,45 @@ class WindowManager:
         self.workspace_manager = None
         self.plugin_manager = None
         self.performance_monitor = None
-        self.display_manager = DisplayManager()
+        self.service_runtime = None
+        self.sampler_token = None
+        self.cpu_indicator_level = None
+        self.indicator_states = {}
+        self.connectivity_token = None
+        self.connectivity_monitor = ConnectivityMonitor(
+            host=self.config.get("network", {}).get("connectivity_host", "8.8.8.8"),
+            port=self.config.get("network", {}).get("connectivity_port", 53),
+            recheck_interval=self.config.get("network", {}).get("connectivity_recheck", 300),
+            retry_interval=self.config.get("network", {}).get("connectivity_retry", 15),
+            max_retry_interval=self.config.get("network", {}).get("connectivity_retry_max", 30)
+        )
+        self.display_manager = DisplayManager(self.config.get("display", {}))
         
         # Initialize enhanced features
         self.init_virtual_desktops()
         self.init_plugin_system()
         self.init_performance_monitoring()
+        self.init_ui_dispatch()
+        self.init_alerts()
+        self.animator = Animator(self, self.config.get("desktop", {}).get("animation_fps", 60))
+        self.app_catalog = AppCatalog()
+        self.log_retention = LogRetention(database, self.config.get("log_retention", {}))
+        self.start_menu_window = None
+        self.start_menu_visible = False
+        self.search_after_id = None
+        # One entry per virtual desktop plus the main wallpaper, so switching never re-renders
+        desktop_config = self.config.get("desktop", {})
+        self.wallpaper_cache = WallpaperCache(
+            max_entries=max(desktop_config.get("wallpaper_cache_entries", 5), desktop_config.get("virtual_desktops", 4) + 1),
+            max_disk_mb=desktop_config.get("wallpaper_cache_max_mb", 64)
+        )
         
         # Initialize display with enhanced management
         self.setup_display_system()
         
         self.setup_ui()
     
+    @boot_tracer.traced()
     def setup_display_system(self):
         """Setup display system with enhanced management"""
         try:
@@ -3686,17 +6736,12 @@ class WindowManager:
     def log_display_event(self, event_type, status, message):
         """Log display events to database"""
         try:
-            conn = sqlite3.connect(DATABASE_FILE)
-            cursor = conn.cursor()
-            
-            cursor.execute(
+            database.execute(
                 "INSERT INTO display_logs (event_type, display_id, message, success) VALUES (?, ?, ?, ?)",
-                (event_type, self.display_manager.get_current_display(), message, 1 if status == "success" else 0)
+                (event_type, self.display_manager.get_current_display(), message, 1 if status == "success" else 0),
+                commit=True
             )
             
-            conn.commit()
-            conn.close()
-            
         except Exception as e:
             logger.error(f"Display event logging error: {e}")
     
@@ -3737,6 +6782,74 @@ class WindowManager:
         except Exception as e:
             logger.error(f"Performance monitoring initialization failed: {e}")
         
+    def init_ui_dispatch(self):
+        """Initialize the main-thread dispatch queue for background callers"""
+        self.ui_queue = {}
+        self.ui_queue_lock = threading.Lock()
+        self.ui_thread_id = threading.get_ident()
+        self.ui_sequence = 0
+        self.ui_pump_root = None
+        self.ui_dispatch_interval = self.config.get("desktop", {}).get("ui_dispatch_interval", 50)
+        self.ui_dispatch_batch = self.config.get("desktop", {}).get("ui_dispatch_batch", 20)
+        self.ui_dispatch_idle_interval = self.config.get("desktop", {}).get("ui_dispatch_idle_interval", 250)
+        self.ui_dispatch_stats = {"posted": 0, "coalesced": 0, "executed": 0, "errors": 0}
+    
+    def post_to_ui(self, func, *args, key=None, **kwargs):
+        """Run a callable on the Tk main thread
+        
+        Calls posted with the same key before the queue is drained are
+        coalesced so only the latest one runs.
+        """
+        with self.ui_queue_lock:
+            if key is None:
+                self.ui_sequence += 1
+                key = ("call", self.ui_sequence)
+            elif key in self.ui_queue:
+                del self.ui_queue[key]
+                self.ui_dispatch_stats["coalesced"] += 1
+            
+            self.ui_queue[key] = (func, args, kwargs)
+            self.ui_dispatch_stats["posted"] += 1
+        
+        if self.ui_pump_root is None and threading.get_ident() == self.ui_thread_id:
+            self.start_ui_pump()
+    
+    def start_ui_pump(self):
+        """Start draining the dispatch queue from the Tk event loop"""
+        if not self.root or self.ui_pump_root is self.root:
+            return
+        
+        self.ui_pump_root = self.root
+        self.root.after(self.ui_dispatch_interval, self.pump_ui_queue, self.root)
+    
+    def pump_ui_queue(self, root):
+        """Run a bounded batch of queued calls and reschedule"""
+        executed = 0
+        try:
+            for _ in range(self.ui_dispatch_batch):
+                with self.ui_queue_lock:
+                    if not self.ui_queue:
+                        break
+                    key = next(iter(self.ui_queue))
+                    func, args, kwargs = self.ui_queue.pop(key)
+                
+                executed += 1
+                try:
+                    func(*args, **kwargs)
+                    self.ui_dispatch_stats["executed"] += 1
+                except Exception as e:
+                    self.ui_dispatch_stats["errors"] += 1
+                    logger.error(f"UI dispatch error in {getattr(func, '__name__', func)}: {e}")
+        finally:
+            # Stop if the root this pump belongs to has been replaced or destroyed
+            if root is self.ui_pump_root:
+                # Poll less often while nothing is being posted
+                interval = self.ui_dispatch_interval if executed or self.ui_queue else self.ui_dispatch_idle_interval
+                try:
+                    root.after(interval, self.pump_ui_queue, root)
+                except Exception:
+                    self.ui_pump_root = None
+    
     def load_config(self):
         """Load enhanced configuration"""
         try:
@@ -3836,6 +6949,7 @@ class WindowManager:
             logger.error(f"Theme loading error: {e}")
             return builtin_themes
         
+    @boot_tracer.traced()
     def setup_ui(self):
         """Setup enhanced main UI with improved display handling"""
         try:
@@ -3872,6 +6986,9 @@ class WindowManager:
             # Bind window manager events
             self.root.protocol("WM_DELETE_WINDOW", self.safe_shutdown)
             
+            # Run calls posted by background services
+            self.start_ui_pump()
+            
             # Apply theme
             self.apply_theme()
             
@@ -3922,6 +7039,7 @@ class WindowManager:
             # Create minimal root for services
             self.root = tk.Tk()
             self.root.withdraw()  # Hide the window
+            self.start_ui_pump()
             
             # Start essential services only
             self.start_headless_services()
@@ -3933,22 +7051,19 @@ class WindowManager:
             # Ultimate fallback - console mode
             self.run_console_mode()
     
+    @boot_tracer.traced()
     def start_headless_services(self):
         """Start essential services for headless mode"""
         try:
             services = [
-                ("System Monitor", self.system_monitor_service),
-                ("Auto-Save", self.auto_save_service),
-                ("Performance Monitor", self.performance_monitor_service)
+                ("System Sampler", system_sampler.sample, 1, {"jitter": 0}),
+                ("System Monitor", self.system_monitor_service, 30, {}),
+                ("Auto-Save", self.auto_save_service, 300, {"initial_delay": 300}),
+                ("Performance Monitor", self.performance_monitor_service, 5, {}),
+                ("Log Retention", self.log_retention.step, self.log_retention.interval, {"blocking": True, "initial_delay": 120})
             ]
             
-            for service_name, service_func in services:
-                try:
-                    thread = threading.Thread(target=service_func, daemon=True, name=service_name)
-                    thread.start()
-                    logger.info(f"Started headless service: {service_name}")
-                except Exception as e:
-                    logger.error(f"Failed to start headless service {service_name}: {e}")
+            self.start_service_runtime(services)
             
         except Exception as e:
             logger.error(f"Headless services start error: {e}")
@@ -4001,6 +7116,17 @@ class WindowManager:
         try:
             if self.root:
                 self.root.configure(bg=self.get_theme_color("bg"))
+            
+            # Force indicators to re-render with the new colors
+            self.indicator_states.clear()
+            
+            # The start menu is rebuilt with the new colors next time it opens
+            if self.start_menu_window is not None:
+                self.start_menu_window.destroy()
+                self.start_menu_window = None
+                self.start_menu_visible = False
+            if hasattr(self, 'clock_label'):
+                self.update_system_indicators()
                 
             # Update existing windows
             for window_data in self.windows.values():
@@ -4012,6 +7138,7 @@ class WindowManager:
         except Exception as e:
             logger.error(f"Theme apply error: {e}")
     
+    @boot_tracer.traced()
     def create_desktop(self):
         """Create enhanced desktop area"""
         try:
@@ -4052,6 +7179,7 @@ class WindowManager:
         except Exception as e:
             logger.error(f"Desktop creation error: {e}")
     
+    @boot_tracer.traced()
     def create_taskbar(self):
         """Create enhanced taskbar with modern features"""
         try:
@@ -4198,8 +7326,13 @@ class WindowManager:
             # Clock click handler
             self.clock_label.bind("<Button-1>", self.show_calendar)
             
-            # Update clock
+            # Update clock and render indicators once; later updates are change-driven
             self.update_clock()
+            self.update_system_indicators()
+            self.root.after(
+                int(self.config.get("taskbar", {}).get("battery_update_interval", 60) * 1000),
+                self.update_slow_indicators
+            )
             
         except Exception as e:
             logger.error(f"System tray creation error: {e}")
@@ -4295,6 +7428,7 @@ class WindowManager:
         except Exception as e:
             logger.error(f"System indicators error: {e}")
     
+    @boot_tracer.traced()
     def create_dock(self):
         """Create optional dock for favorite applications"""
         if self.config.get("desktop", {}).get("show_dock", False):
@@ -4336,6 +7470,7 @@ class WindowManager:
             except Exception as e:
                 logger.error(f"Dock creation error: {e}")
     
+    @boot_tracer.traced()
     def create_desktop_icons(self):
         """Create desktop icons for common applications"""
         try:
@@ -4415,33 +7550,45 @@ class WindowManager:
         except Exception as e:
             logger.error(f"Desktop icon creation error: {e}")
     
+    def set_indicator(self, name, widget, **options):
+        """Configure an indicator widget only when its rendered state changes"""
+        state = tuple(sorted(options.items()))
+        if self.indicator_states.get(name) == state:
+            return False
+        
+        widget.config(**options)
+        self.indicator_states[name] = state
+        return True
+    
     def update_clock(self):
         """Update system clock with enhanced format"""
         try:
             now = datetime.datetime.now()
+            system_config = self.config.get("system", {})
+            show_seconds = system_config.get("show_seconds", False)
             
             # Format based on user preference
-            if self.config.get("system", {}).get("24_hour_format", True):
-                time_str = now.strftime("%H:%M")
+            if system_config.get("24_hour_format", True):
+                time_str = now.strftime("%H:%M:%S" if show_seconds else "%H:%M")
             else:
-                time_str = now.strftime("%I:%M %p")
+                time_str = now.strftime("%I:%M:%S %p" if show_seconds else "%I:%M %p")
                 
             date_str = now.strftime("%a %d/%m")
             
-            self.clock_label.config(text=f"{time_str}\n{date_str}")
-            
-            # Update system indicators
-            self.update_system_indicators()
+            self.set_indicator("clock", self.clock_label, text=f"{time_str}\n{date_str}")
             
-            # Schedule next update
-            self.root.after(1000, self.update_clock)
+            # Wake up on the next second or minute boundary only
+            delay = 1000 - now.microsecond // 1000
+            if not show_seconds:
+                delay += (59 - now.second) * 1000
+            self.root.after(delay + 5, self.update_clock)
             
         except Exception as e:
             logger.error(f"Clock update error: {e}")
             self.root.after(5000, self.update_clock)  # Retry in 5 seconds
     
     def update_system_indicators(self):
-        """Update system status indicators"""
+        """Render every system status indicator from its current state"""
         try:
             # Update network status
             self.update_network_indicator()
@@ -4462,13 +7609,27 @@ class WindowManager:
         except Exception as e:
             logger.error(f"System indicators update error: {e}")
     
+    def update_slow_indicators(self):
+        """Refresh indicators that have no change notification, on a slow cadence"""
+        try:
+            self.update_volume_indicator()
+            
+            if hasattr(self, 'battery_indicator'):
+                self.update_battery_indicator()
+                
+        except Exception as e:
+            logger.error(f"Slow indicators update error: {e}")
+        finally:
+            interval = self.config.get("taskbar", {}).get("battery_update_interval", 60)
+            self.root.after(int(interval * 1000), self.update_slow_indicators)
+    
     def update_display_indicator(self):
         """Update display status indicator"""
         try:
             if self.display_manager.is_display_ready():
-                self.display_indicator.config(text="🖥️", fg=self.get_theme_color("success"))
+                self.set_indicator("display", self.display_indicator, text="🖥️", fg=self.get_theme_color("success"))
             else:
-                self.display_indicator.config(text="🖥️", fg=self.get_theme_color("error"))
+                self.set_indicator("display", self.display_indicator, text="🖥️", fg=self.get_theme_color("error"))
                 
         except Exception as e:
             logger.error(f"Display indicator update error: {e}")
@@ -4476,17 +7637,11 @@ class WindowManager:
     def update_network_indicator(self):
         """Update network connectivity indicator"""
         try:
-            # Check network connectivity
-            try:
-                socket.create_connection(("8.8.8.8", 53), timeout=3)
-                connected = True
-            except OSError:
-                connected = False
-            
-            if connected:
-                self.network_indicator.config(text="📶", fg=self.get_theme_color("success"))
+            # Cached state kept current by the connectivity monitor
+            if self.connectivity_monitor.connected:
+                self.set_indicator("network", self.network_indicator, text="📶", fg=self.get_theme_color("success"))
             else:
-                self.network_indicator.config(text="📵", fg=self.get_theme_color("error"))
+                self.set_indicator("network", self.network_indicator, text="📵", fg=self.get_theme_color("error"))
                 
         except Exception as e:
             logger.error(f"Network indicator update error: {e}")
@@ -4499,13 +7654,13 @@ class WindowManager:
             muted = self.config.get("audio", {}).get("mute", False)
             
             if muted or volume_level == 0:
-                self.volume_indicator.config(text="🔇")
+                self.set_indicator("volume", self.volume_indicator, text="🔇")
             elif volume_level < 30:
-                self.volume_indicator.config(text="🔈")
+                self.set_indicator("volume", self.volume_indicator, text="🔈")
             elif volume_level < 70:
-                self.volume_indicator.config(text="🔉")
+                self.set_indicator("volume", self.volume_indicator, text="🔉")
             else:
-                self.volume_indicator.config(text="🔊")
+                self.set_indicator("volume", self.volume_indicator, text="🔊")
                 
         except Exception as e:
             logger.error(f"Volume indicator update error: {e}")
@@ -4518,44 +7673,50 @@ class WindowManager:
                 if battery:
                     percent = battery.percent
                     plugged = battery.power_plugged
+                    fg = self.get_theme_color("fg")
                     
                     if plugged:
-                        self.battery_indicator.config(text="🔌")
-                    elif percent > 75:
-                        self.battery_indicator.config(text="🔋")
+                        text = "🔌"
                     elif percent > 50:
-                        self.battery_indicator.config(text="🔋")
+                        text = "🔋"
                     elif percent > 25:
-                        self.battery_indicator.config(text="🪫")
+                        text = "🪫"
                     else:
-                        self.battery_indicator.config(text="🪫", fg=self.get_theme_color("error"))
+                        text = "🪫"
+                        fg = self.get_theme_color("error")
+                    
+                    self.set_indicator("battery", self.battery_indicator, text=text, fg=fg)
                         
         except Exception as e:
             logger.error(f"Battery indicator update error: {e}")
     
-    def update_cpu_indicator(self):
+    def get_cpu_level(self, cpu_percent):
+        """Map CPU usage to the indicator color level"""
+        if cpu_percent > 80:
+            return "error"
+        elif cpu_percent > 60:
+            return "warning"
+        return "fg"
+    
+    def update_cpu_indicator(self, snapshot=None):
         """Update CPU usage indicator"""
         try:
-            if psutil:
-                cpu_percent = psutil.cpu_percent(interval=None)
-                
-                if cpu_percent > 80:
-                    self.cpu_indicator.config(fg=self.get_theme_color("error"))
-                elif cpu_percent > 60:
-                    self.cpu_indicator.config(fg=self.get_theme_color("warning"))
-                else:
-                    self.cpu_indicator.config(fg=self.get_theme_color("fg"))
+            snapshot = snapshot or system_sampler.latest
+            if snapshot:
+                level = self.get_cpu_level(snapshot.cpu_percent)
+                self.set_indicator("cpu", self.cpu_indicator, fg=self.get_theme_color(level))
                     
         except Exception as e:
             logger.error(f"CPU indicator update error: {e}")
     
+    @boot_tracer.traced()
     def load_wallpaper(self):
         """Load enhanced desktop wallpaper"""
         try:
             wallpaper_path = self.config.get("desktop", {}).get("wallpaper", "")
             wallpaper_mode = self.config.get("desktop", {}).get("wallpaper_mode", "stretch")
             
-            if wallpaper_path and os.path.exists(wallpaper_path) and PIL_AVAILABLE:
+            if wallpaper_path and os.path.exists(wallpaper_path) and pil_available():
                 self.load_custom_wallpaper(wallpaper_path, wallpaper_mode)
             else:
                 self.create_default_wallpaper()
@@ -4567,37 +7728,8 @@ class WindowManager:
     def load_custom_wallpaper(self, wallpaper_path, mode):
         """Load custom wallpaper with different modes"""
         try:
-            img = Image.open(wallpaper_path)
-            screen_width = self.root.winfo_screenwidth()
-            screen_height = self.root.winfo_screenheight()
-            
-            if mode == "stretch":
-                img = img.resize((screen_width, screen_height), Image.LANCZOS)
-            elif mode == "fit":
-                img.thumbnail((screen_width, screen_height), Image.LANCZOS)
-            elif mode == "center":
-                # Center the image
-                bg = Image.new('RGB', (screen_width, screen_height), (0, 0, 0))
-                x = (screen_width - img.width) // 2
-                y = (screen_height - img.height) // 2
-                bg.paste(img, (x, y))
-                img = bg
-            elif mode == "tile":
-                # Tile the image
-                bg = Image.new('RGB', (screen_width, screen_height))
-                for x in range(0, screen_width, img.width):
-                    for y in range(0, screen_height, img.height):
-                        bg.paste(img, (x, y))
-                img = bg
-            
-            # Apply effects if enabled
-            if self.config.get("desktop", {}).get("effects", True):
-                blur_radius = self.config.get("desktop", {}).get("blur_radius", 0)
-                if blur_radius > 0:
-                    img = img.filter(ImageFilter.GaussianBlur(radius=blur_radius))
-            
-            self.wallpaper_image = ImageTk.PhotoImage(img)
-            self.desktop.create_image(0, 0, anchor=tk.NW, image=self.wallpaper_image)
+            key, img = self.wallpaper_cache.get(wallpaper_path, mode, self.get_wallpaper_blur(), self.get_wallpaper_size())
+            self.show_wallpaper(self.get_wallpaper_photo(key, img))
             
             logger.info(f"Custom wallpaper loaded: {wallpaper_path}")
             
@@ -4605,75 +7737,157 @@ class WindowManager:
             logger.error(f"Custom wallpaper load error: {e}")
             self.create_default_wallpaper()
     
+    def get_wallpaper_size(self):
+        """Get the screen size wallpapers are rendered at"""
+        return self.root.winfo_screenwidth(), self.root.winfo_screenheight()
+    
+    def get_wallpaper_blur(self):
+        """Get the blur radius for custom wallpapers"""
+        if not self.config.get("desktop", {}).get("effects", True):
+            return 0
+        return self.config.get("desktop", {}).get("blur_radius", 0)
+    
+    def get_wallpaper_photo(self, key, img):
+        """Get the Tk image for a processed wallpaper, converting it once"""
+        photo = self.wallpaper_photos.get(key)
+        if photo is None:
+            photo = ImageTk.PhotoImage(img)
+            self.wallpaper_photos[key] = photo
+            while len(self.wallpaper_photos) > self.wallpaper_cache.max_entries:
+                self.wallpaper_photos.popitem(last=False)
+        else:
+            self.wallpaper_photos.move_to_end(key)
+        return photo
+    
+    def show_wallpaper(self, photo):
+        """Swap the desktop background image"""
+        self.wallpaper_image = photo
+        if self.wallpaper_item is not None and self.desktop.type(self.wallpaper_item):
+            self.desktop.itemconfig(self.wallpaper_item, image=photo)
+        else:
+            self.wallpaper_item = self.desktop.create_image(0, 0, anchor=tk.NW, image=photo)
+        self.desktop.tag_lower(self.wallpaper_item)
+    
+    def prerender_wallpapers(self):
+        """Render every configured desktop wallpaper in a background worker"""
+        if not pil_available() or not self.root:
+            return
+        
+        try:
+            size = self.get_wallpaper_size()
+            blur = self.get_wallpaper_blur()
+            
+            jobs = []
+            desktop_config = self.config.get("desktop", {})
+            if desktop_config.get("wallpaper"):
+                jobs.append((desktop_config["wallpaper"], desktop_config.get("wallpaper_mode", "stretch")))
+            for desktop in self.virtual_desktops:
+                if desktop.get("wallpaper"):
+                    jobs.append((desktop["wallpaper"], "stretch"))
+            
+            jobs = list(dict.fromkeys(job for job in jobs if os.path.exists(job[0])))
+            if not jobs:
+                return
+            
+            # Restored sessions can add desktops; both LRUs must hold every job
+            with self.wallpaper_cache.lock:
+                self.wallpaper_cache.max_entries = max(self.wallpaper_cache.max_entries, len(jobs))
+            
+            def worker():
+                for path, mode in jobs:
+                    try:
+                        key, img = self.wallpaper_cache.get(path, mode, blur, size)
+                        self.post_to_ui(self.get_wallpaper_photo, key, img, key=f"wallpaper:{key}")
+                    except Exception as e:
+                        logger.error(f"Wallpaper pre-render error for {path}: {e}")
+                logger.info(f"Pre-rendered {len(jobs)} wallpapers")
+            
+            threading.Thread(target=worker, name="WallpaperPrerender", daemon=True).start()
+            
+        except Exception as e:
+            logger.error(f"Wallpaper pre-render setup error: {e}")
+    
     def create_default_wallpaper(self):
         """Create enhanced default gradient wallpaper"""
         try:
-            if not PIL_AVAILABLE:
+            if not pil_available():
                 return
                 
             screen_width = self.root.winfo_screenwidth()
             screen_height = self.root.winfo_screenheight()
-            
-            # Create gradient image
-            img = Image.new('RGB', (screen_width, screen_height))
-            draw = ImageDraw.Draw(img)
-            
-            # Enhanced gradient based on theme
             theme_name = self.config.get("theme", "berke_dark")
+            effects = bool(self.config.get("desktop", {}).get("effects", True))
             
-            gradients = {
-                "berke_dark": [(15, 15, 35), (26, 26, 26), (40, 40, 60)],
-                "berke_light": [(240, 240, 240), (220, 220, 220), (200, 200, 200)],
-                "ocean": [(13, 27, 42), (3, 4, 94), (0, 119, 190)],
-                "forest": [(27, 67, 50), (45, 145, 108), (82, 183, 136)],
-                "tinycore": [(46, 52, 54), (85, 87, 83), (136, 138, 133)]
-            }
-            
-            colors = gradients.get(theme_name, gradients["berke_dark"])
+            # Rendered wallpapers are cached per theme, resolution and effects
+            cache_path = os.path.join(
+                WALLPAPER_CACHE_DIR,
+                f"default-v1-{theme_name}-{screen_width}x{screen_height}-{'fx' if effects else 'plain'}.png"
+            )
             
-            # Create multi-color gradient
-            for y in range(screen_height):
-                progress = y / screen_height
-                
-                if progress < 0.5:
-                    # First half
-                    ratio = progress * 2
-                    r = int(colors[0][0] + (colors[1][0] - colors[0][0]) * ratio)
-                    g = int(colors[0][1] + (colors[1][1] - colors[0][1]) * ratio)
-                    b = int(colors[0][2] + (colors[1][2] - colors[0][2]) * ratio)
-                else:
-                    # Second half
-                    ratio = (progress - 0.5) * 2
-                    r = int(colors[1][0] + (colors[2][0] - colors[1][0]) * ratio)
-                    g = int(colors[1][1] + (colors[2][1] - colors[1][1]) * ratio)
-                    b = int(colors[1][2] + (colors[2][2] - colors[1][2]) * ratio)
-                
-                draw.line([(0, y), (screen_width, y)], fill=(r, g, b))
+            img = None
+            if os.path.exists(cache_path):
+                try:
+                    img = Image.open(cache_path)
+                    img.load()
+                except Exception as e:
+                    logger.warning(f"Discarding unreadable wallpaper cache {cache_path}: {e}")
+                    img = None
             
-            # Add some texture/pattern
-            if self.config.get("desktop", {}).get("effects", True):
-                # Add subtle geometric pattern
-                pattern_color = (255, 255, 255, 20)  # Very transparent white
-                pattern_img = Image.new('RGBA', (screen_width, screen_height), (0, 0, 0, 0))
-                pattern_draw = ImageDraw.Draw(pattern_img)
-                
-                # Draw subtle lines
-                for x in range(0, screen_width, 100):
-                    pattern_draw.line([(x, 0), (x, screen_height)], fill=pattern_color, width=1)
-                for y in range(0, screen_height, 100):
-                    pattern_draw.line([(0, y), (screen_width, y)], fill=pattern_color, width=1)
-                
-                # Composite pattern onto background
-                img = Image.alpha_composite(img.convert('RGBA'), pattern_img).convert('RGB')
+            if img is None:
+                img = self.render_default_wallpaper(theme_name, screen_width, screen_height, effects)
+                try:
+                    tmp_path = f"{cache_path}.tmp"
+                    img.save(tmp_path, "PNG")
+                    os.replace(tmp_path, cache_path)
+                    self.wallpaper_cache.prune_disk()
+                except Exception as e:
+                    logger.warning(f"Wallpaper cache write error: {e}")
             
-            self.wallpaper_image = ImageTk.PhotoImage(img)
-            self.desktop.create_image(0, 0, anchor=tk.NW, image=self.wallpaper_image)
+            self.show_wallpaper(ImageTk.PhotoImage(img))
             
             logger.info("Default gradient wallpaper created")
             
         except Exception as e:
             logger.error(f"Default wallpaper creation error: {e}")
     
+    def render_default_wallpaper(self, theme_name, width, height, effects):
+        """Render the three-stop theme gradient with its grid pattern"""
+        gradients = {
+            "berke_dark": [(15, 15, 35), (26, 26, 26), (40, 40, 60)],
+            "berke_light": [(240, 240, 240), (220, 220, 220), (200, 200, 200)],
+            "ocean": [(13, 27, 42), (3, 4, 94), (0, 119, 190)],
+            "forest": [(27, 67, 50), (45, 145, 108), (82, 183, 136)],
+            "tinycore": [(46, 52, 54), (85, 87, 83), (136, 138, 133)]
+        }
+        
+        colors = gradients.get(theme_name, gradients["berke_dark"])
+        
+        # Build a single-pixel-wide column and let PIL stretch it across the screen
+        column = bytearray()
+        for y in range(height):
+            progress = y / height
+            
+            if progress < 0.5:
+                start, end, ratio = colors[0], colors[1], progress * 2
+            else:
+                start, end, ratio = colors[1], colors[2], (progress - 0.5) * 2
+            
+            column.extend(int(start[i] + (end[i] - start[i]) * ratio) for i in range(3))
+        
+        strip = Image.frombytes('RGB', (1, height), bytes(column))
+        img = strip.resize((width, height), Image.NEAREST)
+        
+        # Add subtle grid lines, blended as 20/255 white over the gradient
+        if effects:
+            line_strip = Image.blend(strip, Image.new('RGB', (1, height), (255, 255, 255)), 20 / 255)
+            for x in range(0, width, 100):
+                img.paste(line_strip, (x, 0))
+            
+            for y in range(0, height, 100):
+                img.paste(line_strip.getpixel((0, y)), (0, y, width, y + 1))
+        
+        return img
+    
     def bind_events(self):
         """Bind enhanced keyboard and mouse events"""
         try:
@@ -4716,218 +7930,187 @@ class WindowManager:
         except Exception as e:
             logger.error(f"Event binding error: {e}")
     
+    @boot_tracer.traced()
     def start_services(self):
         """Start enhanced background services"""
         try:
             services = [
-                ("System Monitor", self.system_monitor_service),
-                ("Auto-Save", self.auto_save_service),
-                ("Performance Monitor", self.performance_monitor_service),
-                ("Plugin Manager", self.plugin_service),
-                ("Network Monitor", self.network_monitor_service),
-                ("Backup Service", self.backup_service),
-                ("Display Monitor", self.display_monitor_service)  # New for V2
+                # name, step, interval, options
+                ("System Sampler", system_sampler.sample, 1, {"jitter": 0}),
+                ("System Monitor", self.system_monitor_service, 30, {}),
+                ("Auto-Save", self.auto_save_service, 300, {"initial_delay": 300}),
+                ("Performance Monitor", self.performance_monitor_service, 5, {}),
+                ("Plugin Manager", self.plugin_service, 3600, {}),
+                ("Network Monitor", self.connectivity_monitor.poll, 2, {"blocking": True, "jitter": 0}),
+                ("Backup Service", self.backup_service, 3600, {"blocking": True}),
+                ("Log Retention", self.log_retention.step, self.log_retention.interval, {"blocking": True, "initial_delay": 120}),
+                ("Display Monitor", self.display_monitor_service, 60, {"blocking": True})  # New for V2
             ]
             
-            for service_name, service_func in services:
-                try:
-                    thread = threading.Thread(target=service_func, daemon=True, name=service_name)
-                    thread.start()
-                    logger.info(f"Started service: {service_name}")
-                except Exception as e:
-                    logger.error(f"Failed to start service {service_name}: {e}")
-            
+            self.start_service_runtime(services)
             logger.info("Background services started")
             
         except Exception as e:
             logger.error(f"Services start error: {e}")
     
-    def display_monitor_service(self):
-        """Monitor display system health (new for V2)"""
-        while True:
+    def start_service_runtime(self, services):
+        """Register services with the shared runtime and start it"""
+        if self.service_runtime is None:
+            self.service_runtime = ServiceRuntime()
+        
+        if self.sampler_token is None:
+            self.sampler_token = system_sampler.subscribe(self.on_system_snapshot)
+        
+        if self.connectivity_token is None:
+            self.connectivity_token = self.connectivity_monitor.subscribe(self.network_monitor_service)
+        
+        for service_name, service_func, interval, options in services:
             try:
-                # Check display health
-                if self.display_manager.is_display_ready():
-                    # Test display connection
-                    try:
-                        result = subprocess.run(['xdpyinfo'], capture_output=True, timeout=5)
-                        if result.returncode != 0:
-                            logger.warning("Display connection test failed")
-                            self.notifications.send(
-                                "Display Warning",
-                                "Display connection issues detected",
-                                notification_type="warning"
-                            )
-                    except:
-                        pass
-                
-                time.sleep(60)  # Check every minute
-                
+                with boot_tracer.span(f"service:{service_name}", "services"):
+                    self.service_runtime.add_service(service_name, service_func, interval, **options)
+                logger.info(f"Started service: {service_name}")
             except Exception as e:
-                logger.error(f"Display monitor error: {e}")
-                time.sleep(120)
+                logger.error(f"Failed to start service {service_name}: {e}")
+        
+        self.service_runtime.start()
+    
+    def on_system_snapshot(self, snapshot):
+        """Forward a new system snapshot to the alert rules and taskbar indicators"""
+        self.alert_engine.evaluate({
+            "cpu_percent": snapshot.cpu_percent,
+            "memory_percent": snapshot.memory_percent,
+            "swap_percent": snapshot.swap_percent,
+            "disk_percent": snapshot.disk_percent
+        }, snapshot.timestamp)
+        
+        # Only wake the UI when the indicator color would change
+        level = self.get_cpu_level(snapshot.cpu_percent)
+        if hasattr(self, 'cpu_indicator') and level != self.cpu_indicator_level:
+            self.cpu_indicator_level = level
+            self.post_to_ui(self.update_cpu_indicator, snapshot, key="cpu_indicator")
     
-    def system_monitor_service(self):
-        """Enhanced system monitoring service"""
-        while True:
-            try:
-                if not psutil:
-                    time.sleep(60)
-                    continue
-                
-                # Monitor CPU usage
-                cpu_percent = psutil.cpu_percent(interval=1)
-                if cpu_percent > 90:
-                    self.notifications.send(
-                        "System Warning",
-                        f"High CPU usage: {cpu_percent:.1f}%",
-                        notification_type="warning",
-                        actions=[
-                            {"text": "Open Monitor", "callback": lambda: SystemMonitor(self).show()},
-                            {"text": "Dismiss", "callback": lambda: None}
-                        ]
-                    )
-                
-                # Monitor memory usage
-                memory = psutil.virtual_memory()
-                if memory.percent > 85:
-                    self.notifications.send(
-                        "System Warning", 
-                        f"High memory usage: {memory.percent:.1f}%",
+    def display_monitor_service(self):
+        """Monitor display system health (new for V2)"""
+        if hasattr(self, 'display_indicator'):
+            self.post_to_ui(self.update_display_indicator, key="display_indicator")
+        
+        # Check display health
+        if self.display_manager.is_display_ready():
+            # Test display connection
+            try:
+                current_display = self.display_manager.get_current_display()
+                if not self.display_manager.check_x_display(current_display):
+                    logger.warning("Display connection test failed")
+                    self.post_to_ui(
+                        self.notifications.send,
+                        "Display Warning",
+                        "Display connection issues detected",
                         notification_type="warning",
-                        actions=[
-                            {"text": "Free Memory", "callback": self.free_memory},
-                            {"text": "Open Monitor", "callback": lambda: SystemMonitor(self).show()}
-                        ]
-                    )
-                
-                # Monitor disk space
-                disk = psutil.disk_usage('/')
-                if disk.percent > 90:
-                    self.notifications.send(
-                        "System Warning",
-                        f"Low disk space: {disk.percent:.1f}% used",
-                        notification_type="error",
-                        actions=[
-                            {"text": "Clean Temp", "callback": self.clean_temp_files},
-                            {"text": "Open Disk", "callback": self.launch_file_manager}
-                        ]
+                        key="display_warning"
                     )
-                
-                # Monitor temperature (if available)
-                try:
-                    temps = psutil.sensors_temperatures()
-                    if temps:
-                        for name, entries in temps.items():
-                            for entry in entries:
-                                if entry.current > 80:  # 80°C threshold
-                                    self.notifications.send(
-                                        "Temperature Warning",
-                                        f"{name}: {entry.current:.1f}°C",
-                                        notification_type="warning"
-                                    )
-                except:
-                    pass
-                
-                time.sleep(30)  # Check every 30 seconds
-                
-            except Exception as e:
-                logger.error(f"System monitor error: {e}")
-                time.sleep(60)
+            except:
+                pass
+    
+    def init_alerts(self):
+        """Create the alert rule engine from configuration"""
+        alerts_config = self.config.get("alerts", {})
+        rules = alerts_config.get("rules", []) if alerts_config.get("enabled", True) else []
+        self.alert_engine = AlertEngine(rules, self.on_alert)
+        self.alert_actions = {
+            "open_monitor": {"text": "Open Monitor", "callback": lambda: self.launch_app("monitor")},
+            "dismiss": {"text": "Dismiss", "callback": lambda: None},
+            "free_memory": {"text": "Free Memory", "callback": self.free_memory},
+            "clean_temp": {"text": "Clean Temp", "callback": self.clean_temp_files},
+            "open_files": {"text": "Open Disk", "callback": self.launch_file_manager}
+        }
+    
+    def on_alert(self, event):
+        """Show a notification for an alert state transition"""
+        logger.info(f"Alert {event['key']} {event['status']}: {event['message']}")
+        self.post_to_ui(
+            self.notifications.send,
+            event["title"],
+            event["message"],
+            notification_type=event["type"],
+            actions=[self.alert_actions[a] for a in event["actions"] if a in self.alert_actions],
+            key=f"alert:{event['key']}"
+        )
+    
+    def system_monitor_service(self):
+        """Enhanced system monitoring service"""
+        # CPU, memory and disk rules are evaluated on every sampler tick;
+        # temperatures are read here at the slower service cadence
+        try:
+            temps = psutil.sensors_temperatures() if psutil else None
+            if temps:
+                values = {}
+                for name, entries in temps.items():
+                    for index, entry in enumerate(entries):
+                        values[f"temperature:{name}/{entry.label or index}"] = entry.current
+                self.alert_engine.evaluate(values)
+        except Exception as e:
+            logger.debug(f"Temperature read error: {e}")
     
     def auto_save_service(self):
         """Enhanced auto-save service"""
-        while True:
-            try:
-                time.sleep(300)  # Save every 5 minutes
-                self.save_session()
-                self.save_config()
-                
-                # Save plugin states
-                if self.plugin_manager:
-                    self.plugin_manager.save_plugin_states()
-                    
-                logger.debug("Auto-save completed")
-                
-            except Exception as e:
-                logger.error(f"Auto-save error: {e}")
+        # Window geometry is read from Tk, so the session is saved on the main thread
+        self.post_to_ui(self.save_session, key="save_session")
+        self.save_config()
+        
+        # Save plugin states
+        if self.plugin_manager:
+            self.plugin_manager.save_plugin_states()
+            
+        logger.debug("Auto-save completed")
     
     def performance_monitor_service(self):
         """Performance monitoring service"""
-        while True:
-            try:
-                if self.performance_monitor:
-                    self.performance_monitor.update_metrics()
-                time.sleep(5)  # Update every 5 seconds
-            except Exception as e:
-                logger.error(f"Performance monitor error: {e}")
-                time.sleep(30)
+        if self.performance_monitor:
+            self.performance_monitor.update_metrics()
     
     def plugin_service(self):
         """Plugin management service"""
-        while True:
-            try:
-                if self.plugin_manager:
-                    self.plugin_manager.check_plugin_updates()
-                time.sleep(3600)  # Check every hour
-            except Exception as e:
-                logger.error(f"Plugin service error: {e}")
-                time.sleep(3600)
+        if self.plugin_manager:
+            self.plugin_manager.check_plugin_updates()
     
-    def network_monitor_service(self):
-        """Network monitoring service"""
-        last_status = None
-        while True:
-            try:
-                # Check network connectivity
-                try:
-                    socket.create_connection(("8.8.8.8", 53), timeout=5)
-                    current_status = "connected"
-                except OSError:
-                    current_status = "disconnected"
-                
-                # Notify on status change
-                if last_status and last_status != current_status:
-                    if current_status == "connected":
-                        self.notifications.send(
-                            "Network Status",
-                            "Internet connection restored",
-                            notification_type="success"
-                        )
-                    else:
-                        self.notifications.send(
-                            "Network Status",
-                            "Internet connection lost",
-                            notification_type="error"
-                        )
-                
-                last_status = current_status
-                time.sleep(30)  # Check every 30 seconds
-                
-            except Exception as e:
-                logger.error(f"Network monitor error: {e}")
-                time.sleep(60)
+    def network_monitor_service(self, current_status, last_status):
+        """Notify on connectivity changes reported by the connectivity monitor"""
+        if hasattr(self, 'network_indicator'):
+            self.post_to_ui(self.update_network_indicator, key="network_indicator")
+        
+        # The first check only establishes the initial state
+        if last_status == "unknown":
+            return
+        
+        if current_status == "connected":
+            self.post_to_ui(
+                self.notifications.send,
+                "Network Status",
+                "Internet connection restored",
+                notification_type="success",
+                key="network_status"
+            )
+        else:
+            self.post_to_ui(
+                self.notifications.send,
+                "Network Status",
+                "Internet connection lost",
+                notification_type="error",
+                key="network_status"
+            )
     
     def backup_service(self):
         """Automatic backup service"""
-        while True:
-            try:
-                # Check if auto-backup is enabled
-                if not self.config.get("system", {}).get("auto_backup", False):
-                    time.sleep(3600)
-                    continue
-                
-                # Perform backup every 24 hours
-                backup_interval = self.config.get("system", {}).get("backup_interval", 24) * 3600
-                
-                # Create backup
-                self.create_system_backup()
-                
-                time.sleep(backup_interval)
-                
-            except Exception as e:
-                logger.error(f"Backup service error: {e}")
-                time.sleep(3600)
+        # Check if auto-backup is enabled
+        if not self.config.get("system", {}).get("auto_backup", False):
+            return 3600
+        
+        # Perform backup every 24 hours
+        backup_interval = self.config.get("system", {}).get("backup_interval", 24) * 3600
+        
+        # Create backup
+        self.create_system_backup()
+        return backup_interval
     
     # Enhanced utility methods
     def create_enhanced_tooltip(self, widget, title, description=None):
@@ -5092,6 +8275,9 @@ class WindowManager:
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_file = os.path.join(backup_dir, f"berke0s_backup_{timestamp}.tar.gz")
             
+            # Fold the WAL into the main file so the copy is complete
+            database.checkpoint()
+            
             with tarfile.open(backup_file, "w:gz") as tar:
                 tar.add(CONFIG_FILE, arcname="config.json")
                 tar.add(DATABASE_FILE, arcname="berke0s.db")
@@ -5103,48 +8289,48 @@ class WindowManager:
             logger.error(f"Backup creation error: {e}")
     
     # Application launcher methods
+    def launch_app(self, app_id, *args):
+        """Launch a registered application, loading its class on first use"""
+        app_id = app_registry.resolve(app_id)
+        if app_id is None:
+            return None
+        
+        if app_registry.is_single_instance(app_id) and app_id in self.running_apps:
+            # Bring existing window to front
+            self.running_apps[app_id].bring_to_front()
+            return self.running_apps[app_id]
+        
+        app = app_registry.create(app_id, self)
+        if app_registry.is_single_instance(app_id):
+            self.running_apps[app_id] = app
+        app.show(*args)
+        return app
+    
     def launch_file_manager(self):
         """Launch enhanced file manager"""
         try:
-            if "file_manager" not in self.running_apps:
-                app = FileManager(self)
-                self.running_apps["file_manager"] = app
-                app.show()
-            else:
-                # Bring existing window to front
-                self.running_apps["file_manager"].bring_to_front()
+            self.launch_app("filemanager")
         except Exception as e:
             logger.error(f"File manager launch error: {e}")
             
     def launch_web_browser(self):
         """Launch enhanced web browser"""
         try:
-            if "web_browser" not in self.running_apps:
-                app = WebBrowser(self)
-                self.running_apps["web_browser"] = app
-                app.show()
-            else:
-                self.running_apps["web_browser"].bring_to_front()
+            self.launch_app("browser")
         except Exception as e:
             logger.error(f"Web browser launch error: {e}")
             
     def launch_settings(self):
         """Launch enhanced settings"""
         try:
-            if "settings" not in self.running_apps:
-                app = SettingsApp(self)
-                self.running_apps["settings"] = app
-                app.show()
-            else:
-                self.running_apps["settings"].bring_to_front()
+            self.launch_app("settings")
         except Exception as e:
             logger.error(f"Settings launch error: {e}")
             
     def launch_terminal(self):
         """Launch enhanced terminal"""
         try:
-            app = Terminal(self)
-            app.show()
+            self.launch_app("terminal")
         except Exception as e:
             logger.error(f"Terminal launch error: {e}")
     
@@ -5152,8 +8338,8 @@ class WindowManager:
     def toggle_start_menu(self):
         """Toggle enhanced start menu"""
         try:
-            if hasattr(self, 'start_menu_window') and self.start_menu_window.winfo_exists():
-                self.start_menu_window.destroy()
+            if self.start_menu_visible:
+                self.hide_start_menu()
                 return
                 
             self.show_start_menu()
@@ -5162,12 +8348,20 @@ class WindowManager:
             logger.error(f"Start menu toggle error: {e}")
     
     def show_start_menu(self):
-        """Show enhanced start menu"""
+        """Show enhanced start menu, building it on first use"""
         try:
-            self.start_menu_window = tk.Toplevel(self.root)
-            self.start_menu_window.overrideredirect(True)
-            self.start_menu_window.configure(bg=self.get_theme_color("window"))
-            self.start_menu_window.attributes('-alpha', 0.98)
+            if self.start_menu_window is None or not self.start_menu_window.winfo_exists():
+                self.start_menu_window = tk.Toplevel(self.root)
+                self.start_menu_window.withdraw()
+                self.start_menu_window.overrideredirect(True)
+                self.start_menu_window.configure(bg=self.get_theme_color("window"))
+                self.start_menu_window.attributes('-alpha', 0.98)
+                
+                # Create enhanced menu content
+                self.create_enhanced_start_menu()
+                
+                # Auto-hide and focus handling
+                self.start_menu_window.bind('<FocusOut>', self.hide_start_menu)
             
             # Enhanced positioning
             taskbar_pos = self.config.get("taskbar", {}).get("position", "bottom")
@@ -5188,11 +8382,18 @@ class WindowManager:
             
             self.start_menu_window.geometry(f"{menu_width}x{menu_height}+{x}+{y}")
             
-            # Create enhanced menu content
-            self.create_enhanced_start_menu()
+            # Reset the menu to its opening state
+            if self.search_after_id is not None:
+                self.root.after_cancel(self.search_after_id)
+                self.search_after_id = None
+            self.start_menu_time_label.config(text=datetime.datetime.now().strftime("%H:%M, %A"))
+            self.search_entry.delete(0, tk.END)
+            self.search_entry.insert(0, "🔍 Search applications...")
+            self.switch_start_menu_tab("all")
             
-            # Auto-hide and focus handling
-            self.start_menu_window.bind('<FocusOut>', self.hide_start_menu)
+            self.start_menu_visible = True
+            self.start_menu_window.deiconify()
+            self.start_menu_window.lift()
             self.start_menu_window.focus_set()
             
             # Smooth appear animation
@@ -5204,7 +8405,8 @@ class WindowManager:
     def hide_start_menu(self, event=None):
         """Hide start menu with animation"""
         try:
-            if hasattr(self, 'start_menu_window'):
+            if self.start_menu_visible:
+                self.start_menu_visible = False
                 self.animate_start_menu("hide")
         except Exception as e:
             logger.error(f"Start menu hide error: {e}")
@@ -5212,30 +8414,27 @@ class WindowManager:
     def animate_start_menu(self, action):
         """Animate start menu appearance/disappearance"""
         try:
+            menu = self.start_menu_window
+            
             if action == "show":
-                self.start_menu_window.attributes('-alpha', 0)
+                menu.attributes('-alpha', 0)
                 
-                def fade_in(alpha=0):
-                    if alpha <= 0.98:
-                        self.start_menu_window.attributes('-alpha', alpha)
-                        self.root.after(20, lambda: fade_in(alpha + 0.1))
-                        
-                fade_in()
+                def fade_in(progress):
+                    menu.attributes('-alpha', 0.98 * progress)
+                
+                self.animator.animate(menu, fade_in, self.animator.get_duration(0.7), key="start_menu")
                 
             elif action == "hide":
-                def fade_out(alpha=0.98):
-                    if alpha >= 0:
-                        self.start_menu_window.attributes('-alpha', alpha)
-                        self.root.after(20, lambda: fade_out(alpha - 0.1))
-                    else:
-                        self.start_menu_window.destroy()
-                        
-                fade_out()
+                def fade_out(progress):
+                    menu.attributes('-alpha', 0.98 * (1 - progress))
+                
+                self.animator.animate(menu, fade_out, self.animator.get_duration(0.7),
+                                      on_done=menu.withdraw, key="start_menu")
                 
         except Exception as e:
             logger.error(f"Start menu animation error: {e}")
-            if hasattr(self, 'start_menu_window'):
-                self.start_menu_window.destroy()
+            if self.start_menu_window is not None:
+                self.start_menu_window.withdraw()
     
     def create_enhanced_start_menu(self):
         """Create enhanced start menu with modern design"""
@@ -5269,8 +8468,9 @@ class WindowManager:
                     bg=self.get_theme_color("accent"), fg="white").pack(anchor='w')
             
             current_time = datetime.datetime.now().strftime("%H:%M, %A")
-            tk.Label(info_frame, text=current_time, font=('Arial', 9),
-                    bg=self.get_theme_color("accent"), fg="white").pack(anchor='w')
+            self.start_menu_time_label = tk.Label(info_frame, text=current_time, font=('Arial', 9),
+                                                 bg=self.get_theme_color("accent"), fg="white")
+            self.start_menu_time_label.pack(anchor='w')
             
             # Version info
             tk.Label(info_frame, text="Berke0S V2", font=('Arial', 8),
@@ -5322,26 +8522,24 @@ class WindowManager:
             apps_container = tk.Frame(content_frame, bg=self.get_theme_color("window"))
             apps_container.pack(fill=tk.BOTH, expand=True)
             
-            # Scrollable applications list
-            self.apps_canvas = tk.Canvas(apps_container, bg=self.get_theme_color("window"),
-                                        highlightthickness=0)
-            apps_scrollbar = tk.Scrollbar(apps_container, orient="vertical", 
-                                         command=self.apps_canvas.yview)
-            self.apps_scrollable_frame = tk.Frame(self.apps_canvas, bg=self.get_theme_color("window"))
-            
-            self.apps_scrollable_frame.bind(
-                "<Configure>",
-                lambda e: self.apps_canvas.configure(scrollregion=self.apps_canvas.bbox("all"))
-            )
+            # Fixed pool of application rows scrolled over the result list
+            self.apps_scrollbar = tk.Scrollbar(apps_container, orient="vertical",
+                                              command=self.scroll_start_menu)
+            self.apps_scrollbar.pack(side="right", fill="y")
             
-            self.apps_canvas.create_window((0, 0), window=self.apps_scrollable_frame, anchor="nw")
-            self.apps_canvas.configure(yscrollcommand=apps_scrollbar.set)
+            rows_frame = tk.Frame(apps_container, bg=self.get_theme_color("window"))
+            rows_frame.pack(side="left", fill="both", expand=True)
             
-            self.apps_canvas.pack(side="left", fill="both", expand=True)
-            apps_scrollbar.pack(side="right", fill="y")
+            self.start_menu_rows = []
+            self.start_menu_results = []
+            self.start_menu_offset = 0
+            for index in range(self.config.get("start_menu", {}).get("visible_rows", 5)):
+                self.start_menu_rows.append(self.create_start_menu_app_item(rows_frame))
             
-            # Load applications
-            self.load_start_menu_applications()
+            for widget in [rows_frame] + [part for row in self.start_menu_rows for part in (row["button"], row["desc"])]:
+                widget.bind("<MouseWheel>", self.on_start_menu_wheel)
+                widget.bind("<Button-4>", lambda e: self.scroll_start_menu("scroll", -1, "units"))
+                widget.bind("<Button-5>", lambda e: self.scroll_start_menu("scroll", 1, "units"))
             
             # Footer with power options
             footer = tk.Frame(main_container, bg=self.get_theme_color("bg"), height=50)
@@ -5386,13 +8584,28 @@ class WindowManager:
             self.search_entry.config(fg=self.get_theme_color("fg"))
     
     def filter_applications(self, event=None):
-        """Filter applications based on search"""
-        search_term = self.search_var.get().lower()
-        if search_term == "🔍 search applications...":
-            search_term = ""
+        """Filter applications based on search, debounced across keystrokes"""
+        if self.search_after_id is not None:
+            self.root.after_cancel(self.search_after_id)
         
-        # Re-load applications with filter
-        self.load_start_menu_applications(filter_text=search_term)
+        delay = self.config.get("start_menu", {}).get("search_debounce", 120)
+        self.search_after_id = self.root.after(delay, self.run_application_search)
+    
+    def run_application_search(self):
+        """Run the pending start menu search"""
+        self.search_after_id = None
+        try:
+            if not self.search_entry.winfo_exists():
+                return
+            
+            search_term = self.search_var.get().lower()
+            if search_term == "🔍 search applications...":
+                search_term = ""
+            
+            # Re-load applications with filter
+            self.load_start_menu_applications(filter_text=search_term)
+        except Exception as e:
+            logger.error(f"Application search error: {e}")
     
     def switch_start_menu_tab(self, tab_id):
         """Switch start menu tab"""
@@ -5415,118 +8628,131 @@ class WindowManager:
     def load_start_menu_applications(self, filter_text=""):
         """Load applications in start menu based on current tab and filter"""
         try:
-            # Clear existing applications
-            for widget in self.apps_scrollable_frame.winfo_children():
-                widget.destroy()
-            
-            # Get applications from database
-            apps = self.get_applications_list(self.current_tab, filter_text)
-            
-            # Create application items
-            for i, app in enumerate(apps):
-                self.create_start_menu_app_item(app, i)
+            # Get applications from the catalog and show them from the top
+            self.start_menu_results = self.get_applications_list(self.current_tab, filter_text)
+            self.start_menu_offset = 0
+            self.render_start_menu_rows()
                 
         except Exception as e:
             logger.error(f"Applications loading error: {e}")
     
-    def get_applications_list(self, tab_type, filter_text=""):
-        """Get applications list based on tab type and filter"""
+    def render_start_menu_rows(self):
+        """Rebind the row pool to the visible slice of results"""
         try:
-            conn = sqlite3.connect(DATABASE_FILE)
-            cursor = conn.cursor()
+            visible = len(self.start_menu_rows)
+            total = len(self.start_menu_results)
             
-            if tab_type == "all":
-                if filter_text:
-                    cursor.execute(
-                        "SELECT * FROM applications WHERE name LIKE ? OR description LIKE ? ORDER BY name",
-                        (f"%{filter_text}%", f"%{filter_text}%")
-                    )
+            for index, row in enumerate(self.start_menu_rows):
+                position = self.start_menu_offset + index
+                app = self.start_menu_results[position] if position < total else None
+                if app is row["app"]:
+                    continue
+                
+                row["app"] = app
+                if app is None:
+                    row["button"].config(text="", state=tk.DISABLED, bg=self.get_theme_color("window"))
+                    row["desc"].config(text="", bg=self.get_theme_color("window"))
                 else:
-                    cursor.execute("SELECT * FROM applications ORDER BY name")
-            elif tab_type == "recent":
-                # Mock recent apps for now
-                cursor.execute("SELECT * FROM applications LIMIT 10")
-            elif tab_type == "favorites":
-                # Mock favorites for now
-                cursor.execute("SELECT * FROM applications WHERE category = 'System' LIMIT 8")
-            elif tab_type == "system":
-                cursor.execute("SELECT * FROM applications WHERE category = 'System'")
-            
-            apps = cursor.fetchall()
-            conn.close()
-            
-            # Convert to list of dictionaries
-            app_list = []
-            for app in apps:
-                app_dict = {
-                    "id": app[0],
-                    "name": app[1],
-                    "command": app[2],
-                    "icon": app[3],
-                    "category": app[4],
-                    "description": app[5]
-                }
-                app_list.append(app_dict)
-            
-            return app_list
+                    row["button"].config(text=f"{app['icon']} {app['name']}", state=tk.NORMAL,
+                                         bg=self.get_theme_color("window"))
+                    row["desc"].config(text=app.get('description') or "", bg=self.get_theme_color("window"))
             
+            if total > visible:
+                self.apps_scrollbar.set(self.start_menu_offset / total, (self.start_menu_offset + visible) / total)
+            else:
+                self.apps_scrollbar.set(0, 1)
+                
         except Exception as e:
-            logger.error(f"Applications list error: {e}")
-            return []
+            logger.error(f"Start menu render error: {e}")
     
-    def create_start_menu_app_item(self, app, index):
-        """Create a single application item in start menu"""
+    def scroll_start_menu(self, action, amount=None, unit=None):
+        """Scroll the row pool over the result list"""
         try:
-            item_frame = tk.Frame(self.apps_scrollable_frame, bg=self.get_theme_color("window"))
-            item_frame.pack(fill=tk.X, pady=2, padx=5)
-            
-            # Application button
-            app_btn = tk.Button(
-                item_frame,
-                text=f"{app['icon']} {app['name']}",
-                command=lambda: self.launch_start_menu_app(app),
-                bg=self.get_theme_color("window"),
-                fg=self.get_theme_color("fg"),
-                font=('Arial', 11),
-                relief=tk.FLAT,
-                anchor='w',
-                padx=15,
-                pady=8
-            )
-            app_btn.pack(fill=tk.X)
-            
-            # Description
-            if app.get('description'):
-                desc_label = tk.Label(
-                    item_frame,
-                    text=app['description'],
-                    bg=self.get_theme_color("window"),
-                    fg=self.get_theme_color("fg"),
-                    font=('Arial', 8),
-                    anchor='w'
-                )
-                desc_label.pack(fill=tk.X, padx=20)
-            
-            # Hover effects
-            def on_enter(e):
-                app_btn.config(bg=self.get_theme_color("hover"))
-                if app.get('description'):
-                    desc_label.config(bg=self.get_theme_color("hover"))
+            visible = len(self.start_menu_rows)
+            max_offset = max(0, len(self.start_menu_results) - visible)
             
-            def on_leave(e):
-                app_btn.config(bg=self.get_theme_color("window"))
-                if app.get('description'):
-                    desc_label.config(bg=self.get_theme_color("window"))
-            
-            app_btn.bind("<Enter>", on_enter)
-            app_btn.bind("<Leave>", on_leave)
+            if action == "moveto":
+                offset = int(round(float(amount) * len(self.start_menu_results)))
+            elif unit == "pages":
+                offset = self.start_menu_offset + int(amount) * visible
+            else:
+                offset = self.start_menu_offset + int(amount)
             
-            if app.get('description'):
-                desc_label.bind("<Enter>", on_enter)
-                desc_label.bind("<Leave>", on_leave)
+            offset = max(0, min(max_offset, offset))
+            if offset != self.start_menu_offset:
+                self.start_menu_offset = offset
+                self.render_start_menu_rows()
+                
+        except Exception as e:
+            logger.error(f"Start menu scroll error: {e}")
+    
+    def on_start_menu_wheel(self, event):
+        """Scroll the start menu with the mouse wheel"""
+        self.scroll_start_menu("scroll", -1 if event.delta > 0 else 1, "units")
+    
+    def get_applications_list(self, tab_type, filter_text=""):
+        """Get applications list based on tab type and filter"""
+        try:
+            if tab_type == "all" and filter_text:
+                limit = self.config.get("start_menu", {}).get("max_results", 50)
+                return self.app_catalog.search(filter_text, limit)
+            return self.app_catalog.get_tab(tab_type)
             
         except Exception as e:
-            logger.error(f"App item creation error: {e}")
+            logger.error(f"Applications list error: {e}")
+            return []
+    
+    def create_start_menu_app_item(self, parent):
+        """Create a reusable application row in start menu"""
+        item_frame = tk.Frame(parent, bg=self.get_theme_color("window"))
+        item_frame.pack(fill=tk.X, pady=2, padx=5)
+        
+        row = {"frame": item_frame, "app": None}
+        
+        # Application button
+        app_btn = tk.Button(
+            item_frame,
+            text="",
+            command=lambda: row["app"] and self.launch_start_menu_app(row["app"]),
+            bg=self.get_theme_color("window"),
+            fg=self.get_theme_color("fg"),
+            font=('Arial', 11),
+            relief=tk.FLAT,
+            anchor='w',
+            padx=15,
+            pady=8
+        )
+        app_btn.pack(fill=tk.X)
+        
+        # Description
+        desc_label = tk.Label(
+            item_frame,
+            text="",
+            bg=self.get_theme_color("window"),
+            fg=self.get_theme_color("fg"),
+            font=('Arial', 8),
+            anchor='w'
+        )
+        desc_label.pack(fill=tk.X, padx=20)
+        
+        row["button"] = app_btn
+        row["desc"] = desc_label
+        
+        # Hover effects
+        def on_enter(e):
+            if row["app"] is not None:
+                app_btn.config(bg=self.get_theme_color("hover"))
+                desc_label.config(bg=self.get_theme_color("hover"))
+        
+        def on_leave(e):
+            app_btn.config(bg=self.get_theme_color("window"))
+            desc_label.config(bg=self.get_theme_color("window"))
+        
+        for widget in (app_btn, desc_label):
+            widget.bind("<Enter>", on_enter)
+            widget.bind("<Leave>", on_leave)
+        
+        return row
     
     def launch_start_menu_app(self, app):
         """Launch application from start menu"""
@@ -5536,49 +8762,10 @@ class WindowManager:
             # Hide start menu
             self.hide_start_menu()
             
-            # Launch application
-            if command == "berke0s_filemanager":
-                self.launch_file_manager()
-            elif command == "berke0s_texteditor":
-                TextEditor(self).show()
-            elif command == "berke0s_browser":
-                self.launch_web_browser()
-            elif command == "berke0s_terminal":
-                self.launch_terminal()
-            elif command == "berke0s_calculator":
-                Calculator(self).show()
-            elif command == "berke0s_imageviewer":
-                ImageViewer(self).show()
-            elif command == "berke0s_musicplayer":
-                MusicPlayer(self).show()
-            elif command == "berke0s_videoplayer":
-                VideoPlayer(self).show()
-            elif command == "berke0s_settings":
-                self.launch_settings()
-            elif command == "berke0s_monitor":
-                SystemMonitor(self).show()
-            elif command == "berke0s_email":
-                EmailClient(self).show()
-            elif command == "berke0s_calendar":
-                CalendarApp(self).show()
-            elif command == "berke0s_games":
-                GamesLauncher(self).show()
-            elif command == "berke0s_network":
-                NetworkManager(self).show()
-            elif command == "berke0s_archive":
-                ArchiveManager(self).show()
-            elif command == "berke0s_pdf":
-                PDFViewer(self).show()
-            elif command == "berke0s_ide":
-                CodeEditor(self).show()
-            elif command == "berke0s_recorder":
-                ScreenRecorder(self).show()
-            elif command == "berke0s_backup":
-                BackupManager(self).show()
-            elif command == "berke0s_vdesktop":
-                VirtualDesktopManager(self).show()
-            elif command == "berke0s_display":  # New for V2
-                DisplaySettings(self).show()
+            # Launch application; bare names such as "display" are system commands
+            app_id = app_registry.resolve_command(command)
+            if app_id:
+                self.launch_app(app_id)
             else:
                 # Try to execute as system command
                 subprocess.Popen(command.split(), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
@@ -5661,12 +8848,10 @@ class WindowManager:
             window.attributes('-alpha', 0)
             window.update()
             
-            def fade_in(alpha=0):
-                if alpha <= 0.95:
-                    window.attributes('-alpha', alpha)
-                    self.root.after(30, lambda: fade_in(alpha + 0.1))
-                    
-            fade_in()
+            def fade_in(progress):
+                window.attributes('-alpha', 0.95 * progress)
+            
+            self.animator.animate(window, fade_in, key=("window", str(window)))
             
         except Exception as e:
             logger.error(f"Window animation error: {e}")
@@ -5724,18 +8909,16 @@ class WindowManager:
                 
                 if window.winfo_exists():
                     # Animate close
-                    if self.config.get("desktop", {}).get("effects", True):
-                        def fade_out(alpha=0.95):
-                            if alpha >= 0:
-                                window.attributes('-alpha', alpha)
-                                self.root.after(30, lambda: fade_out(alpha - 0.1))
-                            else:
-                                window.destroy()
-                                self.cleanup_window(window_id)
-                        fade_out()
-                    else:
+                    def fade_out(progress):
+                        window.attributes('-alpha', 0.95 * (1 - progress))
+                    
+                    def finish():
                         window.destroy()
                         self.cleanup_window(window_id)
+                    
+                    self.animator.animate(window, fade_out, on_done=finish,
+                                          on_cancel=lambda: self.cleanup_window(window_id),
+                                          key=("window", str(window)))
                 else:
                     self.cleanup_window(window_id)
                     
@@ -5798,6 +8981,7 @@ class WindowManager:
         except Exception as e:
             logger.error(f"Session save error: {e}")
     
+    @boot_tracer.traced()
     def restore_session(self):
         """Restore previous session"""
         try:
@@ -5831,8 +9015,7 @@ class WindowManager:
             self.clear_desktop_selection()
             
             # Hide start menu if open
-            if hasattr(self, 'start_menu_window') and self.start_menu_window.winfo_exists():
-                self.hide_start_menu()
+            self.hide_start_menu()
                 
         except Exception as e:
             logger.error(f"Desktop click error: {e}")
@@ -5956,7 +9139,7 @@ class WindowManager:
     def take_screenshot(self):
         """Take a screenshot"""
         try:
-            if PIL_AVAILABLE:
+            if pil_available():
                 screenshot = ImageGrab.grab()
                 
                 # Save screenshot
@@ -6217,6 +9400,11 @@ class WindowManager:
             
             # Restore previous session if available
             self.restore_session()
+            self.prerender_wallpapers()
+            self.app_catalog.preload()
+            
+            boot_tracer.end("main")
+            boot_tracer.write()
             
             # Start main loop
             if self.root:
@@ -6240,6 +9428,19 @@ class WindowManager:
             self.save_config()
             
             # Stop services
+            if self.service_runtime:
+                self.service_runtime.stop()
+            
+            if self.sampler_token is not None:
+                system_sampler.unsubscribe(self.sampler_token)
+            
+            if self.connectivity_token is not None:
+                self.connectivity_monitor.unsubscribe(self.connectivity_token)
+            
+            self.animator.stop()
+            if hasattr(self, 'notifications'):
+                self.notifications.store.stop()
+            
             if self.performance_monitor:
                 self.performance_monitor.stop()
             
@@ -6251,17 +9452,414 @@ class WindowManager:
                 self.display_manager.shutdown_display()
             
             # Close database connections
-            try:
-                conn = sqlite3.connect(DATABASE_FILE)
-                conn.close()
-            except:
-                pass
+            self.app_catalog.close()
+            database.close()
             
             logger.info("Cleanup completed")
             
         except Exception as e:
             logger.error(f"Cleanup error: {e}")
 
+# Application Registry
+class ApplicationRegistry:
+    """Registry that resolves application ids to their classes on first launch
+    
+    Built-in apps are defined in this file, which is shipped as a single
+    script, so they resolve from this module. Only apps from manifests in
+    APPS_DIR are imported lazily from their own module or .py file.
+    """
+    
+    def __init__(self):
+        self.entries = {}
+        self.commands = {}
+        self.extensions = {}
+        self.classes = {}
+        self.load_times = {}
+        self.lock = threading.Lock()
+        
+    def register(self, app_id, class_name, module=None, commands=(), extensions=(), single_instance=False):
+        """Register an application without importing its implementation"""
+        self.entries[app_id] = {
+            "class": class_name,
+            "module": module,
+            "single_instance": single_instance
+        }
+        self.commands[f"berke0s_{app_id}"] = app_id
+        for command in commands:
+            self.commands[command] = app_id
+        for ext in extensions:
+            self.extensions[ext.lower()] = app_id
+        self.classes.pop(app_id, None)
+    
+    def resolve(self, name):
+        """Resolve an app id or launcher command to a registered app id"""
+        if name in self.entries:
+            return name
+        return self.commands.get(name)
+    
+    def resolve_command(self, command):
+        """Resolve a berke0s_* launcher command, ignoring bare app ids"""
+        return self.commands.get(command)
+    
+    def for_file(self, file_path):
+        """Return the app id registered for a file's extension"""
+        ext = os.path.splitext(file_path)[1].lower()
+        return self.extensions.get(ext)
+    
+    def is_single_instance(self, app_id):
+        """Check whether only one window of the app may run"""
+        entry = self.entries.get(app_id)
+        return bool(entry and entry["single_instance"])
+    
+    def import_module(self, module):
+        """Import an implementation module by name or file path"""
+        if module is None:
+            return sys.modules[__name__]
+        if module.endswith(".py"):
+            path = module if os.path.isabs(module) else os.path.join(APPS_DIR, module)
+            name = f"berke0s_app_{os.path.splitext(os.path.basename(path))[0]}"
+            if name in sys.modules:
+                return sys.modules[name]
+            spec = importlib.util.spec_from_file_location(name, path)
+            loaded = importlib.util.module_from_spec(spec)
+            sys.modules[name] = loaded
+            try:
+                spec.loader.exec_module(loaded)
+            except Exception:
+                sys.modules.pop(name, None)
+                raise
+            return loaded
+        return importlib.import_module(module)
+    
+    def get_class(self, app_id):
+        """Return the application class, importing it on first use"""
+        cls = self.classes.get(app_id)
+        if cls is not None:
+            return cls
+        
+        with self.lock:
+            cls = self.classes.get(app_id)
+            if cls is not None:
+                return cls
+            
+            entry = self.entries.get(app_id)
+            if not entry:
+                raise KeyError(f"Unknown application: {app_id}")
+            
+            start = time.perf_counter()
+            module = self.import_module(entry["module"])
+            cls = getattr(module, entry["class"])
+            elapsed = (time.perf_counter() - start) * 1000
+            
+            self.classes[app_id] = cls
+            self.load_times[app_id] = elapsed
+            logger.info(f"Application {app_id} loaded in {elapsed:.1f}ms")
+            return cls
+    
+    def create(self, app_id, wm):
+        """Instantiate an application for the window manager"""
+        return self.get_class(app_id)(wm)
+    
+    def get_stats(self):
+        """Return registry load statistics"""
+        return {
+            "registered": len(self.entries),
+            "loaded": sorted(self.classes),
+            "load_times_ms": dict(self.load_times)
+        }
+
+app_registry = ApplicationRegistry()
+
+# Built-in applications: id, class, file extensions, single instance
+for _app in [
+    ("filemanager", "FileManager", (), True),
+    ("texteditor", "TextEditor", ('.txt', '.py', '.js', '.html', '.css', '.json', '.xml', '.md', '.sh'), False),
+    ("browser", "WebBrowser", (), True),
+    ("terminal", "Terminal", (), False),
+    ("calculator", "Calculator", (), False),
+    ("imageviewer", "ImageViewer", ('.jpg', '.jpeg', '.png', '.gif', '.bmp'), False),
+    ("musicplayer", "MusicPlayer", ('.mp3', '.wav', '.ogg', '.flac'), False),
+    ("videoplayer", "VideoPlayer", ('.mp4', '.avi', '.mkv', '.mov'), False),
+    ("settings", "SettingsApp", (), True),
+    ("monitor", "SystemMonitor", (), False),
+    ("email", "EmailClient", (), False),
+    ("calendar", "CalendarApp", (), False),
+    ("games", "GamesLauncher", (), False),
+    ("network", "NetworkManager", (), False),
+    ("archive", "ArchiveManager", ('.zip', '.tar', '.gz', '.rar'), False),
+    ("pdf", "PDFViewer", ('.pdf',), False),
+    ("ide", "CodeEditor", (), False),
+    ("recorder", "ScreenRecorder", (), False),
+    ("backup", "BackupManager", (), False),
+    ("vdesktop", "VirtualDesktopManager", (), False),
+    ("display", "DisplaySettings", (), False),
+]:
+    app_registry.register(_app[0], _app[1], extensions=_app[2], single_instance=_app[3])
+
+def load_external_applications():
+    """Register application manifests found in the applications directory"""
+    try:
+        if not os.path.exists(APPS_DIR):
+            return
+        
+        for manifest_file in os.listdir(APPS_DIR):
+            if not manifest_file.endswith('.json'):
+                continue
+            try:
+                with open(os.path.join(APPS_DIR, manifest_file), 'r') as f:
+                    manifest = json.load(f)
+                app_registry.register(
+                    manifest["id"],
+                    manifest["class"],
+                    module=manifest.get("module"),
+                    commands=manifest.get("commands", []),
+                    extensions=manifest.get("extensions", []),
+                    single_instance=manifest.get("single_instance", False)
+                )
+            except Exception as e:
+                logger.warning(f"Invalid application manifest {manifest_file}: {e}")
+                
+    except Exception as e:
+        logger.error(f"External application loading error: {e}")
+
+load_external_applications()
+
+# Start menu application catalog
+class AppCatalog:
+    """In-memory copy of the applications table with ranked fuzzy search
+    
+    The table is loaded once and indexed by word prefix and trigram. A
+    dedicated connection watches PRAGMA data_version so commits from any
+    other connection, including the shared per-thread ones, invalidate
+    the catalog.
+    """
+    
+    def __init__(self, db=None, check_interval=2.0):
+        self.db = db or database
+        self.check_interval = check_interval
+        self.conn = None
+        self.lock = threading.Lock()
+        self.apps = []
+        self.apps_by_name = []
+        self.ranks = []
+        self.app_prefixes = []
+        self.name_prefixes = {}
+        self.text_prefixes = {}
+        self.trigrams = {}
+        self.loaded = False
+        self.data_version = None
+        self.last_check = 0
+        self.stats = {"loads": 0, "searches": 0, "last_search_ms": 0.0}
+    
+    def invalidate(self):
+        """Force a reload on the next lookup"""
+        self.loaded = False
+    
+    def ensure_loaded(self):
+        """Reload the catalog if the applications table may have changed"""
+        now = time.monotonic()
+        if self.loaded and now - self.last_check < self.check_interval:
+            return
+        self.last_check = now
+        
+        if self.conn is None:
+            self.conn = self.db.open()
+        
+        data_version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+        if data_version != self.data_version:
+            self.data_version = data_version
+            self.loaded = False
+        
+        if not self.loaded:
+            self.load()
+    
+    def load(self):
+        """Load the applications table and rebuild the search indexes"""
+        sql = "SELECT id, name, command, icon, category, description FROM applications ORDER BY id"
+        start = time.perf_counter()
+        rows = self.conn.execute(sql).fetchall()
+        self.db.record(sql, time.perf_counter() - start)
+        
+        apps = []
+        for row in rows:
+            apps.append({
+                "id": row[0],
+                "name": row[1] or "",
+                "command": row[2] or "",
+                "icon": row[3] or "",
+                "category": row[4] or "",
+                "description": row[5] or ""
+            })
+        
+        order = sorted(range(len(apps)), key=lambda index: apps[index]["name"].lower())
+        ranks = [0] * len(apps)
+        for rank, index in enumerate(order):
+            ranks[index] = rank
+        
+        # Postings are built in name order so slicing them yields sorted results
+        name_prefixes = {}
+        text_prefixes = {}
+        trigrams = {}
+        app_prefixes = [None] * len(apps)
+        for index in order:
+            app = apps[index]
+            name_words = self.tokenize(app["name"])
+            text_words = self.tokenize(f"{app['description']} {app['category']} {app['command']}")
+            
+            seen = set()
+            for word in name_words:
+                for length in range(1, len(word) + 1):
+                    prefix = word[:length]
+                    if prefix not in seen:
+                        seen.add(prefix)
+                        name_prefixes.setdefault(prefix, []).append(index)
+                for gram in self.get_trigrams(word):
+                    trigrams.setdefault(gram, set()).add(index)
+            
+            for word in text_words:
+                for length in range(1, len(word) + 1):
+                    prefix = word[:length]
+                    if prefix not in seen:
+                        seen.add(prefix)
+                        text_prefixes.setdefault(prefix, []).append(index)
+            
+            name_seen = {word[:length] for word in name_words for length in range(1, len(word) + 1)}
+            app_prefixes[index] = (name_seen, seen)
+        
+        # Within a name posting, entries whose whole name starts with the prefix come first
+        for prefix, posting in name_prefixes.items():
+            posting.sort(key=lambda index: (not apps[index]["name"].lower().startswith(prefix), ranks[index]))
+        
+        self.apps = apps
+        self.apps_by_name = [apps[index] for index in order]
+        self.ranks = ranks
+        self.app_prefixes = app_prefixes
+        self.name_prefixes = name_prefixes
+        self.text_prefixes = text_prefixes
+        self.trigrams = trigrams
+        self.loaded = True
+        self.stats["loads"] += 1
+        logger.info(f"Application catalog loaded: {len(apps)} entries")
+    
+    def preload(self):
+        """Load the catalog in a background thread"""
+        def worker():
+            try:
+                with self.lock:
+                    self.ensure_loaded()
+            except Exception as e:
+                logger.error(f"Application catalog load error: {e}")
+        
+        threading.Thread(target=worker, name="AppCatalogLoader", daemon=True).start()
+    
+    def tokenize(self, text):
+        """Split text into lowercase search words"""
+        return [word for word in re.split(r"[^\w]+", text.lower()) if word]
+    
+    def get_trigrams(self, word):
+        """Return the trigrams of a word padded at the start"""
+        padded = f"  {word}"
+        return {padded[i:i + 3] for i in range(len(padded) - 2)}
+    
+    def search(self, text, limit=50):
+        """Return applications matching text, best matches first"""
+        with self.lock:
+            start = time.perf_counter()
+            self.ensure_loaded()
+            
+            tokens = self.tokenize(text)
+            if not tokens:
+                results = self.apps_by_name[:limit]
+            elif len(tokens) == 1:
+                results = [self.apps[index] for index in self.search_token(tokens[0], limit)]
+            else:
+                results = [self.apps[index] for index in self.search_tokens(tokens, limit)]
+            
+            self.stats["searches"] += 1
+            self.stats["last_search_ms"] = (time.perf_counter() - start) * 1000
+            return results
+    
+    def search_token(self, token, limit):
+        """Rank name prefix matches, then other field matches, then near misses"""
+        results = self.name_prefixes.get(token, [])[:limit]
+        if len(results) >= limit:
+            return results
+        
+        seen = set(results)
+        for index in self.text_prefixes.get(token, ()):
+            if index not in seen:
+                seen.add(index)
+                results.append(index)
+                if len(results) >= limit:
+                    return results
+        
+        # Tolerate typos by accepting names sharing most of the token's trigrams
+        if len(token) >= 3:
+            grams = self.get_trigrams(token)
+            counts = {}
+            for gram in grams:
+                for index in self.trigrams.get(gram, ()):
+                    if index not in seen:
+                        counts[index] = counts.get(index, 0) + 1
+            needed = max(2, int(len(grams) * 0.6))
+            fuzzy = [index for index, count in counts.items() if count >= needed]
+            fuzzy.sort(key=lambda index: (-counts[index], self.ranks[index]))
+            results.extend(fuzzy[:limit - len(results)])
+        
+        return results
+    
+    def search_tokens(self, tokens, limit):
+        """Rank entries matching every token by where the tokens matched"""
+        postings = [
+            (token, self.name_prefixes.get(token, []), self.text_prefixes.get(token, []))
+            for token in tokens
+        ]
+        token, name_posting, text_posting = min(postings, key=lambda item: len(item[1]) + len(item[2]))
+        
+        scored = []
+        for index in name_posting + text_posting:
+            name_prefixes, all_prefixes = self.app_prefixes[index]
+            score = 0
+            for other in tokens:
+                if other in name_prefixes:
+                    score += 2
+                elif other in all_prefixes:
+                    score += 1
+                else:
+                    break
+            else:
+                scored.append((-score, self.ranks[index], index))
+        
+        scored.sort()
+        return [index for score, rank, index in scored[:limit]]
+    
+    def get_tab(self, tab_type):
+        """Return the applications shown on a start menu tab"""
+        with self.lock:
+            self.ensure_loaded()
+            if tab_type == "recent":
+                return self.apps[:10]
+            if tab_type == "favorites":
+                return [app for app in self.apps if app["category"] == "System"][:8]
+            if tab_type == "system":
+                return [app for app in self.apps if app["category"] == "System"]
+            return list(self.apps_by_name)
+    
+    def close(self):
+        """Close the catalog's connection"""
+        with self.lock:
+            if self.conn is not None:
+                self.conn.close()
+                self.conn = None
+    
+    def get_stats(self):
+        """Return catalog statistics"""
+        stats = dict(self.stats)
+        stats["entries"] = len(self.apps)
+        stats["indexed_prefixes"] = len(self.name_prefixes) + len(self.text_prefixes)
+        stats["indexed_trigrams"] = len(self.trigrams)
+        return stats
+
 # Enhanced Application Classes
 
 class FileManager:
@@ -7136,21 +10734,10 @@ class FileManager:
     def open_file(self, file_path):
         """Open file with appropriate application"""
         try:
-            ext = os.path.splitext(file_path)[1].lower()
-            
-            # Open with appropriate Berke0S application
-            if ext in ['.txt', '.py', '.js', '.html', '.css', '.json', '.xml', '.md', '.sh']:
-                TextEditor(self.wm).show(file_path)
-            elif ext in ['.jpg', '.jpeg', '.png', '.gif', '.bmp']:
-                ImageViewer(self.wm).show(file_path)
-            elif ext in ['.mp3', '.wav', '.ogg', '.flac']:
-                MusicPlayer(self.wm).show(file_path)
-            elif ext in ['.mp4', '.avi', '.mkv', '.mov']:
-                VideoPlayer(self.wm).show(file_path)
-            elif ext in ['.pdf']:
-                PDFViewer(self.wm).show(file_path)
-            elif ext in ['.zip', '.tar', '.gz', '.rar']:
-                ArchiveManager(self.wm).show(file_path)
+            # Open with the Berke0S application registered for this type
+            app_id = app_registry.for_file(file_path)
+            if app_id:
+                self.wm.launch_app(app_id, file_path)
             else:
                 # Try to open with system default
                 try:
@@ -7158,7 +10745,7 @@ class FileManager:
                                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
                 except:
                     # Fallback to text editor
-                    TextEditor(self.wm).show(file_path)
+                    self.wm.launch_app("texteditor", file_path)
                     
         except Exception as e:
             logger.error(f"File open error: {e}")
@@ -8633,7 +12220,7 @@ class DisplaySettings:
             
             # Get display information
             display_info = self.display_manager.get_display_info()
-            env_info = self.display_manager.detect_environment()
+            env_info = self.display_manager.get_environment()
             
             info_content = f"""Display Information - Berke0S V2
 {'='*50}
@@ -8911,7 +12498,7 @@ Last Updated: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
                     f.write("\n")
                     
                     # Include environment info
-                    env_info = self.display_manager.detect_environment()
+                    env_info = self.display_manager.get_environment()
                     f.write("Environment Information:\n")
                     for key, value in env_info.items():
                         f.write(f"  {key}: {value}\n")
@@ -8926,11 +12513,7 @@ Last Updated: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
                     
                     # Include display logs from database
                     try:
-                        conn = sqlite3.connect(DATABASE_FILE)
-                        cursor = conn.cursor()
-                        cursor.execute("SELECT * FROM display_logs ORDER BY timestamp DESC LIMIT 100")
-                        logs = cursor.fetchall()
-                        conn.close()
+                        logs = database.query("SELECT * FROM display_logs ORDER BY timestamp DESC LIMIT 100")
                         
                         f.write("Recent Display Events:\n")
                         for log in logs:
@@ -9079,6 +12662,132 @@ class PluginManager:
                 except Exception as e:
                     logger.error(f"Plugin cleanup error: {e}")
 
+# Metrics History
+class MetricsHistory:
+    """Fixed-size ring buffers of sampled metrics with tiered downsampling"""
+    
+    SERIES = (
+        "cpu_percent", "memory_percent", "swap_percent", "disk_percent",
+        "net_recv_rate", "net_sent_rate", "disk_read_rate", "disk_write_rate"
+    )
+    
+    # (resolution in seconds, number of slots): 1 s for 10 min, 10 s for 6 h, 1 min for 7 days
+    TIERS = ((1, 600), (10, 2160), (60, 10080))
+    
+    def __init__(self, series=None, tiers=None):
+        self.series = tuple(series or self.SERIES)
+        self.tiers = []
+        self.lock = threading.Lock()
+        
+        for resolution, capacity in (tiers or self.TIERS):
+            self.tiers.append({
+                "resolution": resolution,
+                "capacity": capacity,
+                "times": array.array('d', [0.0]) * capacity,
+                "values": {name: array.array('d', [float('nan')]) * capacity for name in self.series},
+                "index": 0,
+                "count": 0,
+                "bucket": None,
+                "sums": dict.fromkeys(self.series, 0.0),
+                "samples": 0
+            })
+    
+    def write(self, tier, timestamp, values):
+        """Append one row to a tier's ring buffer"""
+        index = tier["index"]
+        tier["times"][index] = timestamp
+        for name in self.series:
+            tier["values"][name][index] = values[name]
+        tier["index"] = (index + 1) % tier["capacity"]
+        tier["count"] = min(tier["count"] + 1, tier["capacity"])
+    
+    def record(self, snapshot):
+        """Add a SystemSnapshot to every tier"""
+        timestamp = snapshot.timestamp
+        values = {name: float(getattr(snapshot, name)) for name in self.series}
+        
+        with self.lock:
+            for tier in self.tiers:
+                resolution = tier["resolution"]
+                if resolution <= 1:
+                    self.write(tier, timestamp, values)
+                    continue
+                
+                # Average samples per bucket and flush when the bucket ends
+                bucket = int(timestamp // resolution)
+                if tier["bucket"] is not None and bucket != tier["bucket"] and tier["samples"]:
+                    averages = {name: tier["sums"][name] / tier["samples"] for name in self.series}
+                    self.write(tier, tier["bucket"] * resolution, averages)
+                    tier["sums"] = dict.fromkeys(self.series, 0.0)
+                    tier["samples"] = 0
+                
+                tier["bucket"] = bucket
+                for name in self.series:
+                    tier["sums"][name] += values[name]
+                tier["samples"] += 1
+    
+    def select_tier(self, since, resolution):
+        """Pick the finest tier that satisfies the resolution and reaches back to since"""
+        candidates = [t for t in self.tiers if resolution is None or t["resolution"] >= resolution]
+        if not candidates:
+            candidates = [self.tiers[-1]]
+        
+        if since is None:
+            return candidates[0]
+        
+        for tier in candidates:
+            if tier["count"] < tier["capacity"]:
+                # Tier has not wrapped yet, so it holds everything since startup
+                return tier
+            oldest = tier["times"][tier["index"]]
+            if oldest <= since:
+                return tier
+        return candidates[-1]
+    
+    def get_series(self, name, since=None, resolution=None):
+        """Return [(timestamp, value), ...] for a metric, oldest first
+        
+        since is a Unix timestamp; resolution is the minimum spacing in
+        seconds. The finest tier covering the requested range is used.
+        """
+        if name not in self.series:
+            raise KeyError(f"Unknown metric series: {name}")
+        
+        with self.lock:
+            tier = self.select_tier(since, resolution)
+            capacity = tier["capacity"]
+            start = (tier["index"] - tier["count"]) % capacity
+            times = tier["times"]
+            values = tier["values"][name]
+            
+            points = []
+            for offset in range(tier["count"]):
+                i = (start + offset) % capacity
+                if since is None or times[i] >= since:
+                    points.append((times[i], values[i]))
+            
+            # Include the bucket that is still being filled as a partial average
+            if tier["samples"]:
+                bucket_start = tier["bucket"] * tier["resolution"]
+                if since is None or bucket_start + tier["resolution"] > since:
+                    points.append((bucket_start, tier["sums"][name] / tier["samples"]))
+            return points
+    
+    def get_info(self):
+        """Return tier fill levels and memory use"""
+        with self.lock:
+            return {
+                "series": list(self.series),
+                "tiers": [
+                    {"resolution": t["resolution"], "capacity": t["capacity"], "count": t["count"]}
+                    for t in self.tiers
+                ],
+                "bytes": sum(
+                    t["times"].buffer_info()[1] * t["times"].itemsize * (len(self.series) + 1)
+                    for t in self.tiers
+                )
+            }
+
 # Performance Monitor
 class PerformanceMonitor:
     """System performance monitoring"""
@@ -9087,43 +12796,199 @@ class PerformanceMonitor:
         self.wm = wm
         self.metrics = {}
         self.running = True
+        self.history = MetricsHistory()
+        self.sampler_token = system_sampler.subscribe(self.history.record)
         
     def update_metrics(self):
         """Update performance metrics"""
         try:
-            if psutil:
-                self.metrics.update({
-                    'cpu_percent': psutil.cpu_percent(),
-                    'memory_percent': psutil.virtual_memory().percent,
-                    'disk_usage': psutil.disk_usage('/').percent,
-                    'network_io': psutil.net_io_counters(),
-                    'timestamp': time.time()
-                })
+            snapshot = system_sampler.get_snapshot()
+            self.metrics.update({
+                'cpu_percent': snapshot.cpu_percent,
+                'memory_percent': snapshot.memory_percent,
+                'disk_usage': snapshot.disk_percent,
+                'network_io': {
+                    'bytes_recv': snapshot.net_bytes_recv,
+                    'bytes_sent': snapshot.net_bytes_sent,
+                    'recv_rate': snapshot.net_recv_rate,
+                    'sent_rate': snapshot.net_sent_rate
+                },
+                'disk_io': {
+                    'read_rate': snapshot.disk_read_rate,
+                    'write_rate': snapshot.disk_write_rate
+                },
+                'timestamp': snapshot.timestamp
+            })
         except Exception as e:
             logger.error(f"Metrics update error: {e}")
     
     def get_metrics(self):
         """Get current metrics"""
-        return self.metrics.copy()
+        metrics = self.metrics.copy()
+        metrics['applications'] = app_registry.get_stats()
+        if hasattr(self.wm, 'animator'):
+            metrics['animations'] = self.wm.animator.get_stats()
+        metrics['database'] = database.get_stats()
+        if hasattr(self.wm, 'app_catalog'):
+            metrics['app_catalog'] = self.wm.app_catalog.get_stats()
+        if hasattr(self.wm, 'wallpaper_cache'):
+            metrics['wallpapers'] = self.wm.wallpaper_cache.get_stats()
+        if hasattr(self.wm, 'log_retention'):
+            metrics['log_retention'] = self.wm.log_retention.get_stats()
+        if getattr(self.wm, 'service_runtime', None):
+            metrics['services'] = self.wm.service_runtime.get_stats()
+        if hasattr(self.wm, 'connectivity_monitor'):
+            metrics['connectivity'] = self.wm.connectivity_monitor.get_state()
+        if hasattr(self.wm, 'alert_engine'):
+            metrics['alerts'] = {
+                'fired': self.wm.alert_engine.fired,
+                'suppressed': self.wm.alert_engine.suppressed,
+                'states': self.wm.alert_engine.get_states()
+            }
+        if hasattr(self.wm, 'ui_dispatch_stats'):
+            metrics['ui_dispatch'] = dict(self.wm.ui_dispatch_stats, pending=len(self.wm.ui_queue))
+        metrics['history'] = self.history.get_info()
+        return metrics
+    
+    def get_series(self, name, since=None, resolution=None):
+        """Get recorded history for a metric, see MetricsHistory.get_series"""
+        return self.history.get_series(name, since, resolution)
     
     def stop(self):
         """Stop performance monitoring"""
         self.running = False
+        system_sampler.unsubscribe(self.sampler_token)
+
+def report_startup_profile(stage="startup"):
+    """Log per-import cost collected with --startup-profile"""
+    if not STARTUP_PROFILE:
+        return
+    
+    try:
+        import_profiler.uninstall()
+        records = import_profiler.records
+        elapsed = (time.perf_counter() - STARTUP_TIME) * 1000
+        import_total = sum(r["self"] for r in records) * 1000
+        lazy_total = sum(r["total"] for r in records if r["lazy"] and not r["nested"]) * 1000
+        
+        logger.info(f"Startup profile ({stage}): {elapsed:.1f} ms since launch, "
+                    f"{import_total:.1f} ms in imports ({lazy_total:.1f} ms of it in lazy imports), "
+                    f"{len(sys.modules)} modules loaded")
+        
+        for record in sorted(records, key=lambda r: r["self"], reverse=True)[:30]:
+            logger.info(f"  {record['self'] * 1000:8.2f} ms self {record['total'] * 1000:8.2f} ms total  "
+                        f"{record['module']}{' (lazy)' if record['lazy'] else ''}")
+        
+        with open(f"{CONFIG_DIR}/startup_profile.json", 'w') as f:
+            json.dump({
+                "stage": stage,
+                "elapsed_ms": elapsed,
+                "modules_loaded": len(sys.modules),
+                "imports": records
+            }, f, indent=4)
+            
+    except Exception as e:
+        logger.error(f"Startup profile report error: {e}")
+
+def benchmark_database(rows=1000000, repeat=5):
+    """Time log and session queries on a scratch database before and after the schema indexes (--db-benchmark)"""
+    path = os.path.join(tempfile.gettempdir(), f"berke0s-benchmark-{os.getpid()}.db")
+    bench = Database(path)
+    
+    try:
+        migrator = SchemaMigrator(bench)
+        migrator.migrate(target=1)
+        
+        start = time.perf_counter()
+        now = datetime.datetime.utcnow()
+        components = ["display", "security", "network", "session", "desktop"]
+        
+        def timestamp(i):
+            return (now - datetime.timedelta(seconds=(rows - i) * 2)).strftime("%Y-%m-%d %H:%M:%S")
+        
+        bench.executemany(
+            "INSERT INTO system_logs (level, message, component, user_id, timestamp) VALUES (?, ?, ?, ?, ?)",
+            (("INFO", f"System event {i}", components[i % len(components)], i % 50, timestamp(i)) for i in range(rows))
+        )
+        bench.executemany(
+            "INSERT INTO display_logs (event_type, display_id, message, success, timestamp) VALUES (?, ?, ?, ?, ?)",
+            (("display_check", ":0", f"Display event {i}", i % 7 != 0, timestamp(i)) for i in range(rows))
+        )
+        bench.executemany(
+            "INSERT INTO logs (user_id, action, details, log_level, timestamp) VALUES (?, ?, ?, ?, ?)",
+            ((i % 50, "OPEN_FILE", f"file-{i}.txt", "INFO", timestamp(i)) for i in range(rows))
+        )
+        bench.executemany(
+            "INSERT INTO sessions (user_id, session_token, expires_at) VALUES (?, ?, ?)",
+            ((i % 50, f"token-{i}", timestamp(i)) for i in range(rows // 100))
+        )
+        logger.info(f"Database benchmark: inserted {rows} rows per log table in {time.perf_counter() - start:.1f} s")
+        
+        last_hour = (now - datetime.timedelta(hours=1)).strftime("%Y-%m-%d %H:%M:%S")
+        queries = [
+            ("export_display_logs", "SELECT * FROM display_logs ORDER BY timestamp DESC LIMIT 100", ()),
+            ("system_logs last hour", "SELECT COUNT(*) FROM system_logs WHERE timestamp >= ?", (last_hour,)),
+            ("system_logs by component", "SELECT * FROM system_logs WHERE component = ? ORDER BY timestamp DESC LIMIT 50", ("security",)),
+            ("logs by user", "SELECT * FROM logs WHERE user_id = ? ORDER BY timestamp DESC LIMIT 50", (7,)),
+            ("sessions by token", "SELECT user_id, expires_at FROM sessions WHERE session_token = ? AND is_active = 1", (f"token-{rows // 200}",)),
+            ("sessions by user", "SELECT COUNT(*) FROM sessions WHERE user_id = ? AND is_active = 1", (7,))
+        ]
+        
+        def run_queries():
+            timings = {}
+            for name, sql, params in queries:
+                samples = []
+                for _ in range(repeat):
+                    query_start = time.perf_counter()
+                    bench.query(sql, params)
+                    samples.append((time.perf_counter() - query_start) * 1000)
+                timings[name] = sorted(samples)[len(samples) // 2]
+            return timings
+        
+        before = run_queries()
+        start = time.perf_counter()
+        migrator.migrate(target=2)
+        index_time = time.perf_counter() - start
+        after = run_queries()
+        
+        logger.info(f"Database benchmark: schema v2 indexes built in {index_time:.1f} s")
+        for name, _, _ in queries:
+            logger.info(f"  {name:26} {before[name]:10.2f} ms -> {after[name]:8.2f} ms")
+        
+        return {"rows": rows, "before_ms": before, "after_ms": after, "index_build_s": index_time}
+    
+    except Exception as e:
+        logger.error(f"Database benchmark error: {e}")
+        return None
+    finally:
+        bench.close()
+        for suffix in ("", "-wal", "-shm"):
+            try:
+                os.remove(path + suffix)
+            except OSError:
+                pass
 
 # Main execution
 def main():
     """Enhanced main entry point for V2"""
     try:
+        boot_tracer.begin("main")
         logger.info("Starting Berke0S 3.0 V2 - Enhanced Display Management...")
         
+        if "--db-benchmark" in sys.argv:
+            benchmark_database()
+            return
+
         # Initialize database
         init_database()
         
         # Check if installation is needed
         if not os.path.exists(INSTALL_FLAG) or "--install" in sys.argv:
             logger.info("Starting installation wizard...")
-            installer = InstallationWizard()
+            with boot_tracer.span("InstallationWizard.__init__"):
+                installer = InstallationWizard()
             installer.start_installation()
+            boot_tracer.write()
             
             # After installation, check if we should start the desktop
             if os.path.exists(INSTALL_FLAG):
@@ -9137,12 +13002,16 @@ def main():
                 if config.get("installed", False):
                     logger.info("Installation completed, starting desktop environment...")
                     # Start desktop environment
-                    wm = WindowManager()
+                    with boot_tracer.span("WindowManager.__init__"):
+                        wm = WindowManager()
+                    report_startup_profile("desktop")
                     wm.run()
         else:
             # Start desktop environment directly
             logger.info("Starting desktop environment...")
-            wm = WindowManager()
+            with boot_tracer.span("WindowManager.__init__"):
+                wm = WindowManager()
+            report_startup_profile("desktop")
             wm.run()
             
     except KeyboardInterrupt:
@@ -16,6 +16,7 @@ import threading
 import signal
 import psutil
 import socket
+import select
 import hashlib
 import re
 import shutil
@@ -23,6 +24,7 @@ import getpass
 import datetime
 import logging
 import queue
+import collections
 import math
 import uuid
 import base64
@@ -608,7 +610,10 @@ DEFAULT_CONFIG = {
     "network_monitoring": True,
     "system_monitoring": True,
     "developer_mode": False,
-    "debug_mode": False
+    "debug_mode": False,
+    "audit_batch_size": 64,
+    "audit_flush_interval": 500,
+    "audit_max_queued": 10000
 }
 
 # Language support
@@ -797,117 +802,647 @@ THEMES = {
     }
 }
 
+# Shared SQLite access layer
+class Database:
+    """Process-wide SQLite access with long-lived per-thread connections
+    
+    Each thread gets one connection in WAL mode with a busy timeout and
+    sqlite3's prepared statement cache, instead of connecting per call.
+    Query timings are collected per statement.
+    """
+    
+    def __init__(self, path, busy_timeout=5.0, cached_statements=256):
+        self.path = path
+        self.busy_timeout = busy_timeout
+        self.cached_statements = cached_statements
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.connections = []
+        self.query_stats = {}
+        self.max_tracked_queries = 200
+    
+    def open(self):
+        """Open a new tuned connection that is not tied to a thread"""
+        conn = sqlite3.connect(
+            self.path,
+            timeout=self.busy_timeout,
+            cached_statements=self.cached_statements,
+            check_same_thread=False
+        )
+        conn.execute(f"PRAGMA busy_timeout = {int(self.busy_timeout * 1000)}")
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        return conn
+    
+    def connect(self):
+        """Return this thread's connection, opening it on first use"""
+        conn = getattr(self.local, 'conn', None)
+        if conn is None:
+            conn = self.open()
+            self.local.conn = conn
+            with self.lock:
+                self.connections.append(conn)
+        return conn
+    
+    def record(self, sql, elapsed):
+        """Add a statement's duration to the query stats"""
+        key = " ".join(sql.split())[:200]
+        with self.lock:
+            stats = self.query_stats.get(key)
+            if stats is None:
+                if len(self.query_stats) >= self.max_tracked_queries:
+                    return
+                stats = self.query_stats[key] = {"count": 0, "total": 0.0, "max": 0.0}
+            stats["count"] += 1
+            stats["total"] += elapsed
+            stats["max"] = max(stats["max"], elapsed)
+    
+    def execute(self, sql, params=(), commit=False):
+        """Run a statement and return its cursor"""
+        conn = self.connect()
+        start = time.perf_counter()
+        try:
+            cursor = conn.execute(sql, params)
+            if commit:
+                conn.commit()
+            return cursor
+        except Exception:
+            if commit:
+                conn.rollback()
+            raise
+        finally:
+            self.record(sql, time.perf_counter() - start)
+    
+    def executemany(self, sql, rows, commit=True):
+        """Run a statement for many parameter rows"""
+        conn = self.connect()
+        start = time.perf_counter()
+        try:
+            cursor = conn.executemany(sql, rows)
+            if commit:
+                conn.commit()
+            return cursor
+        except Exception:
+            if commit:
+                conn.rollback()
+            raise
+        finally:
+            self.record(sql, time.perf_counter() - start)
+    
+    def executescript(self, script):
+        """Run a multi-statement script"""
+        conn = self.connect()
+        start = time.perf_counter()
+        try:
+            conn.executescript(script)
+        finally:
+            self.record(script, time.perf_counter() - start)
+    
+    def query(self, sql, params=()):
+        """Fetch all rows of a query"""
+        return self.execute(sql, params).fetchall()
+    
+    def query_one(self, sql, params=()):
+        """Fetch the first row of a query"""
+        return self.execute(sql, params).fetchone()
+    
+    def commit(self):
+        """Commit this thread's pending transaction"""
+        self.connect().commit()
+    
+    def rollback(self):
+        """Roll back this thread's pending transaction"""
+        try:
+            self.connect().rollback()
+        except Exception as e:
+            logging.warning(f"Database rollback error: {e}")
+    
+    def checkpoint(self):
+        """Copy WAL contents back into the database file"""
+        return self.query_one("PRAGMA wal_checkpoint(TRUNCATE)")
+    
+    def get_stats(self, limit=10):
+        """Return connection count and the slowest statements by total time"""
+        with self.lock:
+            queries = sorted(self.query_stats.items(), key=lambda item: item[1]["total"], reverse=True)[:limit]
+            return {
+                "connections": len(self.connections),
+                "queries": [
+                    {
+                        "sql": sql,
+                        "count": stats["count"],
+                        "total_ms": stats["total"] * 1000,
+                        "avg_ms": stats["total"] * 1000 / stats["count"],
+                        "max_ms": stats["max"] * 1000
+                    }
+                    for sql, stats in queries
+                ]
+            }
+    
+    def close(self):
+        """Close every connection opened through this layer"""
+        with self.lock:
+            connections, self.connections = self.connections, []
+        for conn in connections:
+            try:
+                conn.close()
+            except Exception as e:
+                logging.warning(f"Database close error: {e}")
+        self.local = threading.local()
+
+database = Database(DATABASE_FILE)
+
+class AuditLogWriter:
+    """Buffered writer that group-commits audit rows from a background thread
+    
+    Rows are queued in memory and written in one transaction whenever
+    batch_size rows are waiting or flush_interval milliseconds have passed.
+    When the queue is full new rows are dropped and counted.
+    """
+    
+    def __init__(self, db, batch_size=64, flush_interval=500, max_queued=10000):
+        self.db = db
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_queued = max_queued
+        self.queue = collections.deque()
+        self.condition = threading.Condition()
+        self.thread = None
+        self.running = False
+        self.flush_requested = False
+        self.enqueued = 0
+        self.written = 0
+        self.stats = {"enqueued": 0, "written": 0, "batches": 0, "dropped": 0, "failed": 0}
+        
+    def configure(self, batch_size=None, flush_interval=None, max_queued=None):
+        """Update batching limits"""
+        with self.condition:
+            if batch_size:
+                self.batch_size = batch_size
+            if flush_interval:
+                self.flush_interval = flush_interval
+            if max_queued:
+                self.max_queued = max_queued
+            
+    def start(self):
+        """Start the writer thread if it is not running"""
+        with self.condition:
+            if self.running:
+                return
+            self.running = True
+            self.thread = threading.Thread(target=self.run, name="AuditLogWriter", daemon=True)
+            self.thread.start()
+            
+    def write(self, row):
+        """Queue a (user_id, action, details, ip_address, log_level) row"""
+        if not self.running:
+            self.start()
+            
+        with self.condition:
+            if len(self.queue) >= self.max_queued:
+                self.stats["dropped"] += 1
+                return False
+            self.queue.append(row)
+            self.enqueued += 1
+            self.stats["enqueued"] += 1
+            if len(self.queue) >= self.batch_size:
+                self.condition.notify_all()
+        return True
+        
+    def run(self):
+        """Drain the queue in batches until stopped"""
+        while True:
+            with self.condition:
+                deadline = time.monotonic() + self.flush_interval / 1000.0
+                while self.running and not self.flush_requested and len(self.queue) < self.batch_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self.condition.wait(remaining)
+                    
+                if not self.queue:
+                    # Nothing left to flush; clear the request so the next wait blocks
+                    self.flush_requested = False
+                    if not self.running:
+                        return
+                    continue
+                    
+                batch = [self.queue.popleft() for _ in range(min(self.batch_size, len(self.queue)))]
+                if not self.queue:
+                    self.flush_requested = False
+                
+            self.write_batch(batch)
+            
+    def write_batch(self, batch):
+        """Insert a batch of rows in a single transaction"""
+        try:
+            self.db.executemany('''
+                INSERT INTO logs (user_id, action, details, ip_address, log_level)
+                VALUES (?, ?, ?, ?, ?)
+            ''', batch)
+            with self.condition:
+                self.stats["written"] += len(batch)
+                self.stats["batches"] += 1
+        except Exception as e:
+            logging.error(f"Audit log write error: {e}")
+            with self.condition:
+                self.stats["failed"] += len(batch)
+        finally:
+            with self.condition:
+                self.written += len(batch)
+                self.condition.notify_all()
+                
+    def flush(self, timeout=5.0):
+        """Wait until every row queued so far has been written"""
+        if not self.running:
+            return True
+            
+        deadline = time.monotonic() + timeout
+        with self.condition:
+            target = self.enqueued
+            self.flush_requested = True
+            self.condition.notify_all()
+            while self.written < target:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    logging.warning(f"Audit log flush timed out with {target - self.written} rows pending")
+                    return False
+                self.condition.wait(remaining)
+        return True
+        
+    def stop(self, timeout=5.0):
+        """Flush pending rows and stop the writer thread"""
+        flushed = self.flush(timeout)
+        with self.condition:
+            self.running = False
+            self.condition.notify_all()
+        if self.thread:
+            self.thread.join(timeout)
+            self.thread = None
+        return flushed
+        
+    def get_stats(self):
+        """Return writer statistics"""
+        with self.condition:
+            stats = dict(self.stats)
+            stats["queued"] = len(self.queue)
+        return stats
+
+audit_log = AuditLogWriter(
+    database,
+    batch_size=DEFAULT_CONFIG["audit_batch_size"],
+    flush_interval=DEFAULT_CONFIG["audit_flush_interval"],
+    max_queued=DEFAULT_CONFIG["audit_max_queued"]
+)
+
+# Unified database schema shared by every Berke0S component
+SCHEMA_VERSION = 3
+
+SCHEMA_TABLES = {
+    "users": '''
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        username TEXT UNIQUE NOT NULL,
+        fullname TEXT,
+        email TEXT,
+        password_hash TEXT,
+        salt TEXT,
+        is_admin INTEGER DEFAULT 0,
+        is_active INTEGER DEFAULT 1,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        last_login TIMESTAMP,
+        login_count INTEGER DEFAULT 0,
+        failed_login_attempts INTEGER DEFAULT 0,
+        locked_until TIMESTAMP,
+        preferences TEXT,
+        avatar_path TEXT,
+        theme TEXT DEFAULT 'berke_dark',
+        language TEXT DEFAULT 'tr_TR'
+    ''',
+    "sessions": '''
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id INTEGER,
+        session_token TEXT UNIQUE,
+        session_data TEXT,
+        ip_address TEXT,
+        user_agent TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        expires_at TIMESTAMP,
+        is_active INTEGER DEFAULT 1,
+        FOREIGN KEY (user_id) REFERENCES users (id)
+    ''',
+    "applications": '''
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        command TEXT,
+        icon TEXT,
+        icon_path TEXT,
+        executable_path TEXT,
+        category TEXT,
+        description TEXT,
+        version TEXT,
+        author TEXT,
+        website TEXT,
+        installed INTEGER DEFAULT 1,
+        installed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        is_system_app INTEGER DEFAULT 0,
+        is_active INTEGER DEFAULT 1,
+        auto_start INTEGER DEFAULT 0,
+        last_used TIMESTAMP,
+        usage_count INTEGER DEFAULT 0,
+        file_associations TEXT,
+        permissions TEXT
+    ''',
+    "file_metadata": '''
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        file_path TEXT UNIQUE,
+        file_name TEXT,
+        file_type TEXT,
+        mime_type TEXT,
+        size INTEGER,
+        created_at TIMESTAMP,
+        modified_at TIMESTAMP,
+        accessed_at TIMESTAMP,
+        tags TEXT,
+        rating INTEGER DEFAULT 0,
+        description TEXT,
+        thumbnail_path TEXT,
+        checksum TEXT
+    ''',
+    "files": '''
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        filename TEXT NOT NULL,
+        filepath TEXT UNIQUE NOT NULL,
+        file_size INTEGER,
+        file_type TEXT,
+        mime_type TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        modified_at TIMESTAMP,
+        accessed_at TIMESTAMP,
+        owner_id INTEGER,
+        permissions TEXT,
+        is_hidden INTEGER DEFAULT 0,
+        is_system_file INTEGER DEFAULT 0,
+        FOREIGN KEY (owner_id) REFERENCES users (id)
+    ''',
+    "settings": '''
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id INTEGER,
+        category TEXT,
+        key TEXT,
+        value TEXT,
+        data_type TEXT DEFAULT 'string',
+        setting_key TEXT,
+        setting_value TEXT,
+        setting_type TEXT DEFAULT 'string',
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (user_id) REFERENCES users (id)
+    ''',
+    "system_logs": '''
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        level TEXT,
+        message TEXT,
+        component TEXT,
+        user_id INTEGER,
+        ip_address TEXT,
+        timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        details TEXT,
+        FOREIGN KEY (user_id) REFERENCES users (id)
+    ''',
+    "display_logs": '''
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        event_type TEXT,
+        display_id TEXT,
+        message TEXT,
+        success INTEGER,
+        timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    ''',
+    "logs": '''
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id INTEGER,
+        action TEXT NOT NULL,
+        details TEXT,
+        ip_address TEXT,
+        timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        log_level TEXT DEFAULT 'INFO',
+        FOREIGN KEY (user_id) REFERENCES users (id)
+    ''',
+    "bookmarks": '''
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id INTEGER,
+        name TEXT NOT NULL,
+        path TEXT NOT NULL,
+        icon TEXT,
+        category TEXT DEFAULT 'general',
+        order_index INTEGER DEFAULT 0,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (user_id) REFERENCES users (id)
+    ''',
+    "recent_files": '''
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id INTEGER,
+        file_path TEXT NOT NULL,
+        file_name TEXT,
+        application TEXT,
+        opened_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (user_id) REFERENCES users (id)
+    ''',
+    "themes": '''
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT UNIQUE NOT NULL,
+        display_name TEXT,
+        author TEXT,
+        version TEXT,
+        description TEXT,
+        theme_data TEXT,
+        preview_image TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        is_system INTEGER DEFAULT 0
+    ''',
+    "plugins": '''
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT UNIQUE NOT NULL,
+        display_name TEXT,
+        version TEXT,
+        author TEXT,
+        description TEXT,
+        file_path TEXT,
+        enabled INTEGER DEFAULT 0,
+        auto_load INTEGER DEFAULT 0,
+        dependencies TEXT,
+        permissions TEXT,
+        installed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    ''',
+    "network_connections": '''
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        type TEXT NOT NULL,
+        ssid TEXT,
+        password TEXT,
+        security_type TEXT,
+        auto_connect INTEGER DEFAULT 0,
+        priority INTEGER DEFAULT 0,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        last_connected TIMESTAMP
+    ''',
+    "system_performance": '''
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        cpu_percent REAL,
+        memory_percent REAL,
+        disk_percent REAL,
+        network_bytes_sent INTEGER,
+        network_bytes_recv INTEGER,
+        temperature REAL,
+        battery_percent REAL
+    ''',
+    "system_logs_hourly": '''
+        hour TIMESTAMP NOT NULL,
+        level TEXT NOT NULL,
+        component TEXT NOT NULL,
+        entries INTEGER DEFAULT 0,
+        PRIMARY KEY (hour, level, component)
+    ''',
+    "display_logs_hourly": '''
+        hour TIMESTAMP NOT NULL,
+        event_type TEXT NOT NULL,
+        display_id TEXT NOT NULL,
+        entries INTEGER DEFAULT 0,
+        failures INTEGER DEFAULT 0,
+        PRIMARY KEY (hour, event_type, display_id)
+    ''',
+    "logs_hourly": '''
+        hour TIMESTAMP NOT NULL,
+        action TEXT NOT NULL,
+        log_level TEXT NOT NULL,
+        entries INTEGER DEFAULT 0,
+        PRIMARY KEY (hour, action, log_level)
+    '''
+}
+
+# Legacy column names that map onto a unified column: (table, old name) -> new name
+SCHEMA_RENAMED_COLUMNS = {
+    ("users", "full_name"): "fullname"
+}
+
+# Usernames, session tokens and file paths are indexed by their UNIQUE constraints
+SCHEMA_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS idx_sessions_user_id ON sessions (user_id, is_active)",
+    "CREATE INDEX IF NOT EXISTS idx_sessions_expires_at ON sessions (expires_at)",
+    "CREATE INDEX IF NOT EXISTS idx_applications_category ON applications (category, name)",
+    "CREATE INDEX IF NOT EXISTS idx_applications_name ON applications (name)",
+    "CREATE UNIQUE INDEX IF NOT EXISTS idx_settings_category_key ON settings (user_id, category, key)",
+    "CREATE UNIQUE INDEX IF NOT EXISTS idx_settings_setting_key ON settings (user_id, setting_key)",
+    "CREATE INDEX IF NOT EXISTS idx_system_logs_timestamp ON system_logs (timestamp)",
+    "CREATE INDEX IF NOT EXISTS idx_system_logs_component ON system_logs (component, timestamp)",
+    "CREATE INDEX IF NOT EXISTS idx_display_logs_timestamp ON display_logs (timestamp)",
+    "CREATE INDEX IF NOT EXISTS idx_logs_timestamp ON logs (timestamp)",
+    "CREATE INDEX IF NOT EXISTS idx_logs_user_id ON logs (user_id, timestamp)",
+    "CREATE INDEX IF NOT EXISTS idx_bookmarks_category ON bookmarks (user_id, category, order_index)",
+    "CREATE INDEX IF NOT EXISTS idx_recent_files_opened_at ON recent_files (user_id, opened_at)",
+    "CREATE INDEX IF NOT EXISTS idx_system_performance_timestamp ON system_performance (timestamp)"
+]
+
+class SchemaMigrator:
+    """Versioned migrations that bring berke0s.db to the unified schema
+    
+    The version is stored in PRAGMA user_version. Pending migrations run in
+    one immediate transaction, so concurrent processes migrate only once.
+    """
+    
+    def __init__(self, db):
+        self.db = db
+        self.migrations = [
+            (1, "unify component tables", self.unify_tables),
+            (2, "add secondary indexes", self.create_indexes),
+            (3, "add hourly log summaries", self.unify_tables)
+        ]
+    
+    def get_version(self):
+        """Return the schema version stored in the database"""
+        return self.db.query_one("PRAGMA user_version")[0]
+    
+    def migrate(self, target=SCHEMA_VERSION):
+        """Run pending migrations up to target and return the schema version"""
+        version = self.get_version()
+        if version < target:
+            version = self.run_migrations(target)
+        return version
+    
+    def run_migrations(self, target):
+        """Apply pending migrations in one immediate transaction"""
+        self.db.execute("BEGIN IMMEDIATE")
+        try:
+            version = self.get_version()
+            for number, description, migration in self.migrations:
+                if version < number <= target:
+                    start = time.perf_counter()
+                    migration()
+                    self.db.execute(f"PRAGMA user_version = {number}")
+                    version = number
+                    logging.info(f"Schema migration {number} ({description}) took "
+                             f"{(time.perf_counter() - start) * 1000:.1f} ms")
+            self.db.commit()
+            return version
+        except Exception:
+            self.db.rollback()
+            raise
+    
+    def unify_tables(self):
+        """Create missing tables and rebuild tables whose columns differ"""
+        reference = sqlite3.connect(":memory:")
+        try:
+            for table, columns in SCHEMA_TABLES.items():
+                reference.execute(f"CREATE TABLE {table} ({columns})")
+                expected = reference.execute(f"PRAGMA table_info({table})").fetchall()
+                current = self.db.query(f"PRAGMA table_info({table})")
+                if not current:
+                    self.db.execute(f"CREATE TABLE {table} ({columns})")
+                elif sorted(c[1:] for c in current) != sorted(c[1:] for c in expected):
+                    self.rebuild_table(table, columns, [c[1] for c in current], [c[1] for c in expected])
+        finally:
+            reference.close()
+    
+    def rebuild_table(self, table, columns, current, expected):
+        """Copy a table into the unified layout, keeping every shared column"""
+        sources = []
+        targets = []
+        for name in current:
+            target = SCHEMA_RENAMED_COLUMNS.get((table, name), name)
+            if target in expected and target not in targets:
+                sources.append(name)
+                targets.append(target)
+        
+        temp = f"{table}_migrating"
+        self.db.execute(f"DROP TABLE IF EXISTS {temp}")
+        self.db.execute(f"CREATE TABLE {temp} ({columns})")
+        self.db.execute(f"INSERT INTO {temp} ({', '.join(targets)}) SELECT {', '.join(sources)} FROM {table}")
+        self.db.execute(f"DROP TABLE {table}")
+        self.db.execute(f"ALTER TABLE {temp} RENAME TO {table}")
+        
+        dropped = [name for name in current if name not in sources]
+        if dropped:
+            logging.warning(f"Schema migration dropped {table} columns: {', '.join(dropped)}")
+    
+    def create_indexes(self):
+        """Create the secondary indexes of the unified schema"""
+        for sql in SCHEMA_INDEXES:
+            self.db.execute(sql)
+
 class DatabaseManager:
     """Database manager for Berke0S"""
     
     def __init__(self):
         self.db_path = DATABASE_FILE
+        self.db = database
         self.init_database()
         
     def init_database(self):
         """Initialize database tables"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Users table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS users (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    username TEXT UNIQUE NOT NULL,
-                    password_hash TEXT NOT NULL,
-                    email TEXT,
-                    full_name TEXT,
-                    avatar_path TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    last_login TIMESTAMP,
-                    is_admin BOOLEAN DEFAULT 0,
-                    is_active BOOLEAN DEFAULT 1
-                )
-            ''')
-            
-            # Sessions table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS sessions (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    user_id INTEGER,
-                    session_token TEXT UNIQUE,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    expires_at TIMESTAMP,
-                    ip_address TEXT,
-                    user_agent TEXT,
-                    FOREIGN KEY (user_id) REFERENCES users (id)
-                )
-            ''')
-            
-            # Applications table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS applications (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT NOT NULL,
-                    description TEXT,
-                    icon_path TEXT,
-                    executable_path TEXT,
-                    category TEXT,
-                    version TEXT,
-                    installed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    is_system_app BOOLEAN DEFAULT 0,
-                    is_active BOOLEAN DEFAULT 1
-                )
-            ''')
-            
-            # Files table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS files (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    filename TEXT NOT NULL,
-                    filepath TEXT UNIQUE NOT NULL,
-                    file_size INTEGER,
-                    file_type TEXT,
-                    mime_type TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    modified_at TIMESTAMP,
-                    accessed_at TIMESTAMP,
-                    owner_id INTEGER,
-                    permissions TEXT,
-                    is_hidden BOOLEAN DEFAULT 0,
-                    is_system_file BOOLEAN DEFAULT 0,
-                    FOREIGN KEY (owner_id) REFERENCES users (id)
-                )
-            ''')
-            
-            # Settings table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS settings (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    user_id INTEGER,
-                    setting_key TEXT NOT NULL,
-                    setting_value TEXT,
-                    setting_type TEXT DEFAULT 'string',
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (user_id) REFERENCES users (id),
-                    UNIQUE(user_id, setting_key)
-                )
-            ''')
-            
-            # Logs table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS logs (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    user_id INTEGER,
-                    action TEXT NOT NULL,
-                    details TEXT,
-                    ip_address TEXT,
-                    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    log_level TEXT DEFAULT 'INFO',
-                    FOREIGN KEY (user_id) REFERENCES users (id)
-                )
-            ''')
-            
-            conn.commit()
-            conn.close()
-            logging.info("Database initialized successfully")
+            version = SchemaMigrator(self.db).migrate()
+            logging.info(f"Database initialized successfully (schema v{version})")
             
         except Exception as e:
             logging.error(f"Database initialization error: {e}")
@@ -915,19 +1450,14 @@ class DatabaseManager:
     def create_user(self, username, password, email=None, full_name=None, is_admin=False):
         """Create a new user"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
             password_hash = hashlib.sha256(password.encode()).hexdigest()
             
-            cursor.execute('''
-                INSERT INTO users (username, password_hash, email, full_name, is_admin)
+            cursor = self.db.execute('''
+                INSERT INTO users (username, password_hash, email, fullname, is_admin)
                 VALUES (?, ?, ?, ?, ?)
-            ''', (username, password_hash, email, full_name, is_admin))
+            ''', (username, password_hash, email, full_name, is_admin), commit=True)
             
             user_id = cursor.lastrowid
-            conn.commit()
-            conn.close()
             
             logging.info(f"User created: {username}")
             return user_id
@@ -942,30 +1472,23 @@ class DatabaseManager:
     def authenticate_user(self, username, password):
         """Authenticate user"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
             password_hash = hashlib.sha256(password.encode()).hexdigest()
             
-            cursor.execute('''
+            user = self.db.query_one('''
                 SELECT id, username, is_admin, is_active
                 FROM users
                 WHERE username = ? AND password_hash = ? AND is_active = 1
             ''', (username, password_hash))
             
-            user = cursor.fetchone()
-            
             if user:
                 # Update last login
-                cursor.execute('''
+                self.db.execute('''
                     UPDATE users SET last_login = CURRENT_TIMESTAMP
                     WHERE id = ?
-                ''', (user[0],))
-                conn.commit()
+                ''', (user[0],), commit=True)
                 
                 logging.info(f"User authenticated: {username}")
                 
-            conn.close()
             return user
             
         except Exception as e:
@@ -973,18 +1496,9 @@ class DatabaseManager:
             return None
             
     def log_action(self, user_id, action, details=None, ip_address=None, log_level="INFO"):
-        """Log user action"""
+        """Queue a user action for the background audit writer"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                INSERT INTO logs (user_id, action, details, ip_address, log_level)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (user_id, action, details, ip_address, log_level))
-            
-            conn.commit()
-            conn.close()
+            audit_log.write((user_id, action, details, ip_address, log_level))
             
         except Exception as e:
             logging.error(f"Logging error: {e}")
@@ -1039,37 +1553,66 @@ class ConfigManager:
 class NotificationManager:
     """Notification system for Berke0S"""
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, config_manager=None):
         self.parent = parent
+        self.config_manager = config_manager or ConfigManager()
         self.notifications = []
         self.max_notifications = 5
         
+        # Reusable windows and notifications waiting for a free slot
+        self.pool = []
+        self.pending = collections.deque(maxlen=50)
+        self.dropped = 0
+        
     def show(self, title, message, notification_type="info", duration=5000):
         """Show notification"""
         try:
             if not GUI_AVAILABLE or not self.parent:
                 print(f"[{notification_type.upper()}] {title}: {message}")
                 return
-                
-            notification = NotificationWindow(self.parent, title, message, notification_type, duration)
-            self.notifications.append(notification)
             
-            # Remove old notifications
-            if len(self.notifications) > self.max_notifications:
-                old_notification = self.notifications.pop(0)
-                old_notification.destroy()
-                
             logging.info(f"Notification: {title} - {message}")
             
+            # Queue until a visible slot frees up
+            if len(self.notifications) >= self.max_notifications:
+                if len(self.pending) == self.pending.maxlen:
+                    self.dropped += 1
+                self.pending.append((title, message, notification_type, duration))
+                return
+            
+            notification = self.pool.pop() if self.pool else NotificationWindow(self.parent, self)
+            self.notifications.append(notification)
+            notification.fill(title, message, notification_type, duration, len(self.notifications) - 1)
+            
         except Exception as e:
             logging.error(f"Notification error: {e}")
             print(f"[{notification_type.upper()}] {title}: {message}")
+    
+    def release(self, notification):
+        """Return a hidden window to the pool and show the next queued notification"""
+        if notification in self.notifications:
+            self.notifications.remove(notification)
+        
+        if len(self.pool) < self.max_notifications:
+            self.pool.append(notification)
+        else:
+            notification.destroy()
+        
+        # Move remaining notifications up
+        for index, visible in enumerate(self.notifications):
+            visible.position_window(index)
+        
+        if self.pending:
+            self.show(*self.pending.popleft())
 
 class NotificationWindow:
-    """Individual notification window"""
+    """Individual notification window, reused through NotificationManager"""
     
-    def __init__(self, parent, title, message, notification_type="info", duration=5000):
+    def __init__(self, parent, manager):
         self.parent = parent
+        self.manager = manager
+        self.timer = None
+        self.animation = None
         self.window = tk.Toplevel(parent)
         self.window.withdraw()
         
@@ -1077,9 +1620,26 @@ class NotificationWindow:
         self.window.overrideredirect(True)
         self.window.attributes('-topmost', True)
         
-        # Get theme colors
-        config_manager = ConfigManager()
-        theme = config_manager.get_theme()
+        # Create frame
+        self.frame = tk.Frame(self.window, padx=10, pady=8)
+        self.frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Title
+        self.title_label = tk.Label(self.frame, font=("Ubuntu", 10, "bold"), fg="white")
+        self.title_label.pack(anchor="w")
+        
+        # Message
+        self.message_label = tk.Label(self.frame, font=("Ubuntu", 9), fg="white", wraplength=250)
+        self.message_label.pack(anchor="w")
+        
+        # Click to close
+        for widget in [self.window, self.frame, self.title_label, self.message_label]:
+            widget.bind("<Button-1>", lambda e: self.hide_animation())
+    
+    def fill(self, title, message, notification_type, duration, index):
+        """Show new content in this window"""
+        # Get theme colors from the shared config manager
+        theme = self.manager.config_manager.get_theme()
         
         # Set colors based on type
         colors = {
@@ -1091,50 +1651,46 @@ class NotificationWindow:
         
         bg_color = colors.get(notification_type, theme["info"])
         
-        # Create frame
-        frame = tk.Frame(self.window, bg=bg_color, padx=10, pady=8)
-        frame.pack(fill=tk.BOTH, expand=True)
-        
-        # Title
-        title_label = tk.Label(frame, text=title, font=("Ubuntu", 10, "bold"),
-                              bg=bg_color, fg="white")
-        title_label.pack(anchor="w")
-        
-        # Message
-        message_label = tk.Label(frame, text=message, font=("Ubuntu", 9),
-                                bg=bg_color, fg="white", wraplength=250)
-        message_label.pack(anchor="w")
+        self.frame.configure(bg=bg_color)
+        self.title_label.configure(text=title, bg=bg_color)
+        self.message_label.configure(text=message, bg=bg_color)
         
         # Position window
-        self.position_window()
+        self.position_window(index)
         
         # Show with animation
         self.show_animation()
         
         # Auto-hide
         if duration > 0:
-            self.window.after(duration, self.hide_animation)
-            
-        # Click to close
-        for widget in [self.window, frame, title_label, message_label]:
-            widget.bind("<Button-1>", lambda e: self.hide_animation())
+            self.timer = self.window.after(duration, self.hide_animation)
             
-    def position_window(self):
+    def position_window(self, index=0):
         """Position notification window"""
         self.window.update_idletasks()
         width = self.window.winfo_reqwidth()
         height = self.window.winfo_reqheight()
         
         screen_width = self.window.winfo_screenwidth()
-        screen_height = self.window.winfo_screenheight()
         
         x = screen_width - width - 20
-        y = 50
+        y = 50 + index * (height + 10)
         
         self.window.geometry(f"{width}x{height}+{x}+{y}")
         
+    def cancel_animation(self):
+        """Stop a running fade and the auto-hide timer"""
+        for after_id in (self.animation, self.timer):
+            if after_id:
+                try:
+                    self.window.after_cancel(after_id)
+                except:
+                    pass
+        self.animation = self.timer = None
+        
     def show_animation(self):
         """Show notification with animation"""
+        self.cancel_animation()
         self.window.deiconify()
         self.window.attributes('-alpha', 0.0)
         
@@ -1142,25 +1698,32 @@ class NotificationWindow:
             if alpha < 1.0:
                 alpha += 0.1
                 self.window.attributes('-alpha', alpha)
-                self.window.after(50, lambda: fade_in(alpha))
+                self.animation = self.window.after(50, lambda: fade_in(alpha))
                 
         fade_in()
         
     def hide_animation(self):
         """Hide notification with animation"""
+        if self not in self.manager.notifications:
+            return
+        self.cancel_animation()
+        
         def fade_out(alpha=1.0):
             if alpha > 0.0:
                 alpha -= 0.1
                 self.window.attributes('-alpha', alpha)
-                self.window.after(50, lambda: fade_out(alpha))
+                self.animation = self.window.after(50, lambda: fade_out(alpha))
             else:
-                self.destroy()
+                self.animation = None
+                self.window.withdraw()
+                self.manager.release(self)
                 
         fade_out()
         
     def destroy(self):
         """Destroy notification window"""
         try:
+            self.cancel_animation()
             self.window.destroy()
         except:
             pass
@@ -5678,6 +6241,479 @@ class VideoPlayer:
         except Exception as e:
             messagebox.showerror("Error", f"Cannot play video: {str(e)}")
 
+# Shared System Sampler
+SystemSnapshot = collections.namedtuple("SystemSnapshot", [
+    "timestamp", "interval",
+    "cpu_percent", "per_cpu_percent", "cpu_count",
+    "memory_total", "memory_available", "memory_used", "memory_percent",
+    "swap_total", "swap_used", "swap_percent",
+    "disk_total", "disk_used", "disk_percent",
+    "net_bytes_recv", "net_bytes_sent", "net_recv_rate", "net_sent_rate",
+    "disk_read_bytes", "disk_write_bytes", "disk_read_rate", "disk_write_rate"
+])
+
+class SystemSampler:
+    """Read /proc once per tick and publish immutable SystemSnapshot deltas"""
+    
+    SECTOR_SIZE = 512
+    
+    def __init__(self, disk_path="/", interval=1.0):
+        self.disk_path = disk_path
+        self.latest = None
+        self.previous_raw = None
+        self.subscribers = {}
+        self.next_token = 0
+        self.lock = threading.Lock()
+        self.use_proc = os.path.exists("/proc/stat")
+        self.block_devices = None
+        self.samples = 0
+        self.interval = interval
+        self.thread = None
+        self.stop_event = threading.Event()
+        
+    def subscribe(self, callback):
+        """Call callback(snapshot) after every tick; returns an unsubscribe token"""
+        with self.lock:
+            self.next_token += 1
+            self.subscribers[self.next_token] = callback
+            
+            # Sample only while someone is listening
+            self.stop_event.clear()
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.run, daemon=True, name="System Sampler")
+                self.thread.start()
+            return self.next_token
+    
+    def unsubscribe(self, token):
+        """Stop delivering snapshots to a subscriber"""
+        with self.lock:
+            self.subscribers.pop(token, None)
+            if not self.subscribers:
+                self.stop_event.set()
+    
+    def run(self):
+        """Sampling thread: one tick per interval while subscribed"""
+        while True:
+            with self.lock:
+                if not self.subscribers:
+                    self.thread = None
+                    return
+            
+            try:
+                self.sample()
+            except Exception as e:
+                logging.error(f"System sampler error: {e}")
+            self.stop_event.wait(self.interval)
+    
+    def read_cpu_times(self):
+        """Return (busy, total) jiffies for the aggregate and each CPU"""
+        times = []
+        with open("/proc/stat", 'r') as f:
+            for line in f:
+                if not line.startswith("cpu"):
+                    break
+                values = [int(v) for v in line.split()[1:9]]
+                values += [0] * (8 - len(values))
+                total = sum(values)
+                idle = values[3] + values[4]  # idle + iowait
+                times.append((total - idle, total))
+        return times
+    
+    def read_meminfo(self):
+        """Return /proc/meminfo values in bytes"""
+        info = {}
+        with open("/proc/meminfo", 'r') as f:
+            for line in f:
+                key, _, value = line.partition(':')
+                parts = value.split()
+                if parts:
+                    info[key] = int(parts[0]) * 1024
+        
+        if "MemAvailable" not in info:
+            info["MemAvailable"] = info.get("MemFree", 0) + info.get("Buffers", 0) + info.get("Cached", 0)
+        return info
+    
+    def read_net_counters(self):
+        """Return total received and sent bytes over non-loopback interfaces"""
+        recv = sent = 0
+        with open("/proc/net/dev", 'r') as f:
+            for line in f.readlines()[2:]:
+                name, _, data = line.partition(':')
+                if name.strip() == "lo":
+                    continue
+                fields = data.split()
+                if len(fields) >= 9:
+                    recv += int(fields[0])
+                    sent += int(fields[8])
+        return recv, sent
+    
+    def read_disk_counters(self):
+        """Return total read and written bytes over whole block devices"""
+        if self.block_devices is None:
+            try:
+                self.block_devices = {
+                    d for d in os.listdir("/sys/block")
+                    if not d.startswith(("loop", "ram", "zram"))
+                }
+            except OSError:
+                self.block_devices = set()
+        
+        read = written = 0
+        with open("/proc/diskstats", 'r') as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) < 10 or fields[2] not in self.block_devices:
+                    continue
+                read += int(fields[5]) * self.SECTOR_SIZE
+                written += int(fields[9]) * self.SECTOR_SIZE
+        return read, written
+    
+    def read_raw(self):
+        """Read every counter used to build a snapshot"""
+        if self.use_proc:
+            meminfo = self.read_meminfo()
+            raw = {
+                "time": time.monotonic(),
+                "cpu": self.read_cpu_times(),
+                "memory_total": meminfo.get("MemTotal", 0),
+                "memory_available": meminfo.get("MemAvailable", 0),
+                "swap_total": meminfo.get("SwapTotal", 0),
+                "swap_free": meminfo.get("SwapFree", 0),
+                "net": self.read_net_counters(),
+                "disk_io": self.read_disk_counters()
+            }
+        else:
+            # Non-Linux fallback through psutil
+            memory = psutil.virtual_memory()
+            swap = psutil.swap_memory()
+            net = psutil.net_io_counters()
+            disk_io = psutil.disk_io_counters()
+            raw = {
+                "time": time.monotonic(),
+                "cpu": None,
+                "cpu_percent": psutil.cpu_percent(interval=None),
+                "per_cpu_percent": tuple(psutil.cpu_percent(interval=None, percpu=True)),
+                "memory_total": memory.total,
+                "memory_available": memory.available,
+                "swap_total": swap.total,
+                "swap_free": swap.free,
+                "net": (net.bytes_recv, net.bytes_sent) if net else (0, 0),
+                "disk_io": (disk_io.read_bytes, disk_io.write_bytes) if disk_io else (0, 0)
+            }
+        
+        try:
+            usage = os.statvfs(self.disk_path)
+            raw["disk_total"] = usage.f_blocks * usage.f_frsize
+            raw["disk_free"] = usage.f_bavail * usage.f_frsize
+            raw["disk_used"] = (usage.f_blocks - usage.f_bfree) * usage.f_frsize
+        except OSError:
+            raw["disk_total"] = raw["disk_free"] = raw["disk_used"] = 0
+        
+        return raw
+    
+    def build_snapshot(self, raw, previous):
+        """Compute percentages and rates against the previous tick"""
+        interval = raw["time"] - previous["time"] if previous else 0.0
+        
+        if raw["cpu"] is not None:
+            def busy_percent(now, before):
+                total = now[1] - before[1]
+                return max(0.0, min(100.0, (now[0] - before[0]) * 100.0 / total)) if total > 0 else 0.0
+            
+            if previous and len(previous["cpu"]) == len(raw["cpu"]):
+                percents = [busy_percent(n, b) for n, b in zip(raw["cpu"], previous["cpu"])]
+            else:
+                # First tick: average since boot
+                percents = [busy * 100.0 / total if total else 0.0 for busy, total in raw["cpu"]]
+            cpu_percent = percents[0]
+            per_cpu = tuple(percents[1:])
+        else:
+            cpu_percent = raw["cpu_percent"]
+            per_cpu = raw["per_cpu_percent"]
+        
+        def rate(key, index):
+            if not previous or interval <= 0:
+                return 0.0
+            return max(0, raw[key][index] - previous[key][index]) / interval
+        
+        memory_used = raw["memory_total"] - raw["memory_available"]
+        swap_used = raw["swap_total"] - raw["swap_free"]
+        disk_capacity = raw["disk_used"] + raw["disk_free"]
+        
+        return SystemSnapshot(
+            timestamp=time.time(),
+            interval=interval,
+            cpu_percent=cpu_percent,
+            per_cpu_percent=per_cpu,
+            cpu_count=len(per_cpu) or 1,
+            memory_total=raw["memory_total"],
+            memory_available=raw["memory_available"],
+            memory_used=memory_used,
+            memory_percent=memory_used * 100.0 / raw["memory_total"] if raw["memory_total"] else 0.0,
+            swap_total=raw["swap_total"],
+            swap_used=swap_used,
+            swap_percent=swap_used * 100.0 / raw["swap_total"] if raw["swap_total"] else 0.0,
+            disk_total=raw["disk_total"],
+            disk_used=raw["disk_used"],
+            disk_percent=raw["disk_used"] * 100.0 / disk_capacity if disk_capacity else 0.0,
+            net_bytes_recv=raw["net"][0],
+            net_bytes_sent=raw["net"][1],
+            net_recv_rate=rate("net", 0),
+            net_sent_rate=rate("net", 1),
+            disk_read_bytes=raw["disk_io"][0],
+            disk_write_bytes=raw["disk_io"][1],
+            disk_read_rate=rate("disk_io", 0),
+            disk_write_rate=rate("disk_io", 1)
+        )
+    
+    def sample(self):
+        """Take one reading, publish it to subscribers and return it"""
+        raw = self.read_raw()
+        snapshot = self.build_snapshot(raw, self.previous_raw)
+        self.previous_raw = raw
+        self.latest = snapshot
+        self.samples += 1
+        
+        with self.lock:
+            subscribers = list(self.subscribers.values())
+        
+        for callback in subscribers:
+            try:
+                callback(snapshot)
+            except Exception as e:
+                logging.error(f"System sampler subscriber error: {e}")
+        
+        return snapshot
+    
+    def get_snapshot(self):
+        """Return the latest snapshot, sampling once if none exists yet"""
+        return self.latest or self.sample()
+
+system_sampler = SystemSampler()
+
+# Connectivity Monitor
+class ConnectivityMonitor:
+    """Track internet connectivity from link and route changes"""
+    
+    RTMGRP_LINK = 0x1
+    RTMGRP_IPV4_IFADDR = 0x10
+    RTMGRP_IPV4_ROUTE = 0x40
+    RTMGRP_IPV6_IFADDR = 0x100
+    RTMGRP_IPV6_ROUTE = 0x400
+    
+    def __init__(self, host="8.8.8.8", port=53, timeout=3, recheck_interval=300,
+                 retry_interval=15, max_retry_interval=30, poll_interval=2):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.recheck_interval = recheck_interval
+        self.retry_interval = retry_interval
+        self.max_retry_interval = max_retry_interval
+        self.failures = 0
+        self.status = "unknown"
+        self.connected = False
+        self.has_route = False
+        self.last_check = 0
+        self.last_change = None
+        self.fingerprint = None
+        self.subscribers = {}
+        self.next_token = 0
+        self.lock = threading.Lock()
+        self.netlink = None
+        self.netlink_opened = False
+        self.checks = 0
+        self.poll_interval = poll_interval
+        self.thread = None
+        
+    def open_netlink(self):
+        """Subscribe to kernel link, address and route notifications"""
+        try:
+            groups = (self.RTMGRP_LINK | self.RTMGRP_IPV4_IFADDR | self.RTMGRP_IPV4_ROUTE |
+                      self.RTMGRP_IPV6_IFADDR | self.RTMGRP_IPV6_ROUTE)
+            sock = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, 0)  # NETLINK_ROUTE
+            sock.bind((0, groups))
+            sock.setblocking(False)
+            return sock
+        except (AttributeError, OSError) as e:
+            logging.debug(f"Netlink unavailable, polling /proc/net/route: {e}")
+            return None
+    
+    def ensure_netlink(self):
+        """Open the netlink socket on first use rather than at construction"""
+        with self.lock:
+            if not self.netlink_opened:
+                self.netlink_opened = True
+                self.netlink = self.open_netlink()
+    
+    def subscribe(self, callback):
+        """Call callback(status, previous) whenever connectivity changes; returns an unsubscribe token"""
+        self.ensure_netlink()
+        with self.lock:
+            self.next_token += 1
+            self.subscribers[self.next_token] = callback
+            
+            # Watch only while someone is listening
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.run, daemon=True, name="Connectivity Monitor")
+                self.thread.start()
+            return self.next_token
+    
+    def unsubscribe(self, token):
+        """Stop delivering connectivity changes to a subscriber"""
+        with self.lock:
+            self.subscribers.pop(token, None)
+    
+    def drain_netlink(self):
+        """Return True if netlink reported any change since the last call"""
+        changed = False
+        while True:
+            try:
+                if not self.netlink.recv(65536):
+                    break
+                changed = True
+            except BlockingIOError:
+                break
+            except OSError:
+                # Receive buffer overrun: events were lost, assume a change
+                changed = True
+                break
+        return changed
+    
+    def read_fingerprint(self):
+        """Return the routing table and interface states, plus whether a default route exists"""
+        parts = []
+        has_route = False
+        
+        try:
+            with open("/proc/net/route", 'r') as f:
+                for line in f.readlines()[1:]:
+                    fields = line.split()
+                    if len(fields) >= 8:
+                        # Iface, Destination, Gateway, Flags and Mask; RefCnt and Use change constantly
+                        parts.append(" ".join(fields[i] for i in (0, 1, 2, 3, 7)))
+                        if fields[1] == "00000000" and int(fields[3], 16) & 0x1:
+                            has_route = True
+        except OSError:
+            has_route = True  # No routing table to inspect, let the probe decide
+        
+        try:
+            with open("/proc/net/ipv6_route", 'r') as f:
+                for line in f:
+                    fields = line.split()
+                    if len(fields) >= 10 and fields[9] != "lo":
+                        # Destination, prefix, next hop, flags and device, without the counters
+                        parts.append(" ".join(fields[i] for i in (0, 1, 4, 8, 9)))
+                        if fields[0] == "0" * 32 and fields[1] == "00":
+                            has_route = True
+        except OSError:
+            pass
+        
+        try:
+            for interface in sorted(os.listdir("/sys/class/net")):
+                try:
+                    with open(f"/sys/class/net/{interface}/operstate", 'r') as f:
+                        parts.append(f"{interface}={f.read().strip()}")
+                except OSError:
+                    continue
+        except OSError:
+            pass
+        
+        return hash(tuple(parts)), has_route
+    
+    def probe(self):
+        """Check that the configured host is reachable"""
+        try:
+            socket.create_connection((self.host, self.port), timeout=self.timeout).close()
+            return True
+        except OSError:
+            return False
+    
+    def poll(self, force=False):
+        """Re-check reachability only when links or routes changed, or a recheck is due
+        
+        Runs off the UI thread; returns the current status. A failed probe
+        with a default route is retried after a short backoff, the long
+        recheck interval only confirms a working connection.
+        """
+        self.ensure_netlink()
+        changed = force or self.fingerprint is None
+        if self.netlink:
+            changed = self.drain_netlink() or changed
+        
+        fingerprint, has_route = self.read_fingerprint()
+        if fingerprint != self.fingerprint:
+            changed = True
+        self.fingerprint = fingerprint
+        self.has_route = has_route
+        
+        interval = self.recheck_interval
+        if self.failures:
+            interval = min(self.retry_interval * 2 ** (self.failures - 1), self.max_retry_interval)
+        
+        if not changed and time.time() - self.last_check < interval:
+            return self.status
+        
+        # Without a default route there is nothing to probe
+        connected = self.probe() if has_route else False
+        self.failures = self.failures + 1 if has_route and not connected else 0
+        self.last_check = time.time()
+        self.checks += 1
+        self.set_status("connected" if connected else "disconnected")
+        return self.status
+    
+    def set_status(self, status):
+        """Store the new state and notify subscribers on transitions"""
+        previous = self.status
+        self.connected = status == "connected"
+        self.status = status
+        
+        if status == previous:
+            return
+        
+        self.last_change = time.time()
+        logging.info(f"Connectivity changed: {previous} -> {status}")
+        
+        with self.lock:
+            subscribers = list(self.subscribers.values())
+        
+        for callback in subscribers:
+            try:
+                callback(status, previous)
+            except Exception as e:
+                logging.error(f"Connectivity subscriber error: {e}")
+    
+    def run(self):
+        """Monitor loop while subscribed: wake early on netlink events, otherwise poll"""
+        while True:
+            with self.lock:
+                if not self.subscribers:
+                    self.thread = None
+                    return
+            
+            try:
+                self.poll()
+            except Exception as e:
+                logging.error(f"Connectivity monitor error: {e}")
+            
+            if self.netlink:
+                select.select([self.netlink], [], [], self.poll_interval)
+            else:
+                time.sleep(self.poll_interval)
+    
+    def get_state(self):
+        """Return the cached connectivity state"""
+        return {
+            "status": self.status,
+            "has_route": self.has_route,
+            "last_check": self.last_check,
+            "last_change": self.last_change,
+            "checks": self.checks,
+            "failures": self.failures,
+            "netlink": self.netlink is not None
+        }
+
+connectivity_monitor = ConnectivityMonitor()
+
 class SystemMonitor:
     """System monitoring and performance tools"""
     
@@ -5689,6 +6725,10 @@ class SystemMonitor:
         
         self.monitoring = False
         self.update_interval = 1000  # 1 second
+        self.snapshot = None
+        self.sampler_token = None
+        self.connectivity = "unknown"
+        self.connectivity_token = None
         
         self.create_window()
         self.start_monitoring()
@@ -5886,11 +6926,28 @@ class SystemMonitor:
     def start_monitoring(self):
         """Start system monitoring"""
         self.monitoring = True
+        self.sampler_token = system_sampler.subscribe(self.on_snapshot)
+        self.connectivity = connectivity_monitor.status
+        self.connectivity_token = connectivity_monitor.subscribe(self.on_connectivity)
         self.update_system_stats()
         
     def stop_monitoring(self):
         """Stop system monitoring"""
         self.monitoring = False
+        if self.sampler_token is not None:
+            system_sampler.unsubscribe(self.sampler_token)
+            self.sampler_token = None
+        if self.connectivity_token is not None:
+            connectivity_monitor.unsubscribe(self.connectivity_token)
+            self.connectivity_token = None
+    
+    def on_snapshot(self, snapshot):
+        """Keep the newest sampler snapshot for the next UI refresh"""
+        self.snapshot = snapshot
+    
+    def on_connectivity(self, status, previous):
+        """Keep the newest connectivity status for the next UI refresh"""
+        self.connectivity = status
         
     def update_system_stats(self):
         """Update system statistics"""
@@ -5898,33 +6955,33 @@ class SystemMonitor:
             return
             
         try:
+            snapshot = self.snapshot or system_sampler.get_snapshot()
+            
             # CPU usage
-            cpu_percent = psutil.cpu_percent(interval=None)
+            cpu_percent = snapshot.cpu_percent
             self.cpu_var.set(f"CPU Usage: {cpu_percent:.1f}%")
             self.cpu_progress['value'] = cpu_percent
             
             # Memory usage
-            memory = psutil.virtual_memory()
-            memory_percent = memory.percent
-            memory_used = memory.used // (1024**3)  # GB
-            memory_total = memory.total // (1024**3)  # GB
+            memory_percent = snapshot.memory_percent
+            memory_used = snapshot.memory_used // (1024**3)  # GB
+            memory_total = snapshot.memory_total // (1024**3)  # GB
             self.memory_var.set(f"Memory Usage: {memory_percent:.1f}% ({memory_used}GB / {memory_total}GB)")
             self.memory_progress['value'] = memory_percent
             
             # Disk usage
-            disk = psutil.disk_usage('/')
-            disk_percent = (disk.used / disk.total) * 100
-            disk_used = disk.used // (1024**3)  # GB
-            disk_total = disk.total // (1024**3)  # GB
+            disk_percent = snapshot.disk_percent
+            disk_used = snapshot.disk_used // (1024**3)  # GB
+            disk_total = snapshot.disk_total // (1024**3)  # GB
             self.disk_var.set(f"Disk Usage: {disk_percent:.1f}% ({disk_used}GB / {disk_total}GB)")
             self.disk_progress['value'] = disk_percent
             
-            # Network status
-            try:
-                # Check if connected to internet
-                socket.create_connection(("8.8.8.8", 53), timeout=3)
+            # Network status, cached by the connectivity monitor
+            if self.connectivity == "unknown":
+                self.network_var.set("Network: Checking...")
+            elif self.connectivity == "connected":
                 self.network_var.set("Network: Connected")
-            except OSError:
+            else:
                 self.network_var.set("Network: Disconnected")
                 
             # Update other tabs if they're visible
@@ -6157,6 +7214,11 @@ class DesktopEnvironment:
     def __init__(self):
         self.config_manager = ConfigManager()
         self.db_manager = DatabaseManager()
+        audit_log.configure(
+            batch_size=self.config_manager.get("audit_batch_size"),
+            flush_interval=self.config_manager.get("audit_flush_interval"),
+            max_queued=self.config_manager.get("audit_max_queued")
+        )
         self.lang_manager = LanguageManager()
         self.sound_manager = SoundManager()
         
@@ -6205,7 +7267,7 @@ class DesktopEnvironment:
         self.root.configure(bg=theme["bg_primary"])
         
         # Initialize managers
-        self.notification_manager = NotificationManager(self.root)
+        self.notification_manager = NotificationManager(self.root, self.config_manager)
         
         # Show login screen
         self.show_login()
@@ -6610,6 +7672,13 @@ def main():
         print(f"Fatal error: {str(e)}")
         logging.error(f"Fatal error: {e}")
         sys.exit(1)
+    finally:
+        # Write out queued audit rows before exiting
+        audit_log.stop()
+        stats = audit_log.get_stats()
+        if stats["dropped"] or stats["failed"]:
+            logging.warning(f"Audit log lost entries: {stats['dropped']} dropped, {stats['failed']} failed")
+        database.close()
 
 if __name__ == "__main__":
     main()
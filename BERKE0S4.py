@@ -133,6 +133,157 @@ logging.basicConfig(
 )
 logger = logging.getLogger('Berke0S')
 
+# Shared SQLite access layer
+class Database:
+    """Process-wide SQLite access with long-lived per-thread connections
+    
+    Each thread gets one connection in WAL mode with a busy timeout and
+    sqlite3's prepared statement cache, instead of connecting per call.
+    Query timings are collected per statement.
+    """
+    
+    def __init__(self, path, busy_timeout=5.0, cached_statements=256):
+        self.path = path
+        self.busy_timeout = busy_timeout
+        self.cached_statements = cached_statements
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.connections = []
+        self.query_stats = {}
+        self.max_tracked_queries = 200
+    
+    def open(self):
+        """Open a new tuned connection that is not tied to a thread"""
+        conn = sqlite3.connect(
+            self.path,
+            timeout=self.busy_timeout,
+            cached_statements=self.cached_statements,
+            check_same_thread=False
+        )
+        conn.execute(f"PRAGMA busy_timeout = {int(self.busy_timeout * 1000)}")
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        return conn
+    
+    def connect(self):
+        """Return this thread's connection, opening it on first use"""
+        conn = getattr(self.local, 'conn', None)
+        if conn is None:
+            conn = self.open()
+            self.local.conn = conn
+            with self.lock:
+                self.connections.append(conn)
+        return conn
+    
+    def record(self, sql, elapsed):
+        """Add a statement's duration to the query stats"""
+        key = " ".join(sql.split())[:200]
+        with self.lock:
+            stats = self.query_stats.get(key)
+            if stats is None:
+                if len(self.query_stats) >= self.max_tracked_queries:
+                    return
+                stats = self.query_stats[key] = {"count": 0, "total": 0.0, "max": 0.0}
+            stats["count"] += 1
+            stats["total"] += elapsed
+            stats["max"] = max(stats["max"], elapsed)
+    
+    def execute(self, sql, params=(), commit=False):
+        """Run a statement and return its cursor"""
+        conn = self.connect()
+        start = time.perf_counter()
+        try:
+            cursor = conn.execute(sql, params)
+            if commit:
+                conn.commit()
+            return cursor
+        except Exception:
+            if commit:
+                conn.rollback()
+            raise
+        finally:
+            self.record(sql, time.perf_counter() - start)
+    
+    def executemany(self, sql, rows, commit=True):
+        """Run a statement for many parameter rows"""
+        conn = self.connect()
+        start = time.perf_counter()
+        try:
+            cursor = conn.executemany(sql, rows)
+            if commit:
+                conn.commit()
+            return cursor
+        except Exception:
+            if commit:
+                conn.rollback()
+            raise
+        finally:
+            self.record(sql, time.perf_counter() - start)
+    
+    def executescript(self, script):
+        """Run a multi-statement script"""
+        conn = self.connect()
+        start = time.perf_counter()
+        try:
+            conn.executescript(script)
+        finally:
+            self.record(script, time.perf_counter() - start)
+    
+    def query(self, sql, params=()):
+        """Fetch all rows of a query"""
+        return self.execute(sql, params).fetchall()
+    
+    def query_one(self, sql, params=()):
+        """Fetch the first row of a query"""
+        return self.execute(sql, params).fetchone()
+    
+    def commit(self):
+        """Commit this thread's pending transaction"""
+        self.connect().commit()
+    
+    def rollback(self):
+        """Roll back this thread's pending transaction"""
+        try:
+            self.connect().rollback()
+        except Exception as e:
+            logger.warning(f"Database rollback error: {e}")
+    
+    def checkpoint(self):
+        """Copy WAL contents back into the database file"""
+        return self.query_one("PRAGMA wal_checkpoint(TRUNCATE)")
+    
+    def get_stats(self, limit=10):
+        """Return connection count and the slowest statements by total time"""
+        with self.lock:
+            queries = sorted(self.query_stats.items(), key=lambda item: item[1]["total"], reverse=True)[:limit]
+            return {
+                "connections": len(self.connections),
+                "queries": [
+                    {
+                        "sql": sql,
+                        "count": stats["count"],
+                        "total_ms": stats["total"] * 1000,
+                        "avg_ms": stats["total"] * 1000 / stats["count"],
+                        "max_ms": stats["max"] * 1000
+                    }
+                    for sql, stats in queries
+                ]
+            }
+    
+    def close(self):
+        """Close every connection opened through this layer"""
+        with self.lock:
+            connections, self.connections = self.connections, []
+        for conn in connections:
+            try:
+                conn.close()
+            except Exception as e:
+                logger.warning(f"Database close error: {e}")
+        self.local = threading.local()
+
+database = Database(DATABASE_FILE)
+
 # Enhanced default configuration
 DEFAULT_CONFIG = {
     "version": "4.0",
@@ -365,230 +516,352 @@ def setup_display():
         logger.error(f"Display setup failed: {e}")
         return True  # Continue anyway for headless/console mode
 
+# Unified database schema shared by every Berke0S component
+SCHEMA_VERSION = 3
+
+SCHEMA_TABLES = {
+    "users": '''
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        username TEXT UNIQUE NOT NULL,
+        fullname TEXT,
+        email TEXT,
+        password_hash TEXT,
+        salt TEXT,
+        is_admin INTEGER DEFAULT 0,
+        is_active INTEGER DEFAULT 1,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        last_login TIMESTAMP,
+        login_count INTEGER DEFAULT 0,
+        failed_login_attempts INTEGER DEFAULT 0,
+        locked_until TIMESTAMP,
+        preferences TEXT,
+        avatar_path TEXT,
+        theme TEXT DEFAULT 'berke_dark',
+        language TEXT DEFAULT 'tr_TR'
+    ''',
+    "sessions": '''
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id INTEGER,
+        session_token TEXT UNIQUE,
+        session_data TEXT,
+        ip_address TEXT,
+        user_agent TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        expires_at TIMESTAMP,
+        is_active INTEGER DEFAULT 1,
+        FOREIGN KEY (user_id) REFERENCES users (id)
+    ''',
+    "applications": '''
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        command TEXT,
+        icon TEXT,
+        icon_path TEXT,
+        executable_path TEXT,
+        category TEXT,
+        description TEXT,
+        version TEXT,
+        author TEXT,
+        website TEXT,
+        installed INTEGER DEFAULT 1,
+        installed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        is_system_app INTEGER DEFAULT 0,
+        is_active INTEGER DEFAULT 1,
+        auto_start INTEGER DEFAULT 0,
+        last_used TIMESTAMP,
+        usage_count INTEGER DEFAULT 0,
+        file_associations TEXT,
+        permissions TEXT
+    ''',
+    "file_metadata": '''
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        file_path TEXT UNIQUE,
+        file_name TEXT,
+        file_type TEXT,
+        mime_type TEXT,
+        size INTEGER,
+        created_at TIMESTAMP,
+        modified_at TIMESTAMP,
+        accessed_at TIMESTAMP,
+        tags TEXT,
+        rating INTEGER DEFAULT 0,
+        description TEXT,
+        thumbnail_path TEXT,
+        checksum TEXT
+    ''',
+    "files": '''
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        filename TEXT NOT NULL,
+        filepath TEXT UNIQUE NOT NULL,
+        file_size INTEGER,
+        file_type TEXT,
+        mime_type TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        modified_at TIMESTAMP,
+        accessed_at TIMESTAMP,
+        owner_id INTEGER,
+        permissions TEXT,
+        is_hidden INTEGER DEFAULT 0,
+        is_system_file INTEGER DEFAULT 0,
+        FOREIGN KEY (owner_id) REFERENCES users (id)
+    ''',
+    "settings": '''
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id INTEGER,
+        category TEXT,
+        key TEXT,
+        value TEXT,
+        data_type TEXT DEFAULT 'string',
+        setting_key TEXT,
+        setting_value TEXT,
+        setting_type TEXT DEFAULT 'string',
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (user_id) REFERENCES users (id)
+    ''',
+    "system_logs": '''
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        level TEXT,
+        message TEXT,
+        component TEXT,
+        user_id INTEGER,
+        ip_address TEXT,
+        timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        details TEXT,
+        FOREIGN KEY (user_id) REFERENCES users (id)
+    ''',
+    "display_logs": '''
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        event_type TEXT,
+        display_id TEXT,
+        message TEXT,
+        success INTEGER,
+        timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    ''',
+    "logs": '''
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id INTEGER,
+        action TEXT NOT NULL,
+        details TEXT,
+        ip_address TEXT,
+        timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        log_level TEXT DEFAULT 'INFO',
+        FOREIGN KEY (user_id) REFERENCES users (id)
+    ''',
+    "bookmarks": '''
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id INTEGER,
+        name TEXT NOT NULL,
+        path TEXT NOT NULL,
+        icon TEXT,
+        category TEXT DEFAULT 'general',
+        order_index INTEGER DEFAULT 0,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (user_id) REFERENCES users (id)
+    ''',
+    "recent_files": '''
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id INTEGER,
+        file_path TEXT NOT NULL,
+        file_name TEXT,
+        application TEXT,
+        opened_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (user_id) REFERENCES users (id)
+    ''',
+    "themes": '''
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT UNIQUE NOT NULL,
+        display_name TEXT,
+        author TEXT,
+        version TEXT,
+        description TEXT,
+        theme_data TEXT,
+        preview_image TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        is_system INTEGER DEFAULT 0
+    ''',
+    "plugins": '''
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT UNIQUE NOT NULL,
+        display_name TEXT,
+        version TEXT,
+        author TEXT,
+        description TEXT,
+        file_path TEXT,
+        enabled INTEGER DEFAULT 0,
+        auto_load INTEGER DEFAULT 0,
+        dependencies TEXT,
+        permissions TEXT,
+        installed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    ''',
+    "network_connections": '''
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        type TEXT NOT NULL,
+        ssid TEXT,
+        password TEXT,
+        security_type TEXT,
+        auto_connect INTEGER DEFAULT 0,
+        priority INTEGER DEFAULT 0,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        last_connected TIMESTAMP
+    ''',
+    "system_performance": '''
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        cpu_percent REAL,
+        memory_percent REAL,
+        disk_percent REAL,
+        network_bytes_sent INTEGER,
+        network_bytes_recv INTEGER,
+        temperature REAL,
+        battery_percent REAL
+    ''',
+    "system_logs_hourly": '''
+        hour TIMESTAMP NOT NULL,
+        level TEXT NOT NULL,
+        component TEXT NOT NULL,
+        entries INTEGER DEFAULT 0,
+        PRIMARY KEY (hour, level, component)
+    ''',
+    "display_logs_hourly": '''
+        hour TIMESTAMP NOT NULL,
+        event_type TEXT NOT NULL,
+        display_id TEXT NOT NULL,
+        entries INTEGER DEFAULT 0,
+        failures INTEGER DEFAULT 0,
+        PRIMARY KEY (hour, event_type, display_id)
+    ''',
+    "logs_hourly": '''
+        hour TIMESTAMP NOT NULL,
+        action TEXT NOT NULL,
+        log_level TEXT NOT NULL,
+        entries INTEGER DEFAULT 0,
+        PRIMARY KEY (hour, action, log_level)
+    '''
+}
+
+# Legacy column names that map onto a unified column: (table, old name) -> new name
+SCHEMA_RENAMED_COLUMNS = {
+    ("users", "full_name"): "fullname"
+}
+
+# Usernames, session tokens and file paths are indexed by their UNIQUE constraints
+SCHEMA_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS idx_sessions_user_id ON sessions (user_id, is_active)",
+    "CREATE INDEX IF NOT EXISTS idx_sessions_expires_at ON sessions (expires_at)",
+    "CREATE INDEX IF NOT EXISTS idx_applications_category ON applications (category, name)",
+    "CREATE INDEX IF NOT EXISTS idx_applications_name ON applications (name)",
+    "CREATE UNIQUE INDEX IF NOT EXISTS idx_settings_category_key ON settings (user_id, category, key)",
+    "CREATE UNIQUE INDEX IF NOT EXISTS idx_settings_setting_key ON settings (user_id, setting_key)",
+    "CREATE INDEX IF NOT EXISTS idx_system_logs_timestamp ON system_logs (timestamp)",
+    "CREATE INDEX IF NOT EXISTS idx_system_logs_component ON system_logs (component, timestamp)",
+    "CREATE INDEX IF NOT EXISTS idx_display_logs_timestamp ON display_logs (timestamp)",
+    "CREATE INDEX IF NOT EXISTS idx_logs_timestamp ON logs (timestamp)",
+    "CREATE INDEX IF NOT EXISTS idx_logs_user_id ON logs (user_id, timestamp)",
+    "CREATE INDEX IF NOT EXISTS idx_bookmarks_category ON bookmarks (user_id, category, order_index)",
+    "CREATE INDEX IF NOT EXISTS idx_recent_files_opened_at ON recent_files (user_id, opened_at)",
+    "CREATE INDEX IF NOT EXISTS idx_system_performance_timestamp ON system_performance (timestamp)"
+]
+
+class SchemaMigrator:
+    """Versioned migrations that bring berke0s.db to the unified schema
+    
+    The version is stored in PRAGMA user_version. Pending migrations run in
+    one immediate transaction, so concurrent processes migrate only once.
+    """
+    
+    def __init__(self, db):
+        self.db = db
+        self.migrations = [
+            (1, "unify component tables", self.unify_tables),
+            (2, "add secondary indexes", self.create_indexes),
+            (3, "add hourly log summaries", self.unify_tables)
+        ]
+    
+    def get_version(self):
+        """Return the schema version stored in the database"""
+        return self.db.query_one("PRAGMA user_version")[0]
+    
+    def migrate(self, target=SCHEMA_VERSION):
+        """Run pending migrations up to target and return the schema version"""
+        version = self.get_version()
+        if version < target:
+            version = self.run_migrations(target)
+        return version
+    
+    def run_migrations(self, target):
+        """Apply pending migrations in one immediate transaction"""
+        self.db.execute("BEGIN IMMEDIATE")
+        try:
+            version = self.get_version()
+            for number, description, migration in self.migrations:
+                if version < number <= target:
+                    start = time.perf_counter()
+                    migration()
+                    self.db.execute(f"PRAGMA user_version = {number}")
+                    version = number
+                    logger.info(f"Schema migration {number} ({description}) took "
+                             f"{(time.perf_counter() - start) * 1000:.1f} ms")
+            self.db.commit()
+            return version
+        except Exception:
+            self.db.rollback()
+            raise
+    
+    def unify_tables(self):
+        """Create missing tables and rebuild tables whose columns differ"""
+        reference = sqlite3.connect(":memory:")
+        try:
+            for table, columns in SCHEMA_TABLES.items():
+                reference.execute(f"CREATE TABLE {table} ({columns})")
+                expected = reference.execute(f"PRAGMA table_info({table})").fetchall()
+                current = self.db.query(f"PRAGMA table_info({table})")
+                if not current:
+                    self.db.execute(f"CREATE TABLE {table} ({columns})")
+                elif sorted(c[1:] for c in current) != sorted(c[1:] for c in expected):
+                    self.rebuild_table(table, columns, [c[1] for c in current], [c[1] for c in expected])
+        finally:
+            reference.close()
+    
+    def rebuild_table(self, table, columns, current, expected):
+        """Copy a table into the unified layout, keeping every shared column"""
+        sources = []
+        targets = []
+        for name in current:
+            target = SCHEMA_RENAMED_COLUMNS.get((table, name), name)
+            if target in expected and target not in targets:
+                sources.append(name)
+                targets.append(target)
+        
+        temp = f"{table}_migrating"
+        self.db.execute(f"DROP TABLE IF EXISTS {temp}")
+        self.db.execute(f"CREATE TABLE {temp} ({columns})")
+        self.db.execute(f"INSERT INTO {temp} ({', '.join(targets)}) SELECT {', '.join(sources)} FROM {table}")
+        self.db.execute(f"DROP TABLE {table}")
+        self.db.execute(f"ALTER TABLE {temp} RENAME TO {table}")
+        
+        dropped = [name for name in current if name not in sources]
+        if dropped:
+            logger.warning(f"Schema migration dropped {table} columns: {', '.join(dropped)}")
+    
+    def create_indexes(self):
+        """Create the secondary indexes of the unified schema"""
+        for sql in SCHEMA_INDEXES:
+            self.db.execute(sql)
+
 def init_database():
     """Initialize enhanced SQLite database for system data"""
     try:
-        conn = sqlite3.connect(DATABASE_FILE)
-        cursor = conn.cursor()
-        
-        # Users table with enhanced fields
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS users (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                username TEXT UNIQUE NOT NULL,
-                fullname TEXT,
-                email TEXT,
-                password_hash TEXT NOT NULL,
-                salt TEXT NOT NULL,
-                is_admin INTEGER DEFAULT 0,
-                is_active INTEGER DEFAULT 1,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                last_login TIMESTAMP,
-                login_count INTEGER DEFAULT 0,
-                failed_login_attempts INTEGER DEFAULT 0,
-                locked_until TIMESTAMP,
-                preferences TEXT,
-                avatar_path TEXT,
-                theme TEXT DEFAULT 'berke_dark',
-                language TEXT DEFAULT 'tr_TR'
-            )
-        ''')
-        
-        # Sessions table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS sessions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_id INTEGER,
-                session_token TEXT UNIQUE,
-                session_data TEXT,
-                ip_address TEXT,
-                user_agent TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                expires_at TIMESTAMP,
-                is_active INTEGER DEFAULT 1,
-                FOREIGN KEY (user_id) REFERENCES users (id)
-            )
-        ''')
-        
-        # Files metadata table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS file_metadata (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                file_path TEXT UNIQUE,
-                file_name TEXT,
-                file_type TEXT,
-                mime_type TEXT,
-                size INTEGER,
-                created_at TIMESTAMP,
-                modified_at TIMESTAMP,
-                accessed_at TIMESTAMP,
-                tags TEXT,
-                rating INTEGER DEFAULT 0,
-                description TEXT,
-                thumbnail_path TEXT,
-                checksum TEXT
-            )
-        ''')
-        
-        # System logs table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS system_logs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                level TEXT,
-                message TEXT,
-                component TEXT,
-                user_id INTEGER,
-                ip_address TEXT,
-                timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                details TEXT,
-                FOREIGN KEY (user_id) REFERENCES users (id)
-            )
-        ''')
-        
-        # Applications table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS applications (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                command TEXT NOT NULL,
-                icon TEXT,
-                category TEXT,
-                description TEXT,
-                version TEXT,
-                author TEXT,
-                website TEXT,
-                installed INTEGER DEFAULT 1,
-                auto_start INTEGER DEFAULT 0,
-                last_used TIMESTAMP,
-                usage_count INTEGER DEFAULT 0,
-                file_associations TEXT,
-                permissions TEXT
-            )
-        ''')
-        
-        # Settings table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS settings (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_id INTEGER,
-                category TEXT,
-                key TEXT,
-                value TEXT,
-                data_type TEXT DEFAULT 'string',
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (user_id) REFERENCES users (id),
-                UNIQUE(user_id, category, key)
-            )
-        ''')
-        
-        # Bookmarks table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS bookmarks (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_id INTEGER,
-                name TEXT NOT NULL,
-                path TEXT NOT NULL,
-                icon TEXT,
-                category TEXT DEFAULT 'general',
-                order_index INTEGER DEFAULT 0,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (user_id) REFERENCES users (id)
-            )
-        ''')
-        
-        # Recent files table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS recent_files (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_id INTEGER,
-                file_path TEXT NOT NULL,
-                file_name TEXT,
-                application TEXT,
-                opened_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (user_id) REFERENCES users (id)
-            )
-        ''')
-        
-        # Themes table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS themes (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT UNIQUE NOT NULL,
-                display_name TEXT,
-                author TEXT,
-                version TEXT,
-                description TEXT,
-                theme_data TEXT,
-                preview_image TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                is_system INTEGER DEFAULT 0
-            )
-        ''')
-        
-        # Plugins table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS plugins (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT UNIQUE NOT NULL,
-                display_name TEXT,
-                version TEXT,
-                author TEXT,
-                description TEXT,
-                file_path TEXT,
-                enabled INTEGER DEFAULT 0,
-                auto_load INTEGER DEFAULT 0,
-                dependencies TEXT,
-                permissions TEXT,
-                installed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        # Network connections table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS network_connections (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                type TEXT NOT NULL,
-                ssid TEXT,
-                password TEXT,
-                security_type TEXT,
-                auto_connect INTEGER DEFAULT 0,
-                priority INTEGER DEFAULT 0,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                last_connected TIMESTAMP
-            )
-        ''')
-        
-        # System performance table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS system_performance (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                cpu_percent REAL,
-                memory_percent REAL,
-                disk_percent REAL,
-                network_bytes_sent INTEGER,
-                network_bytes_recv INTEGER,
-                temperature REAL,
-                battery_percent REAL
-            )
-        ''')
-        
-        conn.commit()
-        conn.close()
-        logger.info("Enhanced database initialized successfully")
-        
+        version = SchemaMigrator(database).migrate()
+        logger.info(f"Enhanced database initialized successfully (schema v{version})")
     except Exception as e:
         logger.error(f"Database initialization failed: {e}")
 
 def create_default_user():
     """Create default admin user if no users exist"""
     try:
-        conn = sqlite3.connect(DATABASE_FILE)
-        cursor = conn.cursor()
-        
-        cursor.execute("SELECT COUNT(*) FROM users")
+        cursor = database.execute("SELECT COUNT(*) FROM users")
         user_count = cursor.fetchone()[0]
         
         if user_count == 0:
@@ -596,17 +869,16 @@ def create_default_user():
             salt = os.urandom(32)
             password_hash = hashlib.pbkdf2_hmac('sha256', b'admin', salt, 100000)
             
-            cursor.execute('''
+            database.execute('''
                 INSERT INTO users (username, fullname, password_hash, salt, is_admin, is_active)
                 VALUES (?, ?, ?, ?, ?, ?)
             ''', ('admin', 'Administrator', password_hash.hex(), salt.hex(), 1, 1))
             
-            conn.commit()
+            database.commit()
             logger.info("Default admin user created (username: admin, password: admin)")
         
-        conn.close()
-        
     except Exception as e:
+        database.rollback()
         logger.error(f"Default user creation failed: {e}")
 
 # Enhanced Security System
@@ -671,10 +943,7 @@ class SecurityManager:
             if self.is_account_locked(username):
                 return None, "Account is temporarily locked due to failed login attempts"
             
-            conn = sqlite3.connect(DATABASE_FILE)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
+            cursor = database.execute('''
                 SELECT id, username, fullname, password_hash, salt, is_admin, is_active, 
                        failed_login_attempts, locked_until
                 FROM users WHERE username = ?
@@ -710,12 +979,10 @@ class SecurityManager:
                     'session_token': session_token
                 }
                 
-                conn.close()
                 return user_info, "Login successful"
             else:
                 # Failed login
                 self.record_failed_attempt(username, user_id)
-                conn.close()
                 return None, "Invalid username or password"
                 
         except Exception as e:
@@ -725,16 +992,12 @@ class SecurityManager:
     def is_account_locked(self, username):
         """Check if account is locked"""
         try:
-            conn = sqlite3.connect(DATABASE_FILE)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
+            cursor = database.execute('''
                 SELECT locked_until, failed_login_attempts 
                 FROM users WHERE username = ?
             ''', (username,))
             
             result = cursor.fetchone()
-            conn.close()
             
             if result:
                 locked_until, failed_attempts = result
@@ -756,18 +1019,15 @@ class SecurityManager:
     def record_failed_attempt(self, username, user_id=None):
         """Record failed login attempt"""
         try:
-            conn = sqlite3.connect(DATABASE_FILE)
-            cursor = conn.cursor()
-            
             if user_id:
-                cursor.execute('''
+                database.execute('''
                     UPDATE users 
                     SET failed_login_attempts = failed_login_attempts + 1
                     WHERE id = ?
                 ''', (user_id,))
                 
                 # Check if should lock account
-                cursor.execute('SELECT failed_login_attempts FROM users WHERE id = ?', (user_id,))
+                cursor = database.execute('SELECT failed_login_attempts FROM users WHERE id = ?', (user_id,))
                 attempts = cursor.fetchone()[0]
                 
                 max_attempts = self.security_config.get("max_failed_attempts", 5)
@@ -775,63 +1035,57 @@ class SecurityManager:
                     lockout_duration = self.security_config.get("lockout_duration", 300)
                     locked_until = datetime.datetime.now() + datetime.timedelta(seconds=lockout_duration)
                     
-                    cursor.execute('''
+                    database.execute('''
                         UPDATE users 
                         SET locked_until = ?
                         WHERE id = ?
                     ''', (locked_until.isoformat(), user_id))
             
             # Log the attempt
-            cursor.execute('''
+            database.execute('''
                 INSERT INTO system_logs (level, message, component, user_id)
                 VALUES (?, ?, ?, ?)
             ''', ('WARNING', f'Failed login attempt for username: {username}', 'Security', user_id))
             
-            conn.commit()
-            conn.close()
+            database.commit()
             
         except Exception as e:
+            database.rollback()
             logger.error(f"Failed attempt recording error: {e}")
     
     def clear_failed_attempts(self, username):
         """Clear failed login attempts"""
         try:
-            conn = sqlite3.connect(DATABASE_FILE)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
+            database.execute('''
                 UPDATE users 
                 SET failed_login_attempts = 0, locked_until = NULL
                 WHERE username = ?
             ''', (username,))
             
-            conn.commit()
-            conn.close()
+            database.commit()
             
         except Exception as e:
+            database.rollback()
             logger.error(f"Clear failed attempts error: {e}")
     
     def update_login_info(self, user_id):
         """Update user login information"""
         try:
-            conn = sqlite3.connect(DATABASE_FILE)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
+            database.execute('''
                 UPDATE users 
                 SET last_login = CURRENT_TIMESTAMP, login_count = login_count + 1
                 WHERE id = ?
             ''', (user_id,))
             
-            cursor.execute('''
+            database.execute('''
                 INSERT INTO system_logs (level, message, component, user_id)
                 VALUES (?, ?, ?, ?)
             ''', ('INFO', 'User logged in successfully', 'Security', user_id))
             
-            conn.commit()
-            conn.close()
+            database.commit()
             
         except Exception as e:
+            database.rollback()
             logger.error(f"Login info update error: {e}")
     
     def create_session_token(self, user_id):
@@ -842,16 +1096,12 @@ class SecurityManager:
                 seconds=self.security_config.get("session_timeout", 3600)
             )
             
-            conn = sqlite3.connect(DATABASE_FILE)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
+            database.execute('''
                 INSERT INTO sessions (user_id, session_token, expires_at)
                 VALUES (?, ?, ?)
             ''', (user_id, token, expires_at.isoformat()))
             
-            conn.commit()
-            conn.close()
+            database.commit()
             
             self.session_tokens[token] = {
                 'user_id': user_id,
@@ -861,6 +1111,7 @@ class SecurityManager:
             return token
             
         except Exception as e:
+            database.rollback()
             logger.error(f"Session token creation error: {e}")
             return None
     
@@ -875,16 +1126,12 @@ class SecurityManager:
                     del self.session_tokens[token]
             
             # Check database
-            conn = sqlite3.connect(DATABASE_FILE)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
+            cursor = database.execute('''
                 SELECT user_id, expires_at FROM sessions 
                 WHERE session_token = ? AND is_active = 1
             ''', (token,))
             
             result = cursor.fetchone()
-            conn.close()
             
             if result:
                 user_id, expires_at = result
@@ -905,17 +1152,14 @@ class SecurityManager:
             if token in self.session_tokens:
                 del self.session_tokens[token]
             
-            conn = sqlite3.connect(DATABASE_FILE)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
+            database.execute('''
                 UPDATE sessions SET is_active = 0 WHERE session_token = ?
             ''', (token,))
             
-            conn.commit()
-            conn.close()
+            database.commit()
             
         except Exception as e:
+            database.rollback()
             logger.error(f"Session invalidation error: {e}")
 
 # Enhanced User Management System
@@ -944,10 +1188,7 @@ class UserManager:
             # Hash password
             password_hash, salt = self.security.hash_password(password)
             
-            conn = sqlite3.connect(DATABASE_FILE)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
+            cursor = database.execute('''
                 INSERT INTO users (username, fullname, email, password_hash, salt, is_admin)
                 VALUES (?, ?, ?, ?, ?, ?)
             ''', (username, fullname, email, password_hash, salt, int(is_admin)))
@@ -966,7 +1207,7 @@ class UserManager:
             ]
             
             for i, (name, path, icon, category) in enumerate(default_bookmarks):
-                cursor.execute('''
+                database.execute('''
                     INSERT INTO bookmarks (user_id, name, path, icon, category, order_index)
                     VALUES (?, ?, ?, ?, ?, ?)
                 ''', (user_id, name, path, icon, category, i))
@@ -978,18 +1219,18 @@ class UserManager:
                     pass
             
             # Log user creation
-            cursor.execute('''
+            database.execute('''
                 INSERT INTO system_logs (level, message, component, user_id)
                 VALUES (?, ?, ?, ?)
             ''', ('INFO', f'User created: {username}', 'UserManager', user_id))
             
-            conn.commit()
-            conn.close()
+            database.commit()
             
             logger.info(f"User created successfully: {username}")
             return True, "User created successfully"
             
         except Exception as e:
+            database.rollback()
             logger.error(f"User creation error: {e}")
             return False, f"User creation failed: {str(e)}"
     
@@ -1033,13 +1274,9 @@ class UserManager:
     def user_exists(self, username):
         """Check if user exists"""
         try:
-            conn = sqlite3.connect(DATABASE_FILE)
-            cursor = conn.cursor()
-            
-            cursor.execute('SELECT COUNT(*) FROM users WHERE username = ?', (username,))
+            cursor = database.execute('SELECT COUNT(*) FROM users WHERE username = ?', (username,))
             count = cursor.fetchone()[0]
             
-            conn.close()
             return count > 0
             
         except Exception as e:
@@ -1090,25 +1327,22 @@ class UserManager:
             # Hash new password
             password_hash, salt = self.security.hash_password(new_password)
             
-            conn = sqlite3.connect(DATABASE_FILE)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
+            database.execute('''
                 UPDATE users SET password_hash = ?, salt = ?
                 WHERE id = ?
             ''', (password_hash, salt, self.current_user['id']))
             
-            cursor.execute('''
+            database.execute('''
                 INSERT INTO system_logs (level, message, component, user_id)
                 VALUES (?, ?, ?, ?)
             ''', ('INFO', 'Password changed', 'UserManager', self.current_user['id']))
             
-            conn.commit()
-            conn.close()
+            database.commit()
             
             return True, "Password changed successfully"
             
         except Exception as e:
+            database.rollback()
             logger.error(f"Password change error: {e}")
             return False, f"Password change failed: {str(e)}"
     
@@ -1118,17 +1352,13 @@ class UserManager:
             if not self.is_admin():
                 return []
             
-            conn = sqlite3.connect(DATABASE_FILE)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
+            cursor = database.execute('''
                 SELECT id, username, fullname, email, is_admin, is_active, 
                        created_at, last_login, login_count
                 FROM users ORDER BY username
             ''')
             
             users = cursor.fetchall()
-            conn.close()
             
             return users
             
@@ -1858,11 +2088,8 @@ class InstallationWizard:
             }
             
             # Save themes to database
-            conn = sqlite3.connect(DATABASE_FILE)
-            cursor = conn.cursor()
-            
             for theme_name, theme_data in themes.items():
-                cursor.execute('''
+                database.execute('''
                     INSERT OR REPLACE INTO themes 
                     (name, display_name, author, version, description, theme_data, is_system)
                     VALUES (?, ?, ?, ?, ?, ?, ?)
@@ -1876,8 +2103,7 @@ class InstallationWizard:
                     1
                 ))
             
-            conn.commit()
-            conn.close()
+            database.commit()
             
             # Also save as files
             for theme_name, theme_data in themes.items():
@@ -1888,15 +2114,13 @@ class InstallationWizard:
             return True
                     
         except Exception as e:
+            database.rollback()
             logger.error(f"Theme installation failed: {e}")
             return False
     
     def install_default_applications(self):
         """Install default applications to database"""
         try:
-            conn = sqlite3.connect(DATABASE_FILE)
-            cursor = conn.cursor()
-            
             apps = [
                 ("File Manager", "berke0s_filemanager", "📁", "System", "Advanced file management with multiple views", "1.0", "Berke Oruç"),
                 ("Text Editor", "berke0s_texteditor", "📝", "Office", "Code and text editing with syntax highlighting", "1.0", "Berke Oruç"),
@@ -1926,18 +2150,18 @@ class InstallationWizard:
             ]
             
             for app in apps:
-                cursor.execute('''
+                database.execute('''
                     INSERT OR REPLACE INTO applications 
                     (name, command, icon, category, description, version, author)
                     VALUES (?, ?, ?, ?, ?, ?, ?)
                 ''', app)
             
-            conn.commit()
-            conn.close()
+            database.commit()
             
             return True
             
         except Exception as e:
+            database.rollback()
             logger.error(f"Default applications installation failed: {e}")
             return False
     
@@ -2141,11 +2365,8 @@ class WindowManager:
                 username = self.config["current_user"]
                 
                 # Try to get user info
-                conn = sqlite3.connect(DATABASE_FILE)
-                cursor = conn.cursor()
-                cursor.execute('SELECT id, username, fullname, is_admin FROM users WHERE username = ? AND is_active = 1', (username,))
+                cursor = database.execute('SELECT id, username, fullname, is_admin FROM users WHERE username = ? AND is_active = 1', (username,))
                 user_data = cursor.fetchone()
-                conn.close()
                 
                 if user_data:
                     self.current_user = {
@@ -2249,11 +2470,8 @@ class WindowManager:
         themes = {}
         try:
             # Load from database first
-            conn = sqlite3.connect(DATABASE_FILE)
-            cursor = conn.cursor()
-            cursor.execute('SELECT name, theme_data FROM themes')
+            cursor = database.execute('SELECT name, theme_data FROM themes')
             db_themes = cursor.fetchall()
-            conn.close()
             
             for name, theme_data in db_themes:
                 try:
@@ -2438,11 +2656,7 @@ class WindowManager:
                 self.plugin_manager.cleanup()
             
             # Close database connections
-            try:
-                conn = sqlite3.connect(DATABASE_FILE)
-                conn.close()
-            except:
-                pass
+            database.close()
             
             logger.info("Cleanup completed")
             